@@ -1,8 +1,12 @@
 import argparse
+from datetime import datetime
 from pathlib import Path
 
+from auto_clip_lib.batch import expand_inputs, is_batch, run_batch, unique_stems
+from auto_clip_lib.config import BATCH_WORKERS, OUTPUT_DIR
+from auto_clip_lib.search_cache import cache_search_providers
 from auto_clip_lib.searchers import search_youtube
-from auto_clip_lib.workflow import run_metadata_workflow
+from auto_clip_lib.workflow import run_metadata_workflow, run_streaming_workflow
 
 try:
     from dotenv import load_dotenv
@@ -11,36 +15,129 @@ try:
 except Exception:
     pass
 
+INPUT_SUFFIXES = (".srt", ".docx", ".doc")
+
+
+def _search_providers(offline: bool):
+    search_providers = (
+        # (search_archive_org, "Archive.org"),
+        # (search_cspan, "C-SPAN"),  # Enable once API token is available
+        # (search_nasa, "NASA"),
+        (search_youtube, "YouTube"),
+    )
+    if offline:
+        search_providers = cache_search_providers(search_providers, mode="offline")
+    return search_providers
+
+
+def _process_file(
+    srt_file: Path,
+    *,
+    offline: bool,
+    stream: bool,
+    log_func=print,
+    output_prefix: str | None = None,
+) -> Path:
+    """Run the metadata workflow for one input and return the metadata path."""
+
+    search_providers = _search_providers(offline)
+    if stream:
+        _, _, metadata_path = run_streaming_workflow(
+            str(srt_file),
+            log_func=log_func,
+            search_providers=search_providers,
+            output_prefix=output_prefix,
+        )
+    else:
+        _, _, metadata_path, _ = run_metadata_workflow(
+            str(srt_file),
+            log_func=log_func,
+            search_providers=search_providers,
+            create_trimmed_dir=False,
+            output_prefix=output_prefix,
+        )
+    return metadata_path
+
+
+def _init_batch_worker() -> None:
+    from auto_clip_lib.keywords import warm_up_models
+
+    warm_up_models()
+
+
+def _batch_task(path: str, offline: bool, stream: bool, prefixes: dict[str, str]) -> Path:
+    name = Path(path).name
+
+    def _log(message: str) -> None:
+        print(f"[{name}] {message}", flush=True)
+
+    return _process_file(
+        Path(path),
+        offline=offline,
+        stream=stream,
+        log_func=_log,
+        output_prefix=prefixes[path],
+    )
+
 
 def main():
     parser = argparse.ArgumentParser(
         description="Automate geopolitical video clip metadata generation."
     )
     parser.add_argument(
-        "srt_file", type=str, help="Path to the source SRT or DOCX file."
+        "srt_file",
+        type=str,
+        nargs="+",
+        help="Path to the source SRT or DOCX file. Several files, directories "
+        "or glob patterns run in batch mode.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Answer searches from the local search cache only (no network searches).",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream segments through the pipeline and write them as they finish "
+        "(flat memory on very long inputs).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=BATCH_WORKERS,
+        help=f"Worker processes in batch mode (default: {BATCH_WORKERS}).",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="Batch summary path (defaults to output/batch_<timestamp>.json).",
     )
     args = parser.parse_args()
 
-    srt_file = Path(args.srt_file)
+    if is_batch(args.srt_file):
+        inputs = expand_inputs(args.srt_file, INPUT_SUFFIXES)
+        if not inputs:
+            parser.error("No SRT or DOCX files matched the given inputs.")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        manifest_path = args.manifest or Path(OUTPUT_DIR) / f"batch_{timestamp}.json"
+        print(f"→ Processing {len(inputs)} file(s) with {args.workers} worker(s)...")
+        manifest = run_batch(
+            inputs,
+            _batch_task,
+            task_args=(args.offline, args.stream, unique_stems(inputs)),
+            workers=args.workers,
+            initializer=_init_batch_worker,
+            manifest_path=manifest_path,
+        )
+        if manifest["failed"]:
+            raise SystemExit(1)
+        return
+
+    srt_file = Path(args.srt_file[0])
 
     print(f"→ Parsing input from {srt_file.name}...")
-    search_providers = (
-        # (search_archive_org, "Archive.org"),
-        # (search_cspan, "C-SPAN"),  # Enable once API token is available
-        # (search_nasa, "NASA"),
-        (search_youtube, "YouTube"),
-    )
-    (
-        segments,
-        unique_output_dir,
-        metadata_path,
-        _,
-    ) = run_metadata_workflow(
-        str(srt_file),
-        log_func=print,
-        search_providers=search_providers,
-        create_trimmed_dir=False,
-    )
+    metadata_path = _process_file(srt_file, offline=args.offline, stream=args.stream)
 
     print("→ Metadata-only workflow: skipping clip downloads.")
 
@@ -0,0 +1,182 @@
+"""Run a per-file CLI task over many inputs in a process pool with a manifest."""
+
+from __future__ import annotations
+
+import glob
+import json
+import logging
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable, Sequence
+
+LogFn = Callable[[str], None]
+
+LOGGER = logging.getLogger(__name__)
+
+_GLOB_CHARS = set("*?[")
+
+
+def expand_inputs(patterns: Iterable[str], suffixes: Iterable[str]) -> list[Path]:
+    """Resolve files, directories and glob patterns to a sorted, de-duplicated file list.
+
+    Directories contribute their files (not subdirectories) whose suffix is
+    in ``suffixes``; globs are expanded recursively (``**`` works) and
+    filtered the same way. Plain file arguments are kept as given.
+    """
+
+    suffixes = {suffix.lower() for suffix in suffixes}
+    found: list[Path] = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            candidates = sorted(child for child in path.iterdir() if child.is_file())
+        elif _GLOB_CHARS & set(pattern):
+            candidates = [Path(match) for match in sorted(glob.glob(pattern, recursive=True))]
+            candidates = [match for match in candidates if match.is_file()]
+        else:
+            found.append(path)
+            continue
+        found.extend(match for match in candidates if match.suffix.lower() in suffixes)
+
+    unique: list[Path] = []
+    seen: set[Path] = set()
+    for path in found:
+        key = path.resolve()
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique
+
+
+def is_batch(patterns: Sequence[str]) -> bool:
+    """True unless the CLI was given exactly one plain file path."""
+
+    if len(patterns) != 1:
+        return True
+    return Path(patterns[0]).is_dir() or bool(_GLOB_CHARS & set(patterns[0]))
+
+
+def unique_stems(paths: Iterable[Path]) -> dict[str, str]:
+    """Map each path to its stem, suffixed ``_2``, ``_3``... when stems repeat."""
+
+    counts: dict[str, int] = {}
+    stems = {}
+    for path in paths:
+        count = counts[path.stem] = counts.get(path.stem, 0) + 1
+        stems[str(path)] = path.stem if count == 1 else f"{path.stem}_{count}"
+    return stems
+
+
+def run_batch(
+    inputs: Sequence[Path],
+    task: Callable[..., Any],
+    *,
+    task_args: tuple = (),
+    workers: int | None = None,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+    manifest_path: str | Path,
+    log_func: LogFn | None = print,
+) -> dict:
+    """Run ``task(str(path), *task_args)`` for every input across worker processes.
+
+    ``task`` and ``initializer`` must be module-level functions. Each worker
+    runs ``initializer`` once, so expensive state such as models is loaded
+    once per process rather than once per file; if it fails the worker keeps
+    going and the tasks hit (and record) the same error themselves. A task's return value is
+    recorded as that file's output; an exception marks only that file failed.
+    The manifest (per-file status, output, seconds and error) is written to
+    ``manifest_path`` and returned.
+    """
+
+    def _log(message: str) -> None:
+        if log_func:
+            log_func(message)
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    started_at = datetime.now().isoformat(timespec="seconds")
+    started = time.perf_counter()
+    records: dict[str, dict] = {}
+    with ProcessPoolExecutor(
+        max_workers=min(workers, max(1, len(inputs))),
+        initializer=_init_worker if initializer else None,
+        initargs=(initializer, initargs),
+    ) as pool:
+        futures = {
+            pool.submit(_run_task, task, str(path), task_args): str(path) for path in inputs
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                record = future.result()
+            except Exception as exc:  # the worker itself died (e.g. killed or OOM)
+                record = {
+                    "input": name,
+                    "status": "failed",
+                    "output": None,
+                    "seconds": None,
+                    "error": f"{type(exc).__name__}: {exc}",
+                }
+            records[name] = record
+            if record["status"] == "succeeded":
+                _log(f"✓ {name} ({record['seconds']:.1f}s) → {record['output']}")
+            else:
+                _log(f"✗ {name}: {record['error']}")
+
+    files = [records[str(path)] for path in inputs]
+    failed = sum(1 for record in files if record["status"] != "succeeded")
+    manifest = {
+        "started_at": started_at,
+        "seconds": round(time.perf_counter() - started, 3),
+        "workers": workers,
+        "total": len(files),
+        "succeeded": len(files) - failed,
+        "failed": failed,
+        "files": files,
+    }
+    _write_manifest(Path(manifest_path), manifest)
+    _log(f"→ {len(files) - failed}/{len(files)} file(s) succeeded. Manifest: {manifest_path}")
+    return manifest
+
+
+def _init_worker(initializer: Callable[..., None], initargs: tuple) -> None:
+    # An exception here would break the whole pool, and the manifest would
+    # then record every file as BrokenProcessPool.
+    try:
+        initializer(*initargs)
+    except Exception:
+        LOGGER.warning("Batch worker initializer failed", exc_info=True)
+
+
+def _run_task(task: Callable[..., Any], path: str, task_args: tuple) -> dict:
+    started = time.perf_counter()
+    try:
+        output = task(path, *task_args)
+    except (Exception, SystemExit) as exc:
+        return {
+            "input": path,
+            "status": "failed",
+            "output": None,
+            "seconds": round(time.perf_counter() - started, 3),
+            "error": f"{type(exc).__name__}: {exc}",
+            "traceback": traceback.format_exc(),
+        }
+    return {
+        "input": path,
+        "status": "succeeded",
+        "output": None if output is None else str(output),
+        "seconds": round(time.perf_counter() - started, 3),
+        "error": None,
+    }
+
+
+def _write_manifest(path: Path, manifest: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
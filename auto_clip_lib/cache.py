@@ -0,0 +1,148 @@
+"""SQLite-backed persistent caches shared across runs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .config import CACHE_DIR, CACHE_TOUCH_INTERVAL
+
+_CACHE_DIR = Path(CACHE_DIR)
+_caches: dict[str, "DiskCache"] = {}
+_registry_lock = threading.Lock()
+
+
+def make_key(*parts: Any) -> str:
+    """Return a stable content hash for the given JSON-serializable parts."""
+
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_cache(name: str, max_bytes: int) -> "DiskCache":
+    """Return the process-wide cache stored at ``CACHE_DIR/<name>.sqlite3``."""
+
+    with _registry_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = DiskCache(_CACHE_DIR / f"{name}.sqlite3", max_bytes=max_bytes)
+            _caches[name] = cache
+        return cache
+
+
+class DiskCache:
+    """Key/value store with JSON values and size-based LRU eviction.
+
+    Safe to share between threads; separate processes may point at the same
+    file since SQLite handles the cross-process locking. The total size is
+    tracked in memory (seeded from the file when it is opened), so writes
+    from other processes are only accounted for after a reopen. A hit
+    records its access time at most once per ``touch_interval`` seconds, so
+    reads rarely need the write lock and LRU order is exact only to that
+    granularity.
+    """
+
+    def __init__(
+        self, path: str | Path, max_bytes: int, touch_interval: float = CACHE_TOUCH_INTERVAL
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, "
+            "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)"
+        )
+        (self._total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self.get_entry(key)
+        return default if entry is None else entry[0]
+
+    def get_entry(self, key: str) -> tuple[Any, float] | None:
+        """Return ``(value, stored_at)`` so callers can apply their own TTL."""
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at, accessed_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            now = time.time()
+            if now - row[2] >= self.touch_interval:
+                self._conn.execute(
+                    "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            self.hits += 1
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, value: Any) -> None:
+        payload = json.dumps(value, ensure_ascii=False)
+        size = len(payload.encode("utf-8")) + len(key)
+        now = time.time()
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, payload, size, now, now),
+            )
+            self._total += size - (previous[0] if previous else 0)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._total = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        # Called with self._lock held once the running total is over budget;
+        # walks the accessed_at index only as far as it has to.
+        stale_keys = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+        ):
+            if self._total <= self.max_bytes:
+                break
+            stale_keys.append((key,))
+            self._total -= size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", stale_keys)
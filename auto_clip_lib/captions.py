@@ -2,45 +2,101 @@
 
 from __future__ import annotations
 
-import pysrt
+import threading
+from collections import OrderedDict
+from typing import Iterator
+
 import torch
-from sentence_transformers import SentenceTransformer, util
+from sentence_transformers import SentenceTransformer
+
+from .cache import make_key
+from .config import ALIGN_CACHE_SIZE, ALIGN_TOP_K
+from .srt import iter_srt
+
+ALIGN_MODEL_ID = "all-MiniLM-L6-v2"
 
 _model: SentenceTransformer | None = None
+_embedding_cache: "OrderedDict[str, torch.Tensor]" = OrderedDict()
+_embedding_lock = threading.Lock()
 
 
 def _get_model() -> SentenceTransformer:
     global _model
     if _model is None:
-        _model = SentenceTransformer("all-MiniLM-L6-v2")
+        _model = SentenceTransformer(ALIGN_MODEL_ID)
     return _model
 
 
 def parse_captions(srt_path: str) -> list[dict]:
     try:
-        subs = pysrt.open(srt_path)
+        return list(iter_captions(srt_path))
     except Exception:
         return []
-    segments = []
-    for s in subs:
-        start = s.start.ordinal / 1000
-        end = s.end.ordinal / 1000
-        text = s.text.replace("\n", " ").strip()
+
+
+def iter_captions(srt_path: str) -> Iterator[dict]:
+    """Yield caption segments one cue at a time without loading the whole file."""
+
+    for cue in iter_srt(srt_path):
+        text = cue.text.replace("\n", " ").strip()
         if text:
-            segments.append({"start": start, "end": end, "text": text})
-    return segments
+            yield {"start": cue.start_ms / 1000, "end": cue.end_ms / 1000, "text": text}
 
 
 def find_best_segment(original_text: str, transcript_segments: list[dict]) -> dict | None:
-    if not transcript_segments:
-        return None
+    candidates = align_passages([original_text], transcript_segments, top_k=1)[0]
+    return candidates[0]["segment"] if candidates else None
+
+
+def align_passages(
+    passages: list[str],
+    transcript_segments: list[dict],
+    top_k: int = ALIGN_TOP_K,
+) -> list[list[dict]]:
+    """Rank transcript segments against every passage in one similarity pass.
+
+    The transcript is encoded once and its normalized embeddings are cached
+    by transcript hash, so aligning more passages (now or in later calls)
+    only encodes the passages. All cosine scores come from a single matrix
+    multiply. Returns, per passage, up to ``top_k`` candidates as
+    ``{"index", "score", "segment"}`` dicts, best first.
+    """
+
+    if not passages or not transcript_segments:
+        return [[] for _ in passages]
+
+    transcript_embeddings = _transcript_embeddings(
+        [seg["text"] for seg in transcript_segments]
+    )
+    passage_embeddings = _get_model().encode(
+        passages, convert_to_tensor=True, normalize_embeddings=True
+    )
+    scores = passage_embeddings.to(transcript_embeddings.device) @ transcript_embeddings.T
+    k = max(1, min(top_k, len(transcript_segments)))
+    top_scores, top_indices = torch.topk(scores, k=k, dim=1)
+
+    ranked = []
+    for row_scores, row_indices in zip(top_scores.tolist(), top_indices.tolist()):
+        ranked.append(
+            [
+                {"index": idx, "score": score, "segment": transcript_segments[idx]}
+                for score, idx in zip(row_scores, row_indices)
+            ]
+        )
+    return ranked
 
-    model = _get_model()
-    original_embedding = model.encode(original_text, convert_to_tensor=True)
-    transcript_texts = [seg["text"] for seg in transcript_segments]
-    transcript_embeddings = model.encode(transcript_texts, convert_to_tensor=True)
 
-    cos_scores = util.cos_sim(original_embedding, transcript_embeddings)[0]
-    best_match_idx = torch.argmax(cos_scores).item()
+def _transcript_embeddings(texts: list[str]) -> torch.Tensor:
+    key = make_key(ALIGN_MODEL_ID, texts)
+    with _embedding_lock:
+        cached = _embedding_cache.get(key)
+        if cached is not None:
+            _embedding_cache.move_to_end(key)
+            return cached
 
-    return transcript_segments[best_match_idx]
+    embeddings = _get_model().encode(texts, convert_to_tensor=True, normalize_embeddings=True)
+    with _embedding_lock:
+        _embedding_cache[key] = embeddings
+        while len(_embedding_cache) > ALIGN_CACHE_SIZE:
+            _embedding_cache.popitem(last=False)
+    return embeddings
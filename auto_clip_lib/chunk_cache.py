@@ -0,0 +1,188 @@
+"""Compact, memory-mappable on-disk cache for chunked segments."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Protocol, Sequence
+
+from .config import CHUNK_CACHE, CHUNK_CACHE_BIN
+
+_MAGIC = b"ACCHUNK1"
+# Columns use native byte order: the cache is read back on the machine that wrote it.
+_HEADER = struct.Struct("=8sQQQ")  # magic, chunk count, text bytes, segment index count
+_CHUNK_KEYS = {"text", "start", "end", "segment_indices", "sentence_count"}
+
+
+class ChunkSource(Protocol):
+    def __len__(self) -> int: ...
+
+    def page(self, start: int, end: int) -> list[dict]: ...
+
+    def close(self) -> None: ...
+
+
+def write_chunk_cache(output_dir: Path, chunked: Sequence[dict]) -> Path:
+    """Persist ``chunked`` next to the session output and return the file written.
+
+    Chunks produced by ``chunk_segments`` go to the binary ``CHUNK_CACHE_BIN``
+    layout; anything else (extra keys, non-float times) falls back to the
+    legacy ``CHUNK_CACHE`` JSON so no field is lost.
+    """
+
+    output_dir = Path(output_dir)
+    if not all(_is_standard_chunk(chunk) for chunk in chunked):
+        path = output_dir / CHUNK_CACHE
+        _write_atomic(path, json.dumps(chunked, indent=2, ensure_ascii=False).encode("utf-8"))
+        return path
+
+    starts = array("d", (chunk["start"] for chunk in chunked))
+    ends = array("d", (chunk["end"] for chunk in chunked))
+    sentence_counts = array("I", (chunk["sentence_count"] for chunk in chunked))
+    text_offsets = array("Q", [0])
+    index_offsets = array("Q", [0])
+    segment_indices = array("I")
+    texts = []
+    text_size = 0
+    for chunk in chunked:
+        encoded = chunk["text"].encode("utf-8")
+        texts.append(encoded)
+        text_size += len(encoded)
+        text_offsets.append(text_size)
+        segment_indices.extend(chunk["segment_indices"])
+        index_offsets.append(len(segment_indices))
+
+    arrays = (starts, ends, text_offsets, index_offsets, sentence_counts, segment_indices)
+    header = _HEADER.pack(_MAGIC, len(chunked), text_size, len(segment_indices))
+    payload = b"".join([header, *(values.tobytes() for values in arrays), *texts])
+    path = output_dir / CHUNK_CACHE_BIN
+    _write_atomic(path, payload)
+    return path
+
+
+def open_chunk_cache(output_dir: Path) -> ChunkSource:
+    """Open the session's chunk cache, preferring the binary layout over JSON."""
+
+    output_dir = Path(output_dir)
+    binary_path = output_dir / CHUNK_CACHE_BIN
+    if binary_path.exists():
+        return MappedChunks(binary_path)
+    json_path = output_dir / CHUNK_CACHE
+    if json_path.exists():
+        with json_path.open(encoding="utf-8") as f:
+            return JsonChunks(json.load(f))
+    raise ValueError("Chunked segment cache missing.")
+
+
+class JsonChunks:
+    """Chunk source backed by an in-memory list (legacy JSON caches)."""
+
+    def __init__(self, chunked: list[dict]) -> None:
+        self._chunked = chunked
+
+    def __len__(self) -> int:
+        return len(self._chunked)
+
+    def page(self, start: int, end: int) -> list[dict]:
+        return json.loads(json.dumps(self._chunked[start:end]))
+
+    def close(self) -> None:
+        pass
+
+
+class MappedChunks:
+    """Read pages straight out of a memory-mapped ``CHUNK_CACHE_BIN`` file.
+
+    Only the requested rows are decoded; every call returns fresh dicts, so
+    callers may mutate them without copying.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        with open(path, "rb") as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, count, text_size, index_count = _HEADER.unpack_from(self._mmap, 0)
+            if magic != _MAGIC:
+                raise ValueError(f"Not a chunk cache: {path}")
+            self._count = count
+            view = memoryview(self._mmap)
+            offset = _HEADER.size
+            self._views = [view]
+            self.starts, offset = self._column(view, offset, "d", count)
+            self.ends, offset = self._column(view, offset, "d", count)
+            self._text_offsets, offset = self._column(view, offset, "Q", count + 1)
+            self._index_offsets, offset = self._column(view, offset, "Q", count + 1)
+            self.sentence_counts, offset = self._column(view, offset, "I", count)
+            self._segment_indices, offset = self._column(view, offset, "I", index_count)
+            self._text_base = offset
+            if offset + text_size > len(self._mmap):
+                raise ValueError(f"Truncated chunk cache: {path}")
+        except Exception:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "MappedChunks":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def page(self, start: int, end: int) -> list[dict]:
+        start = max(0, start)
+        end = min(end, self._count)
+        rows = []
+        for idx in range(start, end):
+            text_start = self._text_base + self._text_offsets[idx]
+            text_end = self._text_base + self._text_offsets[idx + 1]
+            rows.append(
+                {
+                    "text": self._mmap[text_start:text_end].decode("utf-8"),
+                    "start": self.starts[idx],
+                    "end": self.ends[idx],
+                    "segment_indices": self._segment_indices[
+                        self._index_offsets[idx] : self._index_offsets[idx + 1]
+                    ].tolist(),
+                    "sentence_count": self.sentence_counts[idx],
+                }
+            )
+        return rows
+
+    def close(self) -> None:
+        for view in reversed(getattr(self, "_views", [])):
+            view.release()
+        self._views = []
+        if not self._mmap.closed:
+            self._mmap.close()
+
+    def _column(
+        self, view: memoryview, offset: int, typecode: str, length: int
+    ) -> tuple[memoryview, int]:
+        size = struct.calcsize(typecode) * length
+        column = view[offset : offset + size].cast(typecode)
+        self._views.append(column)
+        return column, offset + size
+
+
+def _is_standard_chunk(chunk: dict) -> bool:
+    return (
+        set(chunk) == _CHUNK_KEYS
+        and isinstance(chunk["text"], str)
+        and type(chunk["start"]) is float
+        and type(chunk["end"]) is float
+        and type(chunk["sentence_count"]) is int
+        and 0 <= chunk["sentence_count"] < 2**32
+        and all(type(idx) is int and 0 <= idx < 2**32 for idx in chunk["segment_indices"])
+    )
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
@@ -1,11 +1,23 @@
 """Helpers to merge raw caption segments into multi-sentence chunks."""
 
 from __future__ import annotations
-from typing import List, Tuple
+
+import re
+from collections import deque
+from typing import Iterable, Iterator, List, Tuple
 
 SENTENCE_ENDINGS = {".", "?", "!", "…", "。", "?", "!", ";"}
 TRAILING_CHARS = {'"', "'", "”", "’", ")"}
 
+# A sentence ends at an ending char plus any closing quotes/brackets; the
+# whitespace after it is skipped before the next sentence starts.
+_SENTENCE_END = re.compile(
+    "([{}][{}]*)\\s*".format(
+        "".join(map(re.escape, sorted(SENTENCE_ENDINGS))),
+        "".join(map(re.escape, sorted(TRAILING_CHARS))),
+    )
+)
+
 
 def chunk_segments(
     segments: List[dict],
@@ -20,28 +32,51 @@ def chunk_segments(
 
     if not segments:
         return []
+    return list(iter_chunks(segments, min_sentences, max_sentences))
 
-    sentences = _merge_segments_into_sentences(segments)
-    if not sentences:
-        return segments
 
-    sentence_groups: List[List[dict]] = []
-    current_group: List[dict] = []
+def iter_chunks(
+    segments: Iterable[dict],
+    min_sentences: int = 2,
+    max_sentences: int = 3,
+) -> Iterator[dict]:
+    """Streaming ``chunk_segments``: yield chunks while segments are still arriving.
 
-    for sentence in sentences:
+    Only the unfinished sentence and the last full group are buffered (the
+    final short group may still be merged into it), so memory stays flat on
+    long inputs. If no sentence forms at all, the segments are yielded as-is.
+    """
+
+    raw: list[dict] | None = []
+
+    def _tap(source: Iterable[dict]) -> Iterator[dict]:
+        for seg in source:
+            if raw is not None:
+                raw.append(seg)
+            yield seg
+
+    held: List[dict] | None = None
+    current_group: List[dict] = []
+    for sentence in _iter_sentences(_tap(segments)):
+        raw = None
         current_group.append(sentence)
         if len(current_group) >= max_sentences:
-            sentence_groups.append(current_group)
-            current_group = []
+            if held is not None:
+                yield _merge_sentence_group(held)
+            held, current_group = current_group, []
 
+    if raw is not None:
+        yield from raw
+        return
     if current_group:
-        if len(current_group) < min_sentences and sentence_groups:
-            sentence_groups[-1].extend(current_group)
+        if len(current_group) < min_sentences and held is not None:
+            held.extend(current_group)
         else:
-            sentence_groups.append(current_group)
-
-    chunked = [_merge_sentence_group(group) for group in sentence_groups]
-    return chunked
+            if held is not None:
+                yield _merge_sentence_group(held)
+            held = current_group
+    if held is not None:
+        yield _merge_sentence_group(held)
 
 
 def _merge_sentence_group(group: List[dict]) -> dict:
@@ -60,82 +95,67 @@ def _merge_sentence_group(group: List[dict]) -> dict:
     }
 
 
-def _merge_segments_into_sentences(segments: List[dict]) -> List[dict]:
-    full_text, spans = _build_full_text_with_spans(segments)
-    if not full_text:
-        return []
+def _iter_sentences(segments: Iterable[dict]) -> Iterator[dict]:
+    """Split the space-joined segment text into sentences in one forward sweep.
+
+    Offsets are positions in the virtual full text (normalized segment texts
+    joined by single spaces), which is never built: ``spans`` holds the texts
+    of the segments overlapping the unfinished sentence and each new text is
+    scanned on its own. A match cannot cross the joining space, so scanning
+    resumes at the new text instead of rescanning the unfinished sentence,
+    which keeps unpunctuated captions linear.
+    """
+
+    cursor = 0  # full-text length so far
+    sentence_start = 0
+    spans: deque[Tuple[int, int, int, dict, str]] = deque()
 
-    sentences: List[dict] = []
-    for start_char, end_char in _iterate_sentence_ranges(full_text):
-        snippet = full_text[start_char:end_char].strip()
-        if not snippet:
-            continue
-        segment_indices = _locate_segments(spans, start_char, end_char)
-        if not segment_indices:
-            continue
-        start = segments[segment_indices[0]]["start"]
-        end = segments[segment_indices[-1]]["end"]
-        sentences.append(
-            {
-                "text": snippet,
-                "start": start,
-                "end": end,
-                "segment_indices": segment_indices,
-            }
-        )
-
-    return sentences
-
-
-def _build_full_text_with_spans(segments: List[dict]) -> Tuple[str, List[Tuple[int, int, int]]]:
-    parts: List[str] = []
-    spans: List[Tuple[int, int, int]] = []
-    cursor = 0
     for idx, seg in enumerate(segments):
         text = " ".join((seg.get("text") or "").split())
         if not text:
             continue
-        if parts:
-            parts.append(" ")
+        if cursor:
             cursor += 1
-        start = cursor
-        parts.append(text)
+            if sentence_start == cursor - 1:
+                sentence_start = cursor  # skip the joining space
+        text_start = cursor
         cursor += len(text)
-        spans.append((start, cursor, idx))
-    return "".join(parts), spans
-
-
-def _iterate_sentence_ranges(text: str) -> List[Tuple[int, int]]:
-    ranges: List[Tuple[int, int]] = []
-    start = 0
-    i = 0
-    length = len(text)
-    while i < length:
-        ch = text[i]
-        if ch in SENTENCE_ENDINGS:
-            end = i + 1
-            while end < length and text[end] in TRAILING_CHARS:
-                end += 1
-            ranges.append((start, end))
-            while end < length and text[end].isspace():
-                end += 1
-            start = end
-            i = end
-        else:
-            i += 1
-    if start < length:
-        ranges.append((start, length))
-    return ranges
-
-
-def _locate_segments(
-    spans: List[Tuple[int, int, int]], start_char: int, end_char: int
-) -> List[int]:
-    indices: List[int] = []
-    for seg_start, seg_end, idx in spans:
+        spans.append((text_start, cursor, idx, seg, text))
+
+        for match in _SENTENCE_END.finditer(text, sentence_start - text_start):
+            sentence = _make_sentence(sentence_start, text_start + match.end(1), spans)
+            if sentence is not None:
+                yield sentence
+            sentence_start = text_start + match.end()
+        while spans and spans[0][1] <= sentence_start:
+            spans.popleft()
+
+    if sentence_start < cursor:
+        sentence = _make_sentence(sentence_start, cursor, spans)
+        if sentence is not None:
+            yield sentence
+
+
+def _make_sentence(
+    start_char: int,
+    end_char: int,
+    spans: Iterable[Tuple[int, int, int, dict, str]],
+) -> dict | None:
+    covered = []
+    pieces = []
+    for seg_start, seg_end, idx, seg, text in spans:
         if seg_end <= start_char:
             continue
         if seg_start >= end_char:
             break
-        indices.append(idx)
-    return indices
+        covered.append((idx, seg))
+        pieces.append(text[max(0, start_char - seg_start) : end_char - seg_start])
+    snippet = " ".join(pieces).strip()
+    if not snippet or not covered:
+        return None
+    return {
+        "text": snippet,
+        "start": covered[0][1]["start"],
+        "end": covered[-1][1]["end"],
+        "segment_indices": [idx for idx, _ in covered],
+    }
@@ -8,4 +8,57 @@ CLIP_BUFFER = 1.5  # seconds extra for editors
 TRANSCRIPT_SOURCES = {"archive.org", "c-span", "youtube"}
 DIRECT_DOWNLOAD_EXTS = (".mp4", ".mov", ".m4v")
 NO_SEARCH_RESULT = "{search_source} returns no result for {keywords}"
-CHUNK_CACHE = "chunked_segments.json"
+CHUNK_CACHE = "chunked_segments.json"  # legacy JSON chunk cache, still readable
+CHUNK_CACHE_BIN = "chunked_segments.bin"  # columnar, memory-mapped chunk cache
+PREFETCH_CACHE = "prefetched_page.json"  # next page staged beside CHUNK_CACHE
+SEGMENT_STORE = "segments.jsonl"  # append-only per-session segment store
+SEGMENT_INDEX = "segments.idx"  # byte offsets into SEGMENT_STORE
+KEYWORD_CONCURRENCY = 4  # in-flight LLM keyword requests per extract_keywords call
+KEYWORD_BATCH_SIZE = 1  # segments per LLM prompt; >1 sends multi-segment batched prompts
+CACHE_DIR = f"{OUTPUT_DIR}/cache"  # persistent SQLite caches shared across runs
+CACHE_TOUCH_INTERVAL = 300  # seconds before a cache hit refreshes its LRU access time again
+KEYWORD_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 0 disables the keyword cache
+TRANSLATION_BATCH_SIZE = 32  # Han keywords per padded small100 generate() call
+TRANSLATION_CACHE_MAX_BYTES = 8 * 1024 * 1024  # 0 keeps translations in memory only
+LLM_BREAKER_FAILURE_THRESHOLD = 3  # consecutive DashScope failures before skipping the LLM
+LLM_BREAKER_COOLDOWN = 60.0  # seconds before a half-open probe retries DashScope
+YOUTUBE_SEARCH_BACKEND = "api"  # "api" (in-process yt_dlp) or "subprocess" (yt-dlp CLI)
+YTDLP_POOL_SIZE = 4  # long-lived YoutubeDL instances shared by in-process searches
+SEARCH_CONCURRENCY = 6  # searches in flight across all segments/providers
+PROVIDER_CONCURRENCY = {"YouTube": 4}  # per-provider caps, keyed by provider label
+DEFAULT_PROVIDER_CONCURRENCY = 2  # cap for providers missing from PROVIDER_CONCURRENCY
+SEARCH_SPECULATIVE = False  # launch all query candidates per provider at once
+SEARCH_MEMO_SIZE = 2048  # finished searches a run keeps for later duplicates (LRU; bounds stream memory)
+SEARCH_CACHE_MODE = "on"  # "on", "off", or "offline" (serve cached hits only, never search)
+SEARCH_CACHE_MAX_BYTES = 32 * 1024 * 1024
+SEARCH_CACHE_TTL = {  # seconds a cached search stays fresh, keyed by provider label
+    "YouTube": 3 * 24 * 3600,
+    "Archive.org": 14 * 24 * 3600,
+    "C-SPAN": 24 * 3600,
+    "NASA": 14 * 24 * 3600,
+}
+DEFAULT_SEARCH_CACHE_TTL = 24 * 3600
+SEARCH_CACHE_STALE = 7 * 24 * 3600  # past the TTL, serve stale hits while refreshing
+SEARCH_REFRESH_WORKERS = 2  # background refreshes of stale search hits running at once
+SEARCH_REFRESH_QUEUE = 256  # stale keys waiting for a refresh; further stale hits skip refreshing
+NASA_ASSET_WORKERS = 6  # concurrent NASA asset lookups per search
+NASA_SEARCH_DEADLINE = 15.0  # seconds allowed for one NASA search incl. asset lookups
+HTTP_TIMEOUT = 10  # default seconds for pooled HTTP requests
+HTTP_RETRIES = 2  # retries for idempotent requests on connection errors/5xx/429
+HTTP_BACKOFF = 0.5  # exponential backoff factor between retries
+HTTP_POOL_MAXSIZE = 10  # keep-alive connections per host
+SECTION_DOWNLOADS = True  # fetch only the trimmed range (+ CLIP_BUFFER) when the source allows it
+BULK_DOWNLOAD_WORKERS = 4  # concurrent transfers for /download-all
+BULK_DOWNLOADS_PER_HOST = 2  # concurrent transfers against a single host
+BULK_TRIM_WORKERS = None  # ffmpeg trims run in parallel; None means os.cpu_count()
+JOB_DIR = f"{OUTPUT_DIR}/jobs"  # persisted background job state (one JSON file per job)
+JOB_WORKERS = 2  # background jobs running at once in the web app
+JOB_TTL = 30 * 60  # seconds a finished job stays in memory; afterwards it is served from disk
+PREFETCH_MAX_SESSIONS = 2  # paginated sessions allowed to prefetch their next page at once
+PREFETCH_IDLE_TIMEOUT = 15 * 60  # seconds without a request before a session counts as abandoned
+PREFETCH_TAKE_TIMEOUT = 30.0  # seconds "continue" waits for an in-flight prefetch before doing the page itself
+STREAM_BATCH_SIZE = 8  # chunks per keyword/search batch in the streaming pipeline
+STREAM_BUFFER = 2  # batches buffered between streaming stages (bounds memory)
+BATCH_WORKERS = 2  # processes for auto_clip.py directory/glob runs; each loads its own models
+ALIGN_TOP_K = 5  # ranked transcript candidates returned per passage by align_passages
+ALIGN_CACHE_SIZE = 8  # transcripts whose segment embeddings stay cached in memory
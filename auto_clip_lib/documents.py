@@ -5,7 +5,7 @@ from __future__ import annotations
 import re
 import zipfile
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 from xml.etree import ElementTree as ET
 
 DOCX_MAIN = "word/document.xml"
@@ -22,9 +22,22 @@ WHITESPACE_REGEX = re.compile(r"\s+")
 def parse_document(doc_path: str | Path) -> list[dict]:
     """Return caption-like segments from a DOCX file, preserving paragraph order."""
 
+    try:
+        return list(iter_document(doc_path))
+    except ET.ParseError:
+        return []
+
+
+def iter_document(doc_path: str | Path) -> Iterator[dict]:
+    """Yield DOCX segments paragraph by paragraph while the XML is still being read.
+
+    Raises ``ElementTree.ParseError`` if the document XML turns out to be
+    malformed partway through.
+    """
+
     path = Path(doc_path)
     if not path.exists():
-        return []
+        return
 
     suffix = path.suffix.lower()
     if suffix == ".doc":
@@ -32,42 +45,54 @@ def parse_document(doc_path: str | Path) -> list[dict]:
     if suffix != ".docx":
         raise ValueError(f"Unsupported document type: {suffix or 'unknown'}")
 
-    segments: list[dict] = []
-    for idx, paragraph in enumerate(_load_docx_paragraphs(path)):
+    segment_idx = 0
+    for idx, paragraph in enumerate(_iter_docx_paragraphs(path)):
         text = _normalize_text(paragraph)
         if not text:
             continue
-        segment_idx = len(segments)
-        segments.append(
-            {
-                "start": float(segment_idx),
-                "end": float(segment_idx + 1),
-                "text": text,
-                "paragraph_index": idx,
-                "has_chinese": bool(HAN_REGEX.search(text)),
-            }
-        )
-    return segments
-
-
-def _load_docx_paragraphs(path: Path) -> List[str]:
-    try:
-        with zipfile.ZipFile(path) as doc:
-            xml_bytes = doc.read(DOCX_MAIN)
-    except (FileNotFoundError, zipfile.BadZipFile, KeyError):
-        return []
+        yield {
+            "start": float(segment_idx),
+            "end": float(segment_idx + 1),
+            "text": text,
+            "paragraph_index": idx,
+            "has_chinese": bool(HAN_REGEX.search(text)),
+        }
+        segment_idx += 1
 
-    try:
-        root = ET.fromstring(xml_bytes)
-    except ET.ParseError:
-        return []
 
-    paragraphs: List[str] = []
-    for paragraph in root.iter(f"{WORD_NS}p"):
-        text = _extract_paragraph_text(paragraph)
-        if text:
-            paragraphs.append(text)
-    return paragraphs
+def _iter_docx_paragraphs(path: Path) -> Iterator[str]:
+    try:
+        doc = zipfile.ZipFile(path)
+        xml_file = doc.open(DOCX_MAIN)
+    except (FileNotFoundError, zipfile.BadZipFile, KeyError):
+        return
+
+    # Paragraphs can nest (e.g. text boxes); emit them in document (start-tag)
+    # order like ``root.iter`` would, once the outermost one has closed.
+    paragraph_tag = f"{WORD_NS}p"
+    open_paragraphs = 0
+    finished: list[tuple[int, str]] = []
+    started = 0
+    order: list[int] = []
+    with doc, xml_file:
+        for event, node in ET.iterparse(xml_file, events=("start", "end")):
+            if node.tag != paragraph_tag:
+                continue
+            if event == "start":
+                order.append(started)
+                started += 1
+                open_paragraphs += 1
+                continue
+            open_paragraphs -= 1
+            text = _extract_paragraph_text(node)
+            finished.append((order.pop(), text))
+            if open_paragraphs:
+                continue
+            for _, paragraph_text in sorted(finished):
+                if paragraph_text:
+                    yield paragraph_text
+            finished.clear()
+            node.clear()
 
 
 def _extract_paragraph_text(paragraph: ET.Element) -> str:
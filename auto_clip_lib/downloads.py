@@ -0,0 +1,206 @@
+"""Download-and-trim helpers for single clips and bulk requests."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from .config import (
+    BULK_DOWNLOAD_WORKERS,
+    BULK_DOWNLOADS_PER_HOST,
+    BULK_TRIM_WORKERS,
+    SECTION_DOWNLOADS,
+)
+from .media import download_section, download_video, trim_clip
+from .scheduler import SingleFlight
+from .utils import sanitize_id
+
+LOGGER = logging.getLogger(__name__)
+
+DownloadOutcome = Tuple[Path, bool]
+
+
+def clip_path_for(result: dict, start: float, end: float, clip_dir: Path) -> Path:
+    clip_name = (
+        f"{sanitize_id(result.get('id') or result.get('title') or 'clip')}_"
+        f"{start:.2f}_{end:.2f}.mp4"
+    )
+    return clip_dir / clip_name
+
+
+def download_clip(
+    result: dict,
+    output_dir: Path,
+    start_time: float | None,
+    end_time: float | None,
+    *,
+    trimmed_dir: Path | None = None,
+) -> DownloadOutcome:
+    """Download a video and optionally trim it based on start/end times.
+
+    When both times are given, only that section is fetched if the source
+    supports it; otherwise the full video is downloaded and trimmed locally.
+    Returns the saved path and whether it is a trimmed clip.
+    """
+
+    clip_path = _prepare_clip_path(result, output_dir, start_time, end_time, trimmed_dir)
+    if clip_path is not None and _try_section(result, start_time, end_time, clip_path):
+        return clip_path, True
+
+    saved_path = _download_full(result, output_dir)
+    if clip_path is None:
+        return saved_path, False
+    trim_clip(str(saved_path), start_time, end_time, str(clip_path))
+    return clip_path, True
+
+
+def download_many(
+    items: Sequence[tuple[dict, float | None, float | None]],
+    output_dir: Path,
+    *,
+    trimmed_dir: Path | None = None,
+    max_workers: int = BULK_DOWNLOAD_WORKERS,
+    per_host: int = BULK_DOWNLOADS_PER_HOST,
+    trim_workers: int | None = BULK_TRIM_WORKERS,
+    on_done: Callable[[int, DownloadOutcome | Exception], None] | None = None,
+) -> list[DownloadOutcome | Exception]:
+    """Download (and trim) many ``(result, start, end)`` items concurrently.
+
+    Network work runs on a pool of ``max_workers`` threads with at most
+    ``per_host`` transfers per host; identical URLs are downloaded once and
+    identical sections fetched once. ffmpeg trims run on a separate pool so
+    they overlap with downloads still in flight. The returned list is aligned
+    with ``items``: a ``(path, trimmed)`` tuple or the exception that item hit.
+    ``on_done(index, outcome)`` is called as each item settles.
+    """
+
+    host_slots: dict[str, threading.BoundedSemaphore] = {}
+    slots_lock = threading.Lock()
+    flights = SingleFlight()
+
+    def _host_slot(result: dict) -> threading.BoundedSemaphore:
+        url = result.get("download_url") or result.get("url") or ""
+        host = urlsplit(url).netloc.lower()
+        with slots_lock:
+            slot = host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(max(1, per_host))
+                host_slots[host] = slot
+            return slot
+
+    def _fetch(
+        result: dict, start: float | None, end: float | None
+    ) -> tuple[DownloadOutcome | None, Path, Path | None]:
+        """Return ``(finished outcome or None, saved path, clip still to trim)``."""
+
+        clip_path = _prepare_clip_path(result, output_dir, start, end, trimmed_dir)
+        if clip_path is not None:
+            def _section() -> bool:
+                with _host_slot(result):
+                    return _try_section(result, start, end, clip_path)
+
+            if flights.do(("section", str(clip_path)), _section):
+                return (clip_path, True), clip_path, None
+
+        def _full() -> Path:
+            with _host_slot(result):
+                return _download_full(result, output_dir)
+
+        url = result.get("download_url") or result.get("url")
+        saved_path = flights.do(("full", url), _full)
+        if clip_path is None:
+            return (saved_path, False), saved_path, None
+        return None, saved_path, clip_path
+
+    outcomes: list[DownloadOutcome | Exception | None] = [None] * len(items)
+
+    def _settle(idx: int, outcome: DownloadOutcome | Exception) -> None:
+        outcomes[idx] = outcome
+        if on_done:
+            on_done(idx, outcome)
+    network = ThreadPoolExecutor(
+        max_workers=max(1, max_workers), thread_name_prefix="download"
+    )
+    trims = ThreadPoolExecutor(
+        max_workers=trim_workers or os.cpu_count() or 2, thread_name_prefix="trim"
+    )
+    try:
+        fetches = {
+            network.submit(_fetch, result, start, end): idx
+            for idx, (result, start, end) in enumerate(items)
+        }
+        trim_jobs: dict[str, Future] = {}
+        pending_trims: dict[Future, list[int]] = {}
+        for future in as_completed(fetches):
+            idx = fetches[future]
+            try:
+                finished, saved_path, clip_path = future.result()
+            except Exception as exc:
+                _settle(idx, exc)
+                continue
+            if finished is not None:
+                _settle(idx, finished)
+                continue
+            trim_future = trim_jobs.get(str(clip_path))
+            if trim_future is None:
+                _, start, end = items[idx]
+                trim_future = trims.submit(_trim_to, saved_path, start, end, clip_path)
+                trim_jobs[str(clip_path)] = trim_future
+            pending_trims.setdefault(trim_future, []).append(idx)
+
+        for trim_future in as_completed(pending_trims):
+            try:
+                outcome = trim_future.result()
+            except Exception as exc:
+                outcome = exc
+            for idx in pending_trims[trim_future]:
+                _settle(idx, outcome)
+    finally:
+        network.shutdown(wait=True)
+        trims.shutdown(wait=True)
+    return outcomes
+
+
+def _prepare_clip_path(
+    result: dict,
+    output_dir: Path,
+    start_time: float | None,
+    end_time: float | None,
+    trimmed_dir: Path | None,
+) -> Path | None:
+    if start_time is None or end_time is None:
+        return None
+    if end_time <= start_time:
+        raise ValueError("End time must be greater than start time.")
+    clip_dir = trimmed_dir or (output_dir / "trimmed")
+    clip_dir.mkdir(exist_ok=True)
+    return clip_path_for(result, start_time, end_time, clip_dir)
+
+
+def _try_section(result: dict, start: float, end: float, clip_path: Path) -> bool:
+    if not SECTION_DOWNLOADS:
+        return False
+    if download_section(result, start, end, str(clip_path)):
+        return True
+    LOGGER.info(
+        "Section download unavailable for %s; falling back to full download.",
+        result.get("url"),
+    )
+    return False
+
+
+def _download_full(result: dict, output_dir: Path) -> Path:
+    video_path_str = download_video(result, str(output_dir))
+    if not video_path_str:
+        raise RuntimeError("Video download failed.")
+    return Path(video_path_str)
+
+
+def _trim_to(saved_path: Path, start: float, end: float, clip_path: Path) -> DownloadOutcome:
+    trim_clip(str(saved_path), start, end, str(clip_path))
+    return clip_path, True
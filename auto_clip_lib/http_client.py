@@ -0,0 +1,96 @@
+"""Shared HTTP sessions with per-host keep-alive pools, retries and timeouts."""
+
+from __future__ import annotations
+
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import HTTP_BACKOFF, HTTP_POOL_MAXSIZE, HTTP_RETRIES, HTTP_TIMEOUT
+
+_sessions: dict[str, requests.Session] = {}
+_registry_lock = threading.Lock()
+
+
+def get_session(url: str) -> requests.Session:
+    """Return the process-wide session for ``url``'s scheme and host.
+
+    Each host gets its own session so connection pools (``HTTP_POOL_MAXSIZE``
+    keep-alive connections) and retry state are not shared between providers.
+    """
+
+    origin = _origin(url)
+    with _registry_lock:
+        session = _sessions.get(origin)
+        if session is None:
+            session = _build_session()
+            _sessions[origin] = session
+        return session
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """``requests.get`` through the pooled session, with ``HTTP_TIMEOUT`` by default."""
+
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    return get_session(url).get(url, **kwargs)
+
+
+def pool_stats() -> dict[str, dict]:
+    """Per-host connection-pool usage: requests served vs. connections opened."""
+
+    with _registry_lock:
+        sessions = dict(_sessions)
+    stats = {}
+    for origin, session in sessions.items():
+        requests_served = connections_opened = 0
+        # The same adapter is mounted for http:// and https://.
+        adapters = {id(adapter): adapter for adapter in session.adapters.values()}
+        for adapter in adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                requests_served += pool.num_requests
+                connections_opened += pool.num_connections
+        stats[origin] = {
+            "requests": requests_served,
+            "connections_opened": connections_opened,
+            "max_pool_size": HTTP_POOL_MAXSIZE,
+        }
+    return stats
+
+
+def close_sessions() -> None:
+    with _registry_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    if not parts.netloc:
+        raise ValueError(f"URL has no host: {url!r}")
+    return f"{parts.scheme or 'https'}://{parts.netloc.lower()}"
@@ -0,0 +1,290 @@
+"""Background job queue with on-disk state for long-running web workflows."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from .config import JOB_DIR, JOB_TTL, JOB_WORKERS
+
+LOGGER = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED = (SUCCEEDED, FAILED)
+
+
+class JobContext:
+    """Handle passed to a job function for reporting logs, progress and segments."""
+
+    def __init__(self, manager: "JobManager", job_id: str) -> None:
+        self._manager = manager
+        self.job_id = job_id
+
+    def log(self, message: str) -> None:
+        self._manager._update(self.job_id, "log", {"message": message}, log=message)
+
+    def progress(self, done: int, total: int | None = None) -> None:
+        progress = {"done": done, "total": total}
+        self._manager._update(self.job_id, "progress", progress, progress=progress)
+
+    def segment(self, index: int, segment: dict) -> None:
+        """Publish one enriched segment as soon as it is ready."""
+
+        item = {"index": index, "segment": segment}
+        self._manager._update(self.job_id, "segment", item, segment=item)
+
+
+class JobManager:
+    """Run jobs on a local thread pool and persist their state as JSON files.
+
+    Each job's state (status, progress, log lines, streamed segments, result or
+    error) is written atomically to ``state_dir/<job_id>.json`` whenever its
+    status changes; log, progress and segment events in between are appended
+    to ``state_dir/<job_id>.events.jsonl``, which is folded into the final
+    state file and removed when the job finishes. Either way the job can
+    still be polled after a restart; jobs that were queued or running when
+    the previous process died are reported as failed. Finished jobs are
+    dropped from memory ``ttl`` seconds after they finish and served from
+    disk from then on. Live subscribers follow a job through ``events``.
+    """
+
+    def __init__(
+        self,
+        state_dir: str | Path = JOB_DIR,
+        max_workers: int = JOB_WORKERS,
+        ttl: float = JOB_TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        # Created on the first write, so constructing a manager touches no files.
+        self.state_dir = Path(state_dir)
+        self.ttl = ttl
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="job"
+        )
+        self._jobs: dict[str, dict] = {}
+        self._events: dict[str, list[dict]] = {}
+        # Disk writes for one job are serialised by its own lock, outside _cond.
+        self._file_locks: dict[str, threading.Lock] = {}
+        self._cond = threading.Condition()
+
+    def submit(self, kind: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
+        """Queue ``fn(context, *args, **kwargs)``; its return value is the job result."""
+
+        job_id = uuid.uuid4().hex
+        now = self._clock()
+        state = {
+            "id": job_id,
+            "kind": kind,
+            "status": QUEUED,
+            "progress": {"done": 0, "total": None},
+            "messages": [],
+            "segments": [],
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        with self._cond:
+            self._evict_expired(now)
+            self._jobs[job_id] = state
+            self._events[job_id] = []
+            self._file_locks[job_id] = threading.Lock()
+            self._write_state(job_id, _dumps(state))
+        self._executor.submit(self._run, job_id, fn, args, kwargs)
+        return job_id
+
+    def get(self, job_id: str) -> dict | None:
+        """Return a snapshot of the job state, loading it from disk if needed."""
+
+        with self._cond:
+            state = self._jobs.get(job_id)
+            if state is not None:
+                return json.loads(json.dumps(state))
+        return self._load(job_id)
+
+    def events(
+        self, job_id: str, after: int = 0, heartbeat: float = 15.0
+    ) -> Iterator[dict | None]:
+        """Yield events with ``seq > after`` until the job finishes.
+
+        ``None`` is yielded whenever ``heartbeat`` seconds pass without news so
+        streaming responses can keep the connection alive.
+        """
+
+        with self._cond:
+            known = job_id in self._jobs
+        if not known:
+            state = self._load(job_id)
+            if state is not None:
+                yield {"seq": 1, "type": state["status"], "data": _final_payload(state)}
+            return
+
+        while True:
+            with self._cond:
+                pending, finished = self._pending(job_id, after)
+                if not pending and not finished:
+                    self._cond.wait(timeout=heartbeat)
+                    pending, finished = self._pending(job_id, after)
+            for event in pending:
+                after = event["seq"]
+                yield event
+            if finished and not pending:
+                return
+            if not pending:
+                yield None
+
+    def _pending(self, job_id: str, after: int) -> tuple[list[dict], bool]:
+        # Called with self._cond held. An evicted job has finished by definition.
+        state = self._jobs.get(job_id)
+        events = self._events.get(job_id, [])
+        pending = [event for event in events if event["seq"] > after]
+        return pending, state is None or state["status"] in FINISHED
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job_id: str, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        self._update(job_id, RUNNING, {}, status=RUNNING)
+        try:
+            result = fn(JobContext(self, job_id), *args, **kwargs)
+        except Exception as exc:
+            LOGGER.exception("Job %s failed", job_id)
+            self._update(job_id, FAILED, {"error": str(exc)}, status=FAILED, error=str(exc))
+            return
+        self._update(
+            job_id, SUCCEEDED, {"result": result}, status=SUCCEEDED, result=result
+        )
+
+    def _update(
+        self,
+        job_id: str,
+        event_type: str,
+        data: dict,
+        *,
+        status: str | None = None,
+        log: str | None = None,
+        progress: dict | None = None,
+        segment: dict | None = None,
+        result: Any = None,
+        error: str | None = None,
+    ) -> None:
+        with self._cond:
+            state = self._jobs[job_id]
+            file_lock = self._file_locks[job_id]
+            if status is not None:
+                state["status"] = status
+            if log is not None:
+                state["messages"].append(log)
+            if progress is not None:
+                state["progress"] = progress
+            if segment is not None:
+                state["segments"].append(segment)
+                state["progress"] = {
+                    "done": len(state["segments"]),
+                    "total": state["progress"].get("total"),
+                }
+            if result is not None:
+                state["result"] = result
+            if error is not None:
+                state["error"] = error
+            state["updated_at"] = self._clock()
+            events = self._events[job_id]
+            event = {"seq": len(events) + 1, "type": event_type, "data": data}
+            events.append(event)
+            if status is not None:
+                # Status changes are rare, so the snapshot is written before
+                # subscribers are woken: a finished job is already on disk.
+                with file_lock:
+                    self._write_state(job_id, _dumps(state))
+                    if status in FINISHED:
+                        self._events_path(job_id).unlink(missing_ok=True)
+            self._cond.notify_all()
+        if status is None:
+            # Logs, progress and segments are one appended line each, written
+            # after the shared lock is released.
+            with file_lock:
+                with self._events_path(job_id).open("a", encoding="utf-8") as fh:
+                    fh.write(_dumps(event) + "\n")
+
+    def _evict_expired(self, now: float) -> None:
+        # Called with self._cond held.
+        expired = [
+            job_id
+            for job_id, state in self._jobs.items()
+            if state["status"] in FINISHED and now - state["updated_at"] > self.ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+            del self._events[job_id]
+            del self._file_locks[job_id]
+
+    def _events_path(self, job_id: str) -> Path:
+        return self.state_dir / f"{job_id}.events.jsonl"
+
+    def _write_state(self, job_id: str, snapshot: str) -> None:
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        path = self.state_dir / f"{job_id}.json"
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_text(snapshot, encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _load(self, job_id: str) -> dict | None:
+        if not job_id.isalnum():
+            return None
+        path = self.state_dir / f"{job_id}.json"
+        if not path.exists():
+            return None
+        with path.open(encoding="utf-8") as fh:
+            state = json.load(fh)
+        events_path = self._events_path(job_id)
+        if events_path.exists():
+            _replay_events(state, events_path)
+        if state.get("status") not in FINISHED:
+            state["status"] = FAILED
+            state["error"] = "Job was interrupted before it finished."
+        return state
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _replay_events(state: dict, events_path: Path) -> None:
+    """Fold the events logged since the last state snapshot back into ``state``."""
+
+    events = []
+    with events_path.open(encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                events.append(json.loads(line))
+            except ValueError:  # torn final line from a crash mid-write
+                break
+    state.setdefault("messages", [])
+    state.setdefault("segments", [])
+    for event in sorted(events, key=lambda event: event["seq"]):
+        data = event["data"]
+        if event["type"] == "log":
+            state["messages"].append(data["message"])
+        elif event["type"] == "progress":
+            state["progress"] = data
+        elif event["type"] == "segment":
+            state["segments"].append(data)
+            total = (state.get("progress") or {}).get("total")
+            state["progress"] = {"done": len(state["segments"]), "total": total}
+
+
+def _final_payload(state: dict) -> dict:
+    if state["status"] == SUCCEEDED:
+        return {"result": state["result"]}
+    return {"error": state.get("error")}
@@ -2,6 +2,9 @@
 
 import logging
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable, List, Tuple
 
 import jieba
@@ -10,59 +13,285 @@ from keybert import KeyBERT
 from sentence_transformers import SentenceTransformer
 from sklearn.feature_extraction.text import CountVectorizer
 
-from qwen_helper import fetch_qwen_keywords
+from qwen_helper import (
+    DASHSCOPE_MODEL,
+    PROMPT_VERSION,
+    fetch_qwen_keywords,
+    fetch_qwen_keywords_batch,
+)
+
+from .cache import DiskCache, get_cache, make_key
+from .config import (
+    KEYWORD_BATCH_SIZE,
+    KEYWORD_CACHE_MAX_BYTES,
+    KEYWORD_CONCURRENCY,
+    LLM_BREAKER_COOLDOWN,
+    LLM_BREAKER_FAILURE_THRESHOLD,
+    TRANSLATION_BATCH_SIZE,
+    TRANSLATION_CACHE_MAX_BYTES,
+)
+from .resilience import CircuitBreaker, get_breaker
 
 LOGGER = logging.getLogger(__name__)
 
 HAN_REGEX = re.compile(r"[\u4E00-\u9FFF]")
+KEYBERT_MODEL_ID = "sentence-transformers/paraphrase-multilingual-mpnet-base-v2"
+TRANSLATOR_MODEL_ID = "alirezamsh/small100"
+MAX_KEYWORDS = 5
+TRANSLATION_MEMO_SIZE = 4096
 
 _kw_model: KeyBERT | None = None
 _translator_bundle: Tuple | None = None
 _jieba_vectorizer: CountVectorizer | None = None
+_translation_memo: "OrderedDict[str, str]" = OrderedDict()
+_translation_lock = threading.Lock()
 
 
 def _get_model() -> KeyBERT:
     global _kw_model
     if _kw_model is None:
-        transformer = SentenceTransformer(
-            "sentence-transformers/paraphrase-multilingual-mpnet-base-v2"
-        )
+        transformer = SentenceTransformer(KEYBERT_MODEL_ID)
         _kw_model = KeyBERT(model=transformer)
     return _kw_model
 
 
-def extract_keywords(segments: list[dict]) -> list[dict]:
-    """Attach keyword lists to each multi-sentence segment."""
+def warm_up_models() -> None:
+    """Load the local keyword models now instead of on the first segment."""
+
+    _get_model()
+    jieba.initialize()
+
+
+def extract_keywords(
+    segments: list[dict],
+    max_workers: int | None = None,
+    batch_size: int | None = None,
+) -> list[dict]:
+    """Attach keyword lists to each multi-sentence segment.
+
+    LLM requests run concurrently (at most ``max_workers`` in flight, defaulting
+    to ``KEYWORD_CONCURRENCY``). With ``batch_size`` > 1 (default
+    ``KEYWORD_BATCH_SIZE``) each request covers that many segments in one prompt.
+    Segments whose request fails are collected and sent through KeyBERT in one
+    batched pass per vectorizer (jieba for Chinese text, the default otherwise).
+
+    Results are memoized in the persistent keyword cache, so re-running a
+    transcript only pays for segments whose text (or model/prompt) changed.
+    """
 
     if not segments:
         return []
 
-    kw_model = _get_model()
+    workers = KEYWORD_CONCURRENCY if max_workers is None else max_workers
+    per_prompt = KEYWORD_BATCH_SIZE if batch_size is None else batch_size
+    cache = _get_keyword_cache()
+
+    resolved: list[tuple[list[str], str] | None] = []
     for seg in segments:
-        text = seg["text"]
-        try:
-            keywords = fetch_qwen_keywords(text)
-            seg["_keyword_source"] = "llm"
-        except Exception:  # pragma: no cover - service/network failures
-            snippet = _build_snippet(text)
-            LOGGER.warning(
-                "LLM keyword extraction unavailable; falling back to local KeyBERT. "
-                "snippet=%r",
-                snippet or "<empty>",
-                exc_info=True,
-            )
-            seg["_keyword_source"] = "keybert"
-            keywords = kw_model.extract_keywords(
-                text,
-                vectorizer=_get_vectorizer(text),
-                keyphrase_ngram_range=(1, 2),
-                stop_words=None,
+        cached = cache.get(_cache_key(seg["text"], "llm")) if cache else None
+        resolved.append((cached["keywords"], cached["source"]) if cached else None)
+
+    pending = [idx for idx, entry in enumerate(resolved) if entry is None]
+    llm_keywords = _fetch_llm_keywords(
+        [segments[idx]["text"] for idx in pending], workers, per_prompt
+    )
+
+    failed = []
+    for idx, keywords in zip(pending, llm_keywords):
+        if keywords is None:
+            failed.append(idx)
+            continue
+        normalized = _normalize_keywords(keywords)[:MAX_KEYWORDS]
+        if cache:
+            cache.set(
+                _cache_key(segments[idx]["text"], "llm"),
+                {"keywords": normalized, "source": "llm"},
             )
-        normalized = _normalize_keywords(keywords)[:5]
-        seg["keywords"] = [_maybe_translate_keyword(keyword) for keyword in normalized]
+        resolved[idx] = (normalized, "llm")
+
+    fallback = _keybert_keywords([segments[idx]["text"] for idx in failed], cache)
+    for idx, entry in zip(failed, fallback):
+        resolved[idx] = entry
+
+    translations = _translate_keywords(
+        keyword for normalized, _ in resolved for keyword in normalized
+    )
+    for seg, (normalized, source) in zip(segments, resolved):
+        seg["_keyword_source"] = source
+        seg["keywords"] = [translations.get(keyword, keyword) for keyword in normalized]
+
+    breaker = _get_llm_breaker().snapshot()
+    if breaker["state"] != "closed":
+        LOGGER.info(
+            "LLM circuit %s; %d request(s) skipped so far, %d segment(s) on KeyBERT "
+            "this call.",
+            breaker["state"],
+            breaker["short_circuited"],
+            len(failed),
+        )
+    if cache:
+        stats = cache.stats()
+        LOGGER.info(
+            "Keyword cache: hits=%d misses=%d entries=%d",
+            stats["hits"],
+            stats["misses"],
+            stats["entries"],
+        )
     return segments
 
 
+def _keybert_keywords(
+    texts: list[str], cache: DiskCache | None
+) -> list[tuple[list[str], str]]:
+    """Run KeyBERT over every uncached text with one batched call per vectorizer."""
+
+    results: list[tuple[list[str], str] | None] = [None] * len(texts)
+    groups: dict[bool, dict[str, list[int]]] = {}
+    for idx, text in enumerate(texts):
+        cached = cache.get(_cache_key(text, "keybert")) if cache else None
+        if cached:
+            results[idx] = (cached["keywords"], cached["source"])
+            continue
+        is_chinese = bool(HAN_REGEX.search(text))
+        groups.setdefault(is_chinese, {}).setdefault(text, []).append(idx)
+
+    for unique_texts in groups.values():
+        docs = list(unique_texts)
+        extracted = _get_model().extract_keywords(
+            docs,
+            vectorizer=_get_vectorizer(docs[0]),
+            keyphrase_ngram_range=(1, 2),
+            stop_words=None,
+        )
+        # KeyBERT unwraps single-document batches and returns [] when no
+        # document yields a vocabulary.
+        if len(docs) == 1:
+            extracted = [extracted]
+        if len(extracted) != len(docs):
+            extracted = [[] for _ in docs]
+        for text, keywords in zip(docs, extracted):
+            normalized = _normalize_keywords(keywords)[:MAX_KEYWORDS]
+            if cache:
+                cache.set(
+                    _cache_key(text, "keybert"),
+                    {"keywords": normalized, "source": "keybert"},
+                )
+            for idx in unique_texts[text]:
+                results[idx] = (normalized, "keybert")
+    return results
+
+
+def _get_keyword_cache() -> DiskCache | None:
+    if KEYWORD_CACHE_MAX_BYTES <= 0:
+        return None
+    return get_cache("keywords", KEYWORD_CACHE_MAX_BYTES)
+
+
+def _cache_key(text: str, source: str) -> str:
+    if source == "llm":
+        return make_key(text, DASHSCOPE_MODEL, PROMPT_VERSION, MAX_KEYWORDS)
+    return make_key(text, KEYBERT_MODEL_ID, source, MAX_KEYWORDS)
+
+
+def _fetch_llm_keywords(
+    texts: list[str], max_workers: int, batch_size: int = 1
+) -> list[list[str] | None]:
+    """Query the LLM for every text, preserving order; ``None`` marks a failure."""
+
+    if not texts:
+        return []
+    size = max(1, batch_size)
+    batches = [texts[idx:idx + size] for idx in range(0, len(texts), size)]
+    workers = min(max(1, max_workers), len(batches))
+    if workers == 1:
+        batch_results = [_try_llm_keyword_batch(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="keywords"
+        ) as executor:
+            batch_results = list(executor.map(_try_llm_keyword_batch, batches))
+    return [keywords for batch in batch_results for keywords in batch]
+
+
+def _try_llm_keyword_batch(texts: list[str]) -> list[list[str] | None]:
+    if len(texts) == 1:
+        return [_try_llm_keywords(texts[0])]
+    breaker = _get_llm_breaker()
+    if not breaker.allow_request():
+        return [None] * len(texts)
+    try:
+        keywords = list(fetch_qwen_keywords_batch(texts, requery=False))
+    except Exception:  # pragma: no cover - service/network failures
+        breaker.record_failure()
+        LOGGER.warning(
+            "Batched LLM keyword extraction unavailable; falling back to local "
+            "KeyBERT for %d segment(s). first_snippet=%r",
+            len(texts),
+            _build_snippet(texts[0]) or "<empty>",
+            exc_info=True,
+        )
+        return [None] * len(texts)
+    breaker.record_success()
+    # Entries the batch reply missed are re-queried one by one through the same
+    # breaker, so an open breaker stops them as well.
+    keywords = [
+        entry if entry is not None else _try_llm_keywords(text)
+        for text, entry in zip(texts, keywords)
+    ]
+    failed = [text for text, entry in zip(texts, keywords) if entry is None]
+    if failed:
+        LOGGER.warning(
+            "LLM re-query failed for %d of %d batched segment(s); falling back to "
+            "local KeyBERT for those. first_snippet=%r",
+            len(failed),
+            len(texts),
+            _build_snippet(failed[0]) or "<empty>",
+        )
+    return keywords
+
+
+def _try_llm_keywords(text: str) -> list[str] | None:
+    breaker = _get_llm_breaker()
+    if not breaker.allow_request():
+        return None
+    try:
+        keywords = fetch_qwen_keywords(text)
+    except Exception:  # pragma: no cover - service/network failures
+        breaker.record_failure()
+        snippet = _build_snippet(text)
+        LOGGER.warning(
+            "LLM keyword extraction unavailable; falling back to local KeyBERT. "
+            "snippet=%r",
+            snippet or "<empty>",
+            exc_info=True,
+        )
+        return None
+    breaker.record_success()
+    return keywords
+
+
+def _get_llm_breaker() -> CircuitBreaker:
+    return get_breaker(
+        "dashscope",
+        failure_threshold=LLM_BREAKER_FAILURE_THRESHOLD,
+        cooldown=LLM_BREAKER_COOLDOWN,
+    )
+
+
+def keyword_metrics() -> dict:
+    """Return LLM circuit-breaker state plus keyword/translation cache stats."""
+
+    metrics = {"llm_breaker": _get_llm_breaker().snapshot()}
+    cache = _get_keyword_cache()
+    if cache:
+        metrics["keyword_cache"] = cache.stats()
+    if TRANSLATION_CACHE_MAX_BYTES > 0:
+        metrics["translation_cache"] = get_cache(
+            "translations", TRANSLATION_CACHE_MAX_BYTES
+        ).stats()
+    return metrics
+
+
 def _build_snippet(text: str, limit: int = 120) -> str:
     snippet = (text or "").strip().replace("\n", " ")
     if len(snippet) > limit:
@@ -85,28 +314,81 @@ def _normalize_keywords(candidates: Iterable) -> List[str]:
     return normalized
 
 
-def _maybe_translate_keyword(keyword: str) -> str:
-    if not keyword or not HAN_REGEX.search(keyword):
-        return keyword
-    try:
-        model, tokenizer, device = _get_translator()
-        tokenizer.tgt_lang = "en"
-        prefixed = f"en: {keyword}"
-        inputs = tokenizer(prefixed, return_tensors="pt").to(device)
-        with torch.no_grad():
-            generated = model.generate(**inputs, max_length=96)
-        translation = tokenizer.decode(
-            generated[0], skip_special_tokens=True
-        ).strip()
+def _translate_keywords(keywords: Iterable[str]) -> dict[str, str]:
+    """Translate every distinct Han keyword to English.
+
+    Translations are memoized in memory (LRU) and on disk; whatever is left is
+    sent through small100 in padded batches of ``TRANSLATION_BATCH_SIZE``.
+    Keywords that fail to translate are omitted so callers keep the original.
+    """
+
+    unique = list(
+        dict.fromkeys(kw for kw in keywords if kw and HAN_REGEX.search(kw))
+    )
+    if not unique:
+        return {}
+
+    cache = (
+        get_cache("translations", TRANSLATION_CACHE_MAX_BYTES)
+        if TRANSLATION_CACHE_MAX_BYTES > 0
+        else None
+    )
+    translations: dict[str, str] = {}
+    missing: list[str] = []
+    for keyword in unique:
+        with _translation_lock:
+            memoized = _translation_memo.get(keyword)
+            if memoized is not None:
+                _translation_memo.move_to_end(keyword)
+        if memoized is None and cache:
+            memoized = cache.get(make_key(keyword, TRANSLATOR_MODEL_ID))
+            if memoized is not None:
+                _remember_translation(keyword, memoized)
+        if memoized is None:
+            missing.append(keyword)
+        else:
+            translations[keyword] = memoized
+
+    for idx in range(0, len(missing), TRANSLATION_BATCH_SIZE):
+        batch = missing[idx:idx + TRANSLATION_BATCH_SIZE]
+        try:
+            translated = _translate_batch(batch)
+        except Exception:  # pragma: no cover - translation failures
+            LOGGER.warning(
+                "Keyword translation failed; keeping originals. keywords=%r",
+                batch,
+                exc_info=True,
+            )
+            continue
+        for keyword, translation in zip(batch, translated):
+            translations[keyword] = translation
+            _remember_translation(keyword, translation)
+            if cache:
+                cache.set(make_key(keyword, TRANSLATOR_MODEL_ID), translation)
+    return translations
+
+
+def _translate_batch(keywords: list[str]) -> list[str]:
+    model, tokenizer, device = _get_translator()
+    tokenizer.tgt_lang = "en"
+    prefixed = [f"en: {keyword}" for keyword in keywords]
+    inputs = tokenizer(prefixed, return_tensors="pt", padding=True).to(device)
+    with torch.no_grad():
+        generated = model.generate(**inputs, max_length=96)
+    translations = []
+    for keyword, output_ids in zip(keywords, generated):
+        translation = tokenizer.decode(output_ids, skip_special_tokens=True).strip()
         translation = re.sub(r"^(en|En)\s*:\s*", "", translation).strip()
-        return translation or keyword
-    except Exception:  # pragma: no cover - translation failures
-        LOGGER.warning(
-            "Keyword translation failed; keeping original. keyword=%r",
-            keyword,
-            exc_info=True,
-        )
-    return keyword
+        translations.append(translation or keyword)
+    return translations
+
+
+def _remember_translation(keyword: str, translation: str) -> None:
+    with _translation_lock:
+        _translation_memo[keyword] = translation
+        _translation_memo.move_to_end(keyword)
+        while len(_translation_memo) > TRANSLATION_MEMO_SIZE:
+            _translation_memo.popitem(last=False)
 
 
 def _get_translator():
@@ -114,12 +396,11 @@ def _get_translator():
     if _translator_bundle is None:
         from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 
-        model_id = "alirezamsh/small100"
         tokenizer = AutoTokenizer.from_pretrained(
-            model_id, trust_remote_code=True
+            TRANSLATOR_MODEL_ID, trust_remote_code=True
         )
         model = AutoModelForSeq2SeqLM.from_pretrained(
-            model_id, trust_remote_code=True
+            TRANSLATOR_MODEL_ID, trust_remote_code=True
         )
         device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         model.to(device)
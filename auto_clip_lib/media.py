@@ -3,9 +3,8 @@
 import os
 import subprocess
 
-import requests
-
 from auto_clip_lib.config import CLIP_BUFFER, DIRECT_DOWNLOAD_EXTS
+from auto_clip_lib.http_client import http_get
 from auto_clip_lib.utils import compose_video_filename, sanitize_id
 
 from auto_clip_lib.utils import ytdlp_cmd
@@ -43,7 +42,7 @@ def download_video(result: dict, output_dir: str) -> str | None:
     if not os.path.exists(out_path):
         if is_direct_file:
             try:
-                with requests.get(video_url, stream=True, timeout=30) as resp:
+                with http_get(video_url, stream=True, timeout=30) as resp:
                     resp.raise_for_status()
                     with open(out_path, "wb") as f:
                         for chunk in resp.iter_content(chunk_size=8192):
@@ -72,6 +71,63 @@ def download_video(result: dict, output_dir: str) -> str | None:
     return out_path
 
 
+def download_section(result: dict, start: float, end: float, output_file: str) -> bool:
+    """Fetch only ``start``..``end`` (+ ``CLIP_BUFFER``) of a video into ``output_file``.
+
+    Direct files are cut by ffmpeg straight from the URL, which seeks with HTTP
+    range requests; everything else goes through yt-dlp's ``--download-sections``.
+    Returns False when the source cannot serve a section, so callers can fall
+    back to a full download plus ``trim_clip``.
+    """
+
+    video_url = result.get("download_url") or result.get("url")
+    if not video_url:
+        return False
+    duration = max(0.5, end - start + CLIP_BUFFER)
+    if video_url.lower().endswith(DIRECT_DOWNLOAD_EXTS):
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-ss",
+            str(start),
+            "-t",
+            str(duration),
+            "-i",
+            video_url,
+            "-c",
+            "copy",
+            output_file,
+        ]
+    else:
+        cmd = [
+            ytdlp_cmd(),
+            "-f",
+            "best[height<=720]",
+            "--download-sections",
+            f"*{start}-{start + duration}",
+            "--force-overwrites",
+            "-o",
+            output_file,
+            video_url,
+        ]
+    try:
+        proc = subprocess.run(
+            cmd,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError as e:
+        print(f"  Section download error for {video_url}: {e}")
+        return False
+    if proc.returncode != 0 or not os.path.exists(output_file):
+        return False
+    if os.path.getsize(output_file) == 0:
+        os.remove(output_file)
+        return False
+    return True
+
+
 def trim_clip(input_file: str, start: float, end: float, output_file: str) -> None:
     duration = max(0.5, end - start + CLIP_BUFFER)
     subprocess.run(
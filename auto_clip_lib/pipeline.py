@@ -7,14 +7,25 @@ from typing import Callable, Iterable
 
 from .captions import parse_captions
 from .chunking import chunk_segments
-from .config import NO_SEARCH_RESULT, SEARCH_RESULTS
+from .config import (
+    DEFAULT_PROVIDER_CONCURRENCY,
+    NO_SEARCH_RESULT,
+    PROVIDER_CONCURRENCY,
+    SEARCH_CONCURRENCY,
+    SEARCH_MEMO_SIZE,
+    SEARCH_RESULTS,
+    SEARCH_SPECULATIVE,
+)
 from .documents import parse_document
 from .keywords import extract_keywords
 from .queries import generate_queries
+from .scheduler import SearchScheduler
+from .search_cache import cache_search_providers
 from .searchers import search_youtube
 
 
 LogFn = Callable[[str], None]
+SegmentFn = Callable[[int, dict], None]
 
 
 def build_segments_metadata(
@@ -58,7 +69,29 @@ def enrich_segments(
     log_func: LogFn | None = print,
     search_providers: Iterable | None = None,
     start_offset: int = 0,
+    max_workers: int | None = None,
+    speculative: bool | None = None,
+    on_segment: SegmentFn | None = None,
 ) -> list[dict]:
+    """Extract keywords, then search every provider for every segment.
+
+    Searches for different segments and providers run concurrently (at most
+    ``max_workers`` in flight, default ``SEARCH_CONCURRENCY``, and at most
+    ``PROVIDER_CONCURRENCY[label]`` per provider). Within one segment/provider
+    pair the query candidates are still tried in order, stopping at the first
+    query with hits. Log lines and results are emitted in segment order.
+    Providers are wrapped with the persistent search cache (``SEARCH_CACHE_MODE``),
+    and identical provider/query pairs within the call share one request.
+
+    With ``speculative`` (default ``SEARCH_SPECULATIVE``) all candidates for a
+    provider are launched at once and the highest-priority non-empty result
+    wins; the remaining requests are cancelled where possible and the number
+    that ran anyway is logged.
+
+    ``on_segment(index, segment)`` is called as each segment's results are
+    assembled, so callers can stream them before the whole batch is done.
+    """
+
     def _log(message: str) -> None:
         if log_func:
             log_func(message)
@@ -66,48 +99,133 @@ def enrich_segments(
     segments = extract_keywords(segments)
     _log("→ Extracted keywords for each segment.")
 
-    providers = search_providers or ((search_youtube, "YouTube"),)
-    for idx, seg in enumerate(segments, start=start_offset):
+    providers = resolve_providers(search_providers)
+    speculate = SEARCH_SPECULATIVE if speculative is None else speculative
+    scheduler = new_search_scheduler(max_workers)
+    with scheduler:
+        search_segments(
+            segments, scheduler, providers, speculate, start_offset, _log, on_segment
+        )
+    log_search_summary(scheduler, speculate, _log)
+    return segments
+
+
+def resolve_providers(search_providers: Iterable | None) -> tuple:
+    """Default to YouTube and wrap providers with the persistent search cache."""
+
+    return cache_search_providers(search_providers or ((search_youtube, "YouTube"),))
+
+
+def new_search_scheduler(max_workers: int | None = None) -> SearchScheduler:
+    return SearchScheduler(
+        SEARCH_CONCURRENCY if max_workers is None else max_workers,
+        provider_limits=PROVIDER_CONCURRENCY,
+        default_provider_limit=DEFAULT_PROVIDER_CONCURRENCY,
+        memo_size=SEARCH_MEMO_SIZE,
+    )
+
+
+def search_segments(
+    segments: list[dict],
+    scheduler: SearchScheduler,
+    providers: Iterable,
+    speculate: bool,
+    start_offset: int,
+    log: LogFn,
+    on_segment: SegmentFn | None = None,
+) -> list[dict]:
+    """Search keyword-tagged segments on ``scheduler``; see ``enrich_segments``."""
+
+    pending = []
+    for seg in segments:
         query_candidates = generate_queries(seg)
-        _log(f"[{idx}] Searching: {query_candidates[0] if query_candidates else ''}")
         seg["queries_tried"] = query_candidates
-        results = []
-
-        for search_func, label in providers:
-            source_hits = []
-            last_query = query_candidates[0] if query_candidates else ""
-            try:
-                for attempt, query in enumerate(query_candidates):
-                    last_query = query
-                    source_hits = search_func(query, SEARCH_RESULTS)
-                    if source_hits:
-                        if attempt > 0:
-                            _log(
-                                f"  {label} retry #{attempt} succeeded with '{query}'"
-                            )
-                        break
-                    if attempt < len(query_candidates) - 1:
-                        _log(
-                            NO_SEARCH_RESULT.format(
-                                search_source=label, keywords=query
-                            )
-                        )
-            except Exception as exc:  # pragma: no cover - network failures
-                _log(f"  {label} search error: {exc}")
-                source_hits = []
-            if not source_hits:
-                _log(
-                    NO_SEARCH_RESULT.format(
-                        search_source=label, keywords=last_query
-                    )
+        pending.append(
+            [
+                scheduler.submit(
+                    _search_provider,
+                    scheduler,
+                    search_func,
+                    label,
+                    query_candidates,
+                    speculate,
                 )
-            results.extend(source_hits)
+                for search_func, label in providers
+            ]
+        )
 
+    for idx, (seg, tasks) in enumerate(zip(segments, pending), start=start_offset):
+        query_candidates = seg["queries_tried"]
+        log(f"[{idx}] Searching: {query_candidates[0] if query_candidates else ''}")
+        results = []
+        for task in tasks:
+            source_hits, messages = task.result()
+            for message in messages:
+                log(message)
+            results.extend(source_hits)
         seg["video_results"] = results
-
+        if on_segment:
+            on_segment(idx, seg)
     return segments
 
 
+def log_search_summary(scheduler: SearchScheduler, speculate: bool, log: LogFn) -> None:
+    log(f"→ Single-flight saved {scheduler.single_flight.saved} duplicate search(es).")
+    if speculate:
+        log(f"→ Speculative search wasted {scheduler.wasted_requests} request(s).")
+
+
+def _search_provider(
+    scheduler: SearchScheduler,
+    search_func: Callable[[str, int], list[dict]],
+    label: str,
+    query_candidates: list[str],
+    speculative: bool = False,
+) -> tuple[list[dict], list[str]]:
+    """Try each query in order for one provider; return hits plus log lines."""
+
+    if speculative and len(query_candidates) > 1:
+        futures, stop = scheduler.speculate(
+            label, search_func, query_candidates, SEARCH_RESULTS
+        )
+
+        def fetch(attempt: int, query: str) -> list[dict]:
+            return futures[attempt].result()
+
+    else:
+        futures, stop = [], None
+
+        def fetch(attempt: int, query: str) -> list[dict]:
+            return scheduler.call(label, search_func, query, SEARCH_RESULTS)
+
+    messages: list[str] = []
+    source_hits: list[dict] = []
+    last_query = query_candidates[0] if query_candidates else ""
+    consumed = 0
+    try:
+        for attempt, query in enumerate(query_candidates):
+            last_query = query
+            consumed = attempt + 1
+            source_hits = fetch(attempt, query)
+            if source_hits:
+                if attempt > 0:
+                    messages.append(f"  {label} retry #{attempt} succeeded with '{query}'")
+                break
+            if attempt < len(query_candidates) - 1:
+                messages.append(
+                    NO_SEARCH_RESULT.format(search_source=label, keywords=query)
+                )
+    except Exception as exc:  # pragma: no cover - network failures
+        messages.append(f"  {label} search error: {exc}")
+        source_hits = []
+    finally:
+        if stop is not None:
+            scheduler.abandon(futures[consumed:], stop)
+    if not source_hits:
+        messages.append(NO_SEARCH_RESULT.format(search_source=label, keywords=last_query))
+    return source_hits, messages
+
+
 def _load_segments(source_path: str) -> list[dict]:
     path = Path(source_path)
     suffix = path.suffix.lower()
@@ -0,0 +1,251 @@
+"""Background enrichment of the next page for paginated sessions."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+from .config import (
+    PREFETCH_CACHE,
+    PREFETCH_IDLE_TIMEOUT,
+    PREFETCH_MAX_SESSIONS,
+    PREFETCH_TAKE_TIMEOUT,
+    SEARCH_SPECULATIVE,
+)
+from .keywords import extract_keywords
+from .pipeline import new_search_scheduler, resolve_providers, search_segments
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PrefetchCancelled(Exception):
+    """Raised inside a prefetch once its session has been abandoned."""
+
+
+class _Prefetch:
+    def __init__(self, start: int, end: int) -> None:
+        self.start = start
+        self.end = end
+        self.done = threading.Event()
+        self.cancelled = threading.Event()
+
+
+class Prefetcher:
+    """Enrich page k+1 in the background while the user reviews page k.
+
+    The finished page is staged as ``PREFETCH_CACHE`` next to the session's
+    chunk cache, so ``take`` can serve "continue" straight from disk (waiting
+    up to ``take_timeout`` seconds for an in-flight prefetch). At most
+    ``max_sessions`` sessions prefetch at once; sessions not seen for
+    ``idle_timeout`` seconds are treated as abandoned, which stops their
+    prefetch and drops the staged page. A background sweeper checks for idle
+    sessions every ``sweep_interval`` seconds while any session is tracked,
+    and a running prefetch checks for cancellation between its keyword and
+    search stages and after every searched segment.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = PREFETCH_MAX_SESSIONS,
+        idle_timeout: float = PREFETCH_IDLE_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+        sweep_interval: float | None = None,
+        take_timeout: float = PREFETCH_TAKE_TIMEOUT,
+    ) -> None:
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = (
+            min(idle_timeout, 60.0) if sweep_interval is None else sweep_interval
+        )
+        self.take_timeout = take_timeout
+        self._slots = threading.BoundedSemaphore(max(1, max_sessions))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._inflight: dict[Path, _Prefetch] = {}
+        self._last_seen: dict[Path, float] = {}
+        self._threads: set[threading.Thread] = set()
+        self._sweeper: threading.Thread | None = None
+        self._closed = threading.Event()
+
+    def schedule(
+        self,
+        output_dir: Path,
+        page: list[dict],
+        start_index: int,
+        search_providers: Iterable | None = None,
+    ) -> bool:
+        """Start enriching ``page`` (segments ``start_index...``) in the background.
+
+        ``page`` is mutated by the prefetch, so pass a copy. Returns False when
+        there is nothing to prefetch, the session is already prefetching, or
+        every prefetch slot is taken.
+        """
+
+        output_dir = Path(output_dir)
+        self._sweep()
+        if not page:
+            return False
+        end_index = start_index + len(page)
+        with self._lock:
+            self._last_seen[output_dir] = self._clock()
+            current = self._inflight.get(output_dir)
+            if current is not None and not current.done.is_set():
+                return False
+            if not self._slots.acquire(blocking=False):
+                return False
+            prefetch = _Prefetch(start_index, end_index)
+            self._inflight[output_dir] = prefetch
+            thread = threading.Thread(
+                target=self._run,
+                args=(output_dir, prefetch, page, search_providers),
+                name=f"prefetch-{output_dir.name}",
+                daemon=True,
+            )
+            self._threads.add(thread)
+            self._ensure_sweeper()
+        thread.start()
+        return True
+
+    def take(self, output_dir: Path, start_index: int, end_index: int) -> list[dict] | None:
+        """Return the staged page for ``[start_index, end_index)`` or None.
+
+        Waits up to ``take_timeout`` for a matching in-flight prefetch; one
+        that is still running after that is cancelled, since the caller is
+        about to enrich the page itself. The staged file is consumed so a
+        page is never served twice.
+        """
+
+        output_dir = Path(output_dir)
+        self._sweep()
+        with self._lock:
+            self._last_seen[output_dir] = self._clock()
+            prefetch = self._inflight.get(output_dir)
+        if prefetch is not None and (prefetch.start, prefetch.end) == (start_index, end_index):
+            if not prefetch.done.wait(self.take_timeout):
+                LOGGER.info("Prefetch for %s is too slow; enriching in the foreground", output_dir)
+                prefetch.cancelled.set()
+                return None
+
+        staged_path = output_dir / PREFETCH_CACHE
+        if not staged_path.exists():
+            return None
+        try:
+            with staged_path.open(encoding="utf-8") as fh:
+                staged = json.load(fh)
+        except (OSError, ValueError):
+            return None
+        finally:
+            staged_path.unlink(missing_ok=True)
+        if (staged.get("start"), staged.get("end")) != (start_index, end_index):
+            return None
+        return staged["segments"]
+
+    def abandon(self, output_dir: Path) -> None:
+        """Stop prefetching for ``output_dir`` and discard its staged page."""
+
+        output_dir = Path(output_dir)
+        with self._lock:
+            prefetch = self._inflight.pop(output_dir, None)
+            self._last_seen.pop(output_dir, None)
+        if prefetch is not None:
+            prefetch.cancelled.set()
+        (output_dir / PREFETCH_CACHE).unlink(missing_ok=True)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Cancel every prefetch, stop the sweeper and join the worker threads."""
+
+        self._closed.set()
+        with self._lock:
+            prefetches = list(self._inflight.values())
+            threads = list(self._threads)
+            sweeper = self._sweeper
+        for prefetch in prefetches:
+            prefetch.cancelled.set()
+        for thread in threads:
+            thread.join(timeout)
+        if sweeper is not None:
+            sweeper.join(timeout)
+
+    def _ensure_sweeper(self) -> None:
+        # Called with self._lock held.
+        if self._sweeper is None and not self._closed.is_set():
+            self._sweeper = threading.Thread(
+                target=self._sweep_forever, name="prefetch-sweeper", daemon=True
+            )
+            self._sweeper.start()
+
+    def _sweep_forever(self) -> None:
+        while not self._closed.wait(self.sweep_interval):
+            self._sweep()
+            with self._lock:
+                if not self._last_seen:
+                    self._sweeper = None
+                    return
+
+    def _sweep(self) -> None:
+        now = self._clock()
+        with self._lock:
+            idle = [
+                output_dir
+                for output_dir, seen in self._last_seen.items()
+                if now - seen > self.idle_timeout
+            ]
+        for output_dir in idle:
+            LOGGER.info("Abandoning prefetch for idle session %s", output_dir)
+            self.abandon(output_dir)
+
+    def _run(
+        self,
+        output_dir: Path,
+        prefetch: _Prefetch,
+        page: list[dict],
+        search_providers: Iterable | None,
+    ) -> None:
+        def _check_cancelled(_idx: int = 0, _segment: dict | None = None) -> None:
+            if prefetch.cancelled.is_set():
+                raise PrefetchCancelled()
+
+        try:
+            # enrich_segments, split up so cancellation is noticed between stages.
+            _check_cancelled()
+            page = extract_keywords(page)
+            _check_cancelled()
+            scheduler = new_search_scheduler()
+            with scheduler:
+                search_segments(
+                    page,
+                    scheduler,
+                    resolve_providers(search_providers),
+                    SEARCH_SPECULATIVE,
+                    prefetch.start,
+                    lambda _message: None,
+                    on_segment=_check_cancelled,
+                )
+            if not prefetch.cancelled.is_set():
+                _write_staged(output_dir, prefetch.start, prefetch.end, page)
+        except PrefetchCancelled:
+            LOGGER.info("Prefetch of %s cancelled", output_dir)
+        except Exception:
+            LOGGER.warning("Prefetch failed for %s", output_dir, exc_info=True)
+        finally:
+            self._slots.release()
+            prefetch.done.set()
+            with self._lock:
+                self._threads.discard(threading.current_thread())
+
+
+def _write_staged(output_dir: Path, start: int, end: int, segments: list[dict]) -> None:
+    staged_path = output_dir / PREFETCH_CACHE
+    tmp_path = staged_path.with_suffix(".json.tmp")
+    with tmp_path.open("w", encoding="utf-8") as fh:
+        json.dump(
+            {"start": start, "end": end, "segments": segments},
+            fh,
+            indent=2,
+            ensure_ascii=False,
+        )
+    os.replace(tmp_path, staged_path)
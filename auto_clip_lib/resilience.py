@@ -0,0 +1,138 @@
+"""Failure-isolation helpers for calls to remote services."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable
+
+LOGGER = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_breakers: dict[str, "CircuitBreaker"] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(name: str, failure_threshold: int, cooldown: float) -> "CircuitBreaker":
+    """Return the process-wide breaker registered under ``name``.
+
+    Raises ValueError if ``name`` is already registered with a different
+    ``failure_threshold`` or ``cooldown``; two callers sharing a breaker must
+    agree on its settings.
+    """
+
+    with _registry_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name, failure_threshold=failure_threshold, cooldown=cooldown
+            )
+            _breakers[name] = breaker
+        elif (breaker.failure_threshold, breaker.cooldown) != (
+            max(1, failure_threshold),
+            cooldown,
+        ):
+            raise ValueError(
+                f"Circuit breaker {name!r} is registered with failure_threshold="
+                f"{breaker.failure_threshold}, cooldown={breaker.cooldown}; got "
+                f"failure_threshold={failure_threshold}, cooldown={cooldown}"
+            )
+        return breaker
+
+
+class CircuitBreaker:
+    """Stop calling a failing dependency for a cool-down window.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    ``allow_request`` returns False. Once ``cooldown`` seconds have passed a
+    single half-open probe is let through: success closes the breaker, failure
+    re-opens it for another cool-down.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._consecutive_failures = 0
+        self._counters = {
+            "successes": 0,
+            "failures": 0,
+            "short_circuited": 0,
+            "opened": 0,
+        }
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and self._clock() - self._opened_at >= self.cooldown:
+                self._transition(HALF_OPEN)
+            if self._state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self._counters["short_circuited"] += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._counters["successes"] += 1
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._counters["failures"] += 1
+            self._consecutive_failures += 1
+            was_probe = self._state == HALF_OPEN
+            self._probe_in_flight = False
+            if was_probe or (
+                self._state == CLOSED
+                and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._counters["opened"] += 1
+                self._transition(OPEN)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                **self._counters,
+            }
+
+    def _transition(self, new_state: str) -> None:
+        if new_state == self._state:
+            return
+        LOGGER.warning(
+            "Circuit breaker %r: %s → %s (consecutive_failures=%d, cooldown=%.0fs)",
+            self.name,
+            self._state,
+            new_state,
+            self._consecutive_failures,
+            self.cooldown,
+        )
+        self._state = new_state
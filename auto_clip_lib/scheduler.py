@@ -0,0 +1,248 @@
+"""Concurrency helpers for fanning out searches across segments and providers."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Hashable, Mapping, Sequence
+
+from .search_cache import normalize_query
+
+_SKIPPED = object()
+
+
+class SingleFlight:
+    """Collapse identical calls into one; every caller gets the shared result.
+
+    Results stay memoized so later duplicates are answered without calling
+    again: for the lifetime of the object, or only for the ``max_memo`` most
+    recently used keys when it is set. Failed calls are not memoized, and a
+    result for which ``discard`` returns True is not shared: the entry is
+    dropped and waiting callers retry.
+    """
+
+    def __init__(
+        self,
+        discard: Callable[[Any], bool] = lambda value: False,
+        max_memo: int | None = None,
+    ) -> None:
+        self._discard = discard
+        self._max_memo = max_memo
+        self._calls: dict[Hashable, Future] = {}
+        # Keys of resolved entries in _calls, least recently used first.
+        self._memo: OrderedDict[Hashable, None] = OrderedDict()
+        self._lock = threading.Lock()
+        self.saved = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any) -> Any:
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                owner = future is None
+                if owner:
+                    future = Future()
+                    self._calls[key] = future
+            if owner:
+                try:
+                    value = fn(*args)
+                except BaseException as exc:
+                    with self._lock:
+                        self._calls.pop(key, None)
+                    future.set_exception(exc)
+                    raise
+                with self._lock:
+                    if self._discard(value):
+                        self._calls.pop(key, None)
+                    else:
+                        self._remember(key)
+                future.set_result(value)
+                return value
+            value = future.result()
+            if self._discard(value):
+                continue
+            with self._lock:
+                self.saved += 1
+                if key in self._memo:
+                    self._memo.move_to_end(key)
+            return value
+
+    def _remember(self, key: Hashable) -> None:
+        # Called with self._lock held.
+        self._memo[key] = None
+        if self._max_memo is None:
+            return
+        while len(self._memo) > self._max_memo:
+            oldest, _ = self._memo.popitem(last=False)
+            self._calls.pop(oldest, None)
+
+
+class _Speculation(threading.Event):
+    """Stop flag for one ``speculate`` call.
+
+    Also maps each of its futures to an event that is set only if that future
+    dispatched a request itself, rather than joining an identical in-flight
+    call or reusing a memoized result.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.dispatched: dict[Future, threading.Event] = {}
+
+
+class SearchScheduler:
+    """Run search tasks on a shared pool under global and per-provider caps.
+
+    ``max_workers`` bounds how many searches are in flight overall; each
+    provider label is additionally bounded by ``provider_limits[label]`` (or
+    ``default_provider_limit``). Use as a context manager so the pool is shut
+    down once every task has been collected.
+
+    ``speculate`` launches several queries for one provider at once on a
+    separate pool (so coordinating tasks never starve the searches they wait
+    on); ``abandon`` cancels the ones no longer needed and counts the requests
+    they had already dispatched in ``wasted_requests`` (queries answered by
+    another caller's request are not counted).
+
+    Identical ``(label, normalized query, max_results)`` calls share a single
+    request through ``single_flight``, which remembers the ``memo_size`` most
+    recent results (all of them when None); ``single_flight.saved`` counts
+    the searches avoided.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        provider_limits: Mapping[str, int] | None = None,
+        default_provider_limit: int | None = None,
+        memo_size: int | None = None,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self._global = threading.BoundedSemaphore(self.max_workers)
+        self._provider_limits = dict(provider_limits or {})
+        self._default_provider_limit = default_provider_limit or self.max_workers
+        self._provider_semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="search"
+        )
+        self._speculative_executor: ThreadPoolExecutor | None = None
+        self.wasted_requests = 0
+        self.single_flight = SingleFlight(
+            discard=lambda value: value is _SKIPPED, max_memo=memo_size
+        )
+
+    def __enter__(self) -> "SearchScheduler":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        # On error nobody will collect the remaining tasks; drop the queued ones.
+        self.shutdown(cancel_pending=exc_type is not None)
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def call(
+        self,
+        label: str,
+        search_func: Callable[[str, int], list[dict]],
+        query: str,
+        max_results: int,
+    ) -> list[dict]:
+        """Invoke ``search_func`` once a global and a provider slot are free."""
+
+        return self.single_flight.do(
+            (label, normalize_query(query), max_results),
+            self._gated_call,
+            None,
+            label,
+            search_func,
+            query,
+            max_results,
+        )
+
+    def speculate(
+        self,
+        label: str,
+        search_func: Callable[[str, int], list[dict]],
+        queries: Sequence[str],
+        max_results: int,
+    ) -> tuple[list[Future], _Speculation]:
+        """Launch every query at once; returns futures in query order plus a stop flag."""
+
+        stop = _Speculation()
+        executor = self._get_speculative_executor()
+        futures = []
+        for query in queries:
+            dispatched = threading.Event()
+            future = executor.submit(
+                self.single_flight.do,
+                (label, normalize_query(query), max_results),
+                self._gated_call,
+                stop,
+                label,
+                search_func,
+                query,
+                max_results,
+                dispatched,
+            )
+            stop.dispatched[future] = dispatched
+            futures.append(future)
+        return futures, stop
+
+    def abandon(self, futures: Sequence[Future], stop: _Speculation) -> None:
+        """Cancel speculative queries whose result is no longer needed."""
+
+        stop.set()
+        for future in futures:
+            if not future.cancel():
+                future.add_done_callback(partial(self._count_waste, stop.dispatched[future]))
+
+    def shutdown(self, cancel_pending: bool = False) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=cancel_pending)
+        if self._speculative_executor is not None:
+            self._speculative_executor.shutdown(wait=True, cancel_futures=cancel_pending)
+
+    def _gated_call(
+        self,
+        stop: threading.Event | None,
+        label: str,
+        search_func: Callable[[str, int], list[dict]],
+        query: str,
+        max_results: int,
+        dispatched: threading.Event | None = None,
+    ) -> Any:
+        with self._provider_semaphore(label), self._global:
+            if stop is not None and stop.is_set():
+                return _SKIPPED
+            if dispatched is not None:
+                dispatched.set()
+            return search_func(query, max_results)
+
+    def _count_waste(self, dispatched: threading.Event, future: Future) -> None:
+        # Only the caller that ran the request pays for it; joiners of an
+        # in-flight call and skipped or cancelled queries cost nothing.
+        if future.cancelled() or not dispatched.is_set():
+            return
+        with self._lock:
+            self.wasted_requests += 1
+
+    def _get_speculative_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._speculative_executor is None:
+                self._speculative_executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="search-speculative"
+                )
+            return self._speculative_executor
+
+    def _provider_semaphore(self, label: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._provider_semaphores.get(label)
+            if semaphore is None:
+                limit = self._provider_limits.get(label, self._default_provider_limit)
+                semaphore = threading.BoundedSemaphore(
+                    max(1, min(limit, self.max_workers))
+                )
+                self._provider_semaphores[label] = semaphore
+            return semaphore
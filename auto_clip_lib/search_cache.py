@@ -0,0 +1,173 @@
+"""Persistent, TTL-based caching for search provider callables."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable
+
+from .cache import DiskCache, get_cache, make_key
+from .config import (
+    DEFAULT_PROVIDER_CONCURRENCY,
+    DEFAULT_SEARCH_CACHE_TTL,
+    PROVIDER_CONCURRENCY,
+    SEARCH_CACHE_MAX_BYTES,
+    SEARCH_CACHE_MODE,
+    SEARCH_CACHE_STALE,
+    SEARCH_CACHE_TTL,
+    SEARCH_REFRESH_QUEUE,
+    SEARCH_REFRESH_WORKERS,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+SearchFn = Callable[[str, int], list[dict]]
+
+# Stale-hit refreshes from every CachedSearch share one bounded pool, one
+# in-flight key set and per-provider slots, so a page of stale keys (or two
+# runs wrapping the same provider) cannot burst a provider.
+_refresh_lock = threading.Lock()
+_refreshing: set[str] = set()
+_refresh_slots: dict[str, threading.BoundedSemaphore] = {}
+_refresh_executor: ThreadPoolExecutor | None = None
+
+
+def normalize_query(query: str) -> str:
+    return " ".join((query or "").lower().split())
+
+
+def cache_search_providers(
+    providers: Iterable, mode: str | None = None
+) -> tuple:
+    """Wrap ``(search_func, label)`` pairs with the persistent search cache.
+
+    ``mode`` (default ``SEARCH_CACHE_MODE``) is "on", "off" or "offline";
+    offline providers answer from the cache only and never hit the network.
+    Providers that are already wrapped keep their mode unless ``mode`` is
+    passed explicitly and differs, so a caller's ``mode="offline"`` survives
+    the default wrapping done further down the pipeline.
+    """
+
+    explicit = mode is not None
+    mode = mode or SEARCH_CACHE_MODE
+    cache = None
+    wrapped = []
+    for search_func, label in providers:
+        if isinstance(search_func, CachedSearch):
+            if not explicit or search_func.mode == mode:
+                wrapped.append((search_func, label))
+                continue
+            search_func = search_func.search_func
+        if mode == "off":
+            wrapped.append((search_func, label))
+            continue
+        if cache is None:
+            cache = get_cache("search", SEARCH_CACHE_MAX_BYTES)
+        wrapped.append(
+            (
+                CachedSearch(
+                    search_func,
+                    label,
+                    cache,
+                    ttl=SEARCH_CACHE_TTL.get(label, DEFAULT_SEARCH_CACHE_TTL),
+                    stale_ttl=SEARCH_CACHE_STALE,
+                    mode=mode,
+                ),
+                label,
+            )
+        )
+    return tuple(wrapped)
+
+
+class CachedSearch:
+    """Search callable that serves fresh hits from disk and revalidates stale ones.
+
+    Entries younger than ``ttl`` are returned as-is. Entries up to
+    ``ttl + stale_ttl`` old are returned immediately and queued for a refresh
+    on a shared pool of ``SEARCH_REFRESH_WORKERS`` threads that also honours
+    ``PROVIDER_CONCURRENCY``; a key is refreshed at most once at a time. Empty results are never cached, since adapters also return
+    ``[]`` when the provider errors out.
+    """
+
+    def __init__(
+        self,
+        search_func: SearchFn,
+        label: str,
+        cache: DiskCache,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        mode: str = "on",
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.search_func = search_func
+        self.label = label
+        self.cache = cache
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.mode = mode
+        self._clock = clock
+
+    def __call__(self, query: str, max_results: int) -> list[dict]:
+        key = make_key("search", self.label, normalize_query(query), max_results)
+        entry = self.cache.get_entry(key)
+        if entry is not None:
+            hits, stored_at = entry
+            age = self._clock() - stored_at
+            if self.mode == "offline" or age < self.ttl:
+                return hits
+            if age < self.ttl + self.stale_ttl:
+                self._revalidate(key, query, max_results)
+                return hits
+        if self.mode == "offline":
+            return []
+        return self._search_and_store(key, query, max_results)
+
+    def _search_and_store(self, key: str, query: str, max_results: int) -> list[dict]:
+        hits = self.search_func(query, max_results)
+        if hits:
+            self.cache.set(key, hits)
+        return hits
+
+    def _revalidate(self, key: str, query: str, max_results: int) -> None:
+        with _refresh_lock:
+            if key in _refreshing or len(_refreshing) >= SEARCH_REFRESH_QUEUE:
+                return
+            _refreshing.add(key)
+            executor = _get_refresh_executor()
+        executor.submit(self._refresh, key, query, max_results)
+
+    def _refresh(self, key: str, query: str, max_results: int) -> None:
+        try:
+            with _refresh_slot(self.label):
+                self._search_and_store(key, query, max_results)
+        except Exception:  # pragma: no cover - network failures
+            LOGGER.warning(
+                "Background refresh failed for %s query %r",
+                self.label,
+                query,
+                exc_info=True,
+            )
+        finally:
+            with _refresh_lock:
+                _refreshing.discard(key)
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    # Called with _refresh_lock held.
+    global _refresh_executor
+    if _refresh_executor is None:
+        _refresh_executor = ThreadPoolExecutor(
+            max_workers=max(1, SEARCH_REFRESH_WORKERS), thread_name_prefix="search-refresh"
+        )
+    return _refresh_executor
+
+
+def _refresh_slot(label: str) -> threading.BoundedSemaphore:
+    with _refresh_lock:
+        slot = _refresh_slots.get(label)
+        if slot is None:
+            limit = PROVIDER_CONCURRENCY.get(label, DEFAULT_PROVIDER_CONCURRENCY)
+            slot = _refresh_slots[label] = threading.BoundedSemaphore(max(1, limit))
+        return slot
@@ -1,30 +1,76 @@
 """Search adapters for each media source."""
 
 import json
+import logging
+import queue
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
 
 import internetarchive
 import requests
 
+from auto_clip_lib.config import (
+    NASA_ASSET_WORKERS,
+    NASA_SEARCH_DEADLINE,
+    YOUTUBE_SEARCH_BACKEND,
+    YTDLP_POOL_SIZE,
+)
+from auto_clip_lib.http_client import get_session, http_get
 from auto_clip_lib.utils import sanitize_id
 from auto_clip_lib.utils import ytdlp_cmd
 
+LOGGER = logging.getLogger(__name__)
+
+
+class _YtdlpLogger:
+    """Send in-process yt-dlp output to logging instead of stderr."""
+
+    def debug(self, msg: str) -> None:
+        LOGGER.debug(msg)
+
+    def info(self, msg: str) -> None:
+        LOGGER.debug(msg)
+
+    def warning(self, msg: str) -> None:
+        LOGGER.debug(msg)
+
+    def error(self, msg: str) -> None:
+        LOGGER.debug(msg)
+
+
+YTDLP_SEARCH_OPTIONS = {
+    "quiet": True,
+    "no_warnings": True,
+    "noprogress": True,
+    "skip_download": True,
+    "extract_flat": "in_playlist",
+    "logger": _YtdlpLogger(),
+}
+
+
+ARCHIVE_FIELDS = ["identifier", "title", "licenseurl"]
+
 
 def search_archive_org(query: str, max_results: int = 3) -> list[dict]:
     try:
         search_results = internetarchive.search_items(
-            f'({query}) AND mediatype:(movies)'
+            f'({query}) AND mediatype:(movies)',
+            fields=ARCHIVE_FIELDS,
         )
         results = []
         for r in search_results:
-            item = internetarchive.get_item(r['identifier'])
-            video_url = f"https://archive.org/details/{item.identifier}"
-            license_url = item.metadata.get('licenseurl', 'N/A')
+            identifier = r.get('identifier')
+            if not identifier:
+                continue
+            video_url = f"https://archive.org/details/{identifier}"
             results.append({
-                'title': item.metadata.get('title', 'No Title'),
-                'id': item.identifier,
+                'title': _first_value(r.get('title')) or 'No Title',
+                'id': identifier,
                 'url': video_url,
-                'license': license_url,
+                'license': _first_value(r.get('licenseurl')) or 'N/A',
                 'source': 'archive.org'
             })
             if len(results) >= max_results:
@@ -35,6 +81,13 @@ def search_archive_org(query: str, max_results: int = 3) -> list[dict]:
         return []
 
 
+def _first_value(value):
+    """Search API fields can be multi-valued; keep the first entry."""
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
 def search_cspan(query: str, max_results: int = 3) -> list[dict]:
     try:
         params = {
@@ -44,7 +97,7 @@ def search_cspan(query: str, max_results: int = 3) -> list[dict]:
             "query": query,
             "number": max_results,
         }
-        resp = requests.get("https://www.c-span.org/search/api/", params=params, timeout=10)
+        resp = http_get("https://www.c-span.org/search/api/", params=params, timeout=10)
         resp.raise_for_status()
         payload = resp.json()
         raw_results = payload.get("results") or payload.get("items") or []
@@ -73,56 +126,118 @@ def search_cspan(query: str, max_results: int = 3) -> list[dict]:
 
 
 def search_nasa(query: str, max_results: int = 3) -> list[dict]:
+    deadline = time.monotonic() + NASA_SEARCH_DEADLINE
     try:
+        session = _nasa_session()
         params = {"q": query, "media_type": "video"}
-        resp = requests.get(
+        resp = session.get(
             "https://images-api.nasa.gov/search", params=params, timeout=10
         )
         resp.raise_for_status()
         items = resp.json().get("collection", {}).get("items", [])
-        results = []
+        candidates = []
         for item in items:
             data = (item.get("data") or [])
             if not data:
                 continue
             meta = data[0]
-            nasa_id = meta.get("nasa_id")
-            if not nasa_id:
-                continue
-            asset_resp = requests.get(
-                f"https://images-api.nasa.gov/asset/{nasa_id}", timeout=10
-            )
-            asset_resp.raise_for_status()
-            asset_items = asset_resp.json().get("collection", {}).get("items", [])
-            mp4_url = None
-            for asset in asset_items:
-                href = asset.get("href")
-                if href and href.lower().endswith(".mp4"):
-                    mp4_url = href
+            if meta.get("nasa_id"):
+                candidates.append(meta)
+
+        results = []
+        window = max(max_results, NASA_ASSET_WORKERS)
+        executor = ThreadPoolExecutor(
+            max_workers=NASA_ASSET_WORKERS, thread_name_prefix="nasa-assets"
+        )
+        try:
+            for start in range(0, len(candidates), window):
+                batch = candidates[start:start + window]
+                futures = [
+                    executor.submit(_resolve_nasa_mp4, session, meta["nasa_id"], deadline)
+                    for meta in batch
+                ]
+                done, _ = wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+                for meta, future in zip(batch, futures):
+                    if future not in done or future.exception() is not None:
+                        continue
+                    mp4_url = future.result()
+                    if not mp4_url:
+                        continue
+                    nasa_id = meta["nasa_id"]
+                    detail_url = f"https://images.nasa.gov/details-{nasa_id}.html"
+                    results.append(
+                        {
+                            "title": meta.get("title", "NASA video"),
+                            "id": nasa_id,
+                            "url": detail_url,
+                            "download_url": mp4_url,
+                            "license": "Public Domain (NASA)",
+                            "source": "nasa",
+                            "center": meta.get("center"),
+                        }
+                    )
+                    if len(results) >= max_results:
+                        break
+                if len(results) >= max_results or time.monotonic() >= deadline:
                     break
-            if not mp4_url:
-                continue
-            detail_url = f"https://images.nasa.gov/details-{nasa_id}.html"
-            results.append(
-                {
-                    "title": meta.get("title", "NASA video"),
-                    "id": nasa_id,
-                    "url": detail_url,
-                    "download_url": mp4_url,
-                    "license": "Public Domain (NASA)",
-                    "source": "nasa",
-                    "center": meta.get("center"),
-                }
-            )
-            if len(results) >= max_results:
-                break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
         return results
     except Exception as e:
         print(f"  NASA search error: {e}")
         return []
 
 
+def _resolve_nasa_mp4(session: requests.Session, nasa_id: str, deadline: float) -> str | None:
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return None
+    asset_resp = session.get(
+        f"https://images-api.nasa.gov/asset/{nasa_id}", timeout=min(10.0, remaining)
+    )
+    asset_resp.raise_for_status()
+    asset_items = asset_resp.json().get("collection", {}).get("items", [])
+    for asset in asset_items:
+        href = asset.get("href")
+        if href and href.lower().endswith(".mp4"):
+            return href
+    return None
+
+
+def _nasa_session() -> requests.Session:
+    """Keep-alive session shared by NASA searches and their asset lookups."""
+    return get_session("https://images-api.nasa.gov")
+
+
 def search_youtube(query: str, max_results: int = 3) -> list[dict]:
+    if YOUTUBE_SEARCH_BACKEND == "subprocess":
+        return _search_youtube_subprocess(query, max_results)
+    return _search_youtube_api(query, max_results)
+
+
+def _search_youtube_api(query: str, max_results: int = 3) -> list[dict]:
+    try:
+        pool = _get_ytdlp_pool()
+    except ImportError:
+        return _search_youtube_subprocess(query, max_results)
+    try:
+        with pool.borrow() as ydl:
+            info = ydl.extract_info(f"ytsearch{max_results}:{query}", download=False)
+        results = []
+        for entry in (info or {}).get("entries") or []:
+            if not entry or entry.get("_type") == "playlist":
+                continue
+            video_id = entry.get("id")
+            if not video_id:
+                continue
+            results.append(_youtube_result(entry, video_id))
+        return results
+    except Exception as e:
+        print(f"  YouTube search error: {e}")
+        return []
+
+
+def _search_youtube_subprocess(query: str, max_results: int = 3) -> list[dict]:
     try:
         yt_query = f"ytsearch{max_results}:{query}"
         proc = subprocess.run(
@@ -151,17 +266,76 @@ def search_youtube(query: str, max_results: int = 3) -> list[dict]:
             video_id = data.get("id")
             if not video_id:
                 continue
-            results.append(
-                {
-                    "title": data.get("title", "YouTube video"),
-                    "id": video_id,
-                    "url": f"https://www.youtube.com/watch?v={video_id}",
-                    "license": data.get("license") or "YouTube Terms of Service",
-                    "source": "youtube",
-                    "channel": data.get("uploader"),
-                }
-            )
+            results.append(_youtube_result(data, video_id))
         return results
     except Exception as e:
         print(f"  YouTube search error: {e}")
         return []
+
+
+def _youtube_result(data: dict, video_id: str) -> dict:
+    return {
+        "title": data.get("title", "YouTube video"),
+        "id": video_id,
+        "url": f"https://www.youtube.com/watch?v={video_id}",
+        "license": data.get("license") or "YouTube Terms of Service",
+        "source": "youtube",
+        "channel": data.get("uploader") or data.get("channel"),
+    }
+
+
+class _YoutubeDLPool:
+    """Thread-safe pool of long-lived ``YoutubeDL`` objects.
+
+    Creating a ``YoutubeDL`` loads every extractor, so instances are created
+    lazily (up to ``size``) and handed to one thread at a time.
+    """
+
+    def __init__(self, size: int, options: dict) -> None:
+        from yt_dlp import YoutubeDL
+
+        self._factory = lambda: YoutubeDL(dict(options))
+        self._size = max(1, size)
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def borrow(self):
+        ydl = self._acquire()
+        try:
+            yield ydl
+        finally:
+            self._idle.put(ydl)
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self._size:
+                self._created += 1
+                create = True
+            else:
+                create = False
+        if create:
+            try:
+                return self._factory()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        return self._idle.get()
+
+
+_ytdlp_pool: _YoutubeDLPool | None = None
+_ytdlp_pool_lock = threading.Lock()
+
+
+def _get_ytdlp_pool() -> _YoutubeDLPool:
+    global _ytdlp_pool
+    with _ytdlp_pool_lock:
+        if _ytdlp_pool is None:
+            _ytdlp_pool = _YoutubeDLPool(YTDLP_POOL_SIZE, YTDLP_SEARCH_OPTIONS)
+        return _ytdlp_pool
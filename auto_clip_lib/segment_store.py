@@ -0,0 +1,178 @@
+"""Append-only JSONL store for the segments of a paginated session."""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:  # POSIX only; elsewhere the in-process lock is all we get.
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from .config import SEGMENT_INDEX, SEGMENT_STORE
+
+_ENTRY = struct.Struct("<qQQ")  # segment index, byte offset, byte length
+
+_session_locks: dict[Path, threading.Lock] = {}
+_registry_lock = threading.Lock()
+
+
+class SegmentStore:
+    """Segments stored one JSON line each, with a binary offset index.
+
+    ``SEGMENT_STORE`` holds ``{"index": i, "segment": {...}}`` lines in append
+    order and ``SEGMENT_INDEX`` holds fixed-size ``(index, offset, length)``
+    entries, so any page is read by seeking to its lines instead of parsing the
+    whole session. Appends take a per-session lock (threads and, on POSIX,
+    processes), skip indices already stored and are fsynced before the index
+    is extended; a torn trailing write is detected and repaired by the next
+    append.
+    """
+
+    def __init__(self, output_dir: str | Path) -> None:
+        self.output_dir = Path(output_dir)
+        self.data_path = self.output_dir / SEGMENT_STORE
+        self.index_path = self.output_dir / SEGMENT_INDEX
+
+    @staticmethod
+    def exists(output_dir: str | Path) -> bool:
+        return (Path(output_dir) / SEGMENT_STORE).exists()
+
+    def append(self, start_index: int, segments: list[dict]) -> int:
+        """Store ``segments`` as indices ``start_index...``; returns how many were new."""
+
+        with self._locked():
+            offsets = self._load_offsets(repair=True)
+            lines = []
+            entries = []
+            position = self.data_path.stat().st_size if self.data_path.exists() else 0
+            for idx, seg in enumerate(segments, start=start_index):
+                if idx in offsets:
+                    continue
+                line = (
+                    json.dumps({"index": idx, "segment": seg}, ensure_ascii=False) + "\n"
+                ).encode("utf-8")
+                entries.append(_ENTRY.pack(idx, position, len(line)))
+                offsets[idx] = (position, len(line))
+                lines.append(line)
+                position += len(line)
+            if not lines:
+                return 0
+            _append_synced(self.data_path, b"".join(lines))
+            _append_synced(self.index_path, b"".join(entries))
+            return len(lines)
+
+    def count(self) -> int:
+        return len(self._load_offsets())
+
+    def read_page(self, start: int, end: int) -> list[dict]:
+        """Return the stored segments with ``start <= index < end``, in order."""
+
+        offsets = self._load_offsets()
+        wanted = [offsets[idx] for idx in range(start, end) if idx in offsets]
+        if not wanted:
+            return []
+        page = []
+        with self.data_path.open("rb") as fh:
+            for offset, length in wanted:
+                fh.seek(offset)
+                page.append(json.loads(fh.read(length))["segment"])
+        return page
+
+    def read_all(self) -> list[dict]:
+        return list(self)
+
+    def __iter__(self) -> Iterator[dict]:
+        if not self.data_path.exists():
+            return
+        records = []
+        with self.data_path.open(encoding="utf-8") as fh:
+            for line in fh:
+                if line.endswith("\n"):
+                    record = json.loads(line)
+                    records.append((record["index"], record["segment"]))
+        seen = set()
+        for idx, seg in sorted(records, key=lambda item: item[0]):
+            if idx not in seen:
+                seen.add(idx)
+                yield seg
+
+    def export_json(self, path: str | Path) -> Path:
+        """Write the legacy ``clips_metadata.json`` list atomically."""
+
+        path = Path(path)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as fh:
+            json.dump(self.read_all(), fh, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        key = self.output_dir.resolve()
+        with _registry_lock:
+            lock = _session_locks.setdefault(key, threading.Lock())
+        with lock:
+            if fcntl is None:
+                yield
+                return
+            with (self.output_dir / f"{SEGMENT_STORE}.lock").open("a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load_offsets(self, repair: bool = False) -> dict[int, tuple[int, int]]:
+        offsets: dict[int, tuple[int, int]] = {}
+        if not self.data_path.exists():
+            return offsets
+        raw = self.index_path.read_bytes() if self.index_path.exists() else b""
+        usable = len(raw) - len(raw) % _ENTRY.size
+        end = 0
+        for idx, offset, length in _ENTRY.iter_unpack(raw[:usable]):
+            offsets.setdefault(idx, (offset, length))
+            end = max(end, offset + length)
+        if usable == len(raw) and end == self.data_path.stat().st_size:
+            return offsets
+        offsets, valid_end = self._scan()
+        if repair:
+            # Only appenders repair, under the session lock: drop a torn
+            # trailing line and rewrite the index from the data file.
+            with self.data_path.open("r+b") as fh:
+                fh.truncate(valid_end)
+            tmp_path = self.index_path.with_suffix(".tmp")
+            tmp_path.write_bytes(
+                b"".join(
+                    _ENTRY.pack(idx, offset, length)
+                    for idx, (offset, length) in offsets.items()
+                )
+            )
+            os.replace(tmp_path, self.index_path)
+        return offsets
+
+    def _scan(self) -> tuple[dict[int, tuple[int, int]], int]:
+        """Rebuild offsets from the JSONL file; returns them and the end of the last full line."""
+
+        offsets: dict[int, tuple[int, int]] = {}
+        position = 0
+        with self.data_path.open("rb") as fh:
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    break
+                offsets.setdefault(json.loads(line)["index"], (position, len(line)))
+                position += len(line)
+        return offsets, position
+
+
+def _append_synced(path: Path, payload: bytes) -> None:
+    with path.open("ab") as fh:
+        fh.write(payload)
+        fh.flush()
+        os.fsync(fh.fileno())
@@ -0,0 +1,184 @@
+"""Streaming SubRip reader that yields plain cue records instead of pysrt objects."""
+
+from __future__ import annotations
+
+import codecs
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf_32_le"),
+    (codecs.BOM_UTF32_BE, "utf_32_be"),
+    (codecs.BOM_UTF16_LE, "utf_16_le"),
+    (codecs.BOM_UTF16_BE, "utf_16_be"),
+    (codecs.BOM_UTF8, "utf_8"),
+)
+_BOM_CODECS = {codecs.lookup(encoding).name for _, encoding in _BOMS}
+_DEFAULT_ENCODING = "utf_8"
+_READ_SIZE = 1 << 18  # characters decoded per read
+# Everything str.splitlines() breaks on, which is how pysrt (via codecs) splits.
+_LINE_BREAKS = frozenset("\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029")
+
+_TIMESTAMP_SEPARATOR = "-->"
+_TIME_SEP = re.compile(r"\:|\.|\,")
+_LEADING_INT = re.compile(r"^(\d+)")
+# Well-formed timing lines take this fast path; anything else goes through
+# the pysrt-compatible split below.
+_CANONICAL_TIMING = re.compile(
+    r"(\d+):(\d+):(\d+)[,.](\d+) --> (\d+):(\d+):(\d+)[,.](\d+)"
+)
+
+
+class Cue(NamedTuple):
+    start_ms: int
+    end_ms: int
+    text: str
+
+
+def detect_encoding(path: str | Path) -> str:
+    """Return the codec named by the file's BOM, or UTF-8 when there is none."""
+
+    with open(path, "rb") as fh:
+        head = fh.read(4)
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    return _DEFAULT_ENCODING
+
+
+def iter_srt(path: str | Path, encoding: str | None = None) -> Iterator[Cue]:
+    """Yield the cues of an SRT file one at a time.
+
+    Parsing follows ``pysrt.stream`` (with its default of skipping bad cues):
+    cues are blocks separated by blank lines, the index line is optional,
+    times accept ``:``, ``.`` or ``,`` as separators and tolerate junk after
+    the digits, and blocks without a usable timestamp line are dropped. The
+    file is decoded in large blocks, so memory stays flat however long it is.
+    Decoding errors propagate, as they do with pysrt.
+    """
+
+    yield from _iter_blocks(_iter_lines(path, encoding))
+
+
+def parse_timestamp(value: str) -> int | None:
+    """Convert an SRT time such as ``00:01:02,500`` to milliseconds (None if invalid)."""
+
+    if not value:
+        return 0
+    parts = _TIME_SEP.split(value)
+    if len(parts) != 4:
+        return None
+    hours, minutes, seconds, millis = (_parse_int(part) for part in parts)
+    return ((hours * 60 + minutes) * 60 + seconds) * 1000 + millis
+
+
+def format_timestamp(ms: int) -> str:
+    """Format milliseconds as ``HH:MM:SS,mmm`` (negative times clamp to zero, like pysrt)."""
+
+    if ms < 0:
+        ms = 0
+    return "%02d:%02d:%02d,%03d" % (
+        ms // 3_600_000,
+        ms % 3_600_000 // 60_000,
+        ms % 60_000 // 1000,
+        ms % 1000,
+    )
+
+
+def write_srt(
+    cues: Iterable[Cue], path: str | Path, encoding: str = "utf-8", eol: str = os.linesep
+) -> int:
+    """Write ``cues`` one at a time, numbered from 1; returns how many were written.
+
+    The layout matches ``pysrt.SubRipFile.save`` for the same cues.
+    """
+
+    count = 0
+    with open(path, "w", encoding=encoding, newline="") as fh:
+        for count, cue in enumerate(cues, start=1):
+            item = "%d\n%s --> %s\n%s\n" % (
+                count,
+                format_timestamp(cue.start_ms),
+                format_timestamp(cue.end_ms),
+                cue.text,
+            )
+            if eol != "\n":
+                item = item.replace("\n", eol)
+            fh.write(item if item.endswith(2 * eol) else item + eol)
+    return count
+
+
+def _parse_int(digits: str) -> int:
+    try:
+        return int(digits)
+    except ValueError:
+        match = _LEADING_INT.match(digits)
+        return int(match.group()) if match else 0
+
+
+def _iter_lines(path: str | Path, encoding: str | None) -> Iterator[str]:
+    """Yield lines with their line breaks, split exactly like ``str.splitlines``."""
+
+    encoding = encoding or detect_encoding(path)
+    strip_bom = codecs.lookup(encoding).name in _BOM_CODECS
+    carry = ""
+    with open(path, encoding=encoding, newline="") as fh:
+        while True:
+            block = fh.read(_READ_SIZE)
+            if not block:
+                break
+            if strip_bom:
+                block = block.removeprefix("\ufeff")
+                strip_bom = False
+            lines = (carry + block).splitlines(True)
+            carry = ""
+            # Hold back an unterminated last line, and a trailing "\r" that
+            # may be the first half of a "\r\n" split across reads.
+            if lines and (lines[-1][-1] not in _LINE_BREAKS or lines[-1].endswith("\r")):
+                carry = lines.pop()
+            yield from lines
+    if carry:
+        yield carry
+
+
+def _iter_blocks(lines: Iterable[str]) -> Iterator[Cue]:
+    block: list[str] = []
+    for line in lines:
+        if line.strip():
+            block.append(line)
+        elif block:
+            cue = _parse_block(block)
+            block = []
+            if cue is not None:
+                yield cue
+    if block:
+        cue = _parse_block(block)
+        if cue is not None:
+            yield cue
+
+
+def _parse_block(block: list[str]) -> Cue | None:
+    if len(block) < 2:
+        return None
+    lines = [line.rstrip() for line in block]
+    if _TIMESTAMP_SEPARATOR not in lines[0]:
+        lines.pop(0)  # cue index
+    match = _CANONICAL_TIMING.fullmatch(lines[0])
+    if match:
+        h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, match.groups())
+        return Cue(
+            ((h1 * 60 + m1) * 60 + s1) * 1000 + ms1,
+            ((h2 * 60 + m2) * 60 + s2) * 1000 + ms2,
+            "\n".join(lines[1:]),
+        )
+    timestamps = lines[0].split(_TIMESTAMP_SEPARATOR)
+    if len(timestamps) != 2:
+        return None
+    start_text, end_and_position = timestamps
+    start = parse_timestamp(start_text.strip())
+    end = parse_timestamp(end_and_position.lstrip().split(" ", 1)[0].strip())
+    if start is None or end is None:
+        return None
+    return Cue(start, end, "\n".join(lines[1:]))
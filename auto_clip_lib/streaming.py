@@ -0,0 +1,181 @@
+"""Streaming parse → chunk → keywords → search pipeline with bounded buffers."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from .captions import iter_captions
+from .chunking import iter_chunks
+from .config import SEARCH_SPECULATIVE, STREAM_BATCH_SIZE, STREAM_BUFFER
+from .documents import iter_document
+from .keywords import extract_keywords
+from .pipeline import (
+    LogFn,
+    log_search_summary,
+    new_search_scheduler,
+    resolve_providers,
+    search_segments,
+)
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+class _Stopped(Exception):
+    """The consumer went away; unwind the stage quietly."""
+
+
+def iter_source_segments(source_path: str | Path) -> Iterator[dict]:
+    """Yield base segments from an SRT or DOCX file without loading it whole."""
+
+    if Path(source_path).suffix.lower() in {".docx", ".doc"}:
+        return iter_document(source_path)
+    return iter_captions(str(source_path))
+
+
+def stream_segments(
+    source_path: str | Path,
+    log_func: LogFn | None = print,
+    search_providers: Iterable | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+    buffer_size: int = STREAM_BUFFER,
+    speculative: bool | None = None,
+) -> Iterator[dict]:
+    """Yield enriched segments in order, each as soon as its searches finish.
+
+    Parsing + chunking, keyword extraction and search run as separate threads
+    joined by queues holding at most ``buffer_size`` batches of ``batch_size``
+    chunks, so a slow stage applies back-pressure instead of letting the
+    upstream stages buffer the whole file. Searches share one scheduler (and
+    its single-flight memo) for the whole stream. Closing the generator early
+    stops every stage.
+    """
+
+    def _log(message: str) -> None:
+        if log_func:
+            log_func(message)
+
+    batch_size = max(1, batch_size)
+    stop = threading.Event()
+    chunk_batches: queue.Queue = queue.Queue(max(1, buffer_size))
+    tagged_batches: queue.Queue = queue.Queue(max(1, buffer_size))
+    enriched: queue.Queue = queue.Queue(max(1, buffer_size) * batch_size)
+
+    def _chunk_stage() -> None:
+        chunks = iter_chunks(iter_source_segments(source_path))
+        offset = 0
+        while True:
+            batch = list(islice(chunks, batch_size))
+            if not batch:
+                break
+            _put(chunk_batches, (offset, batch), stop)
+            offset += len(batch)
+        _log(f"→ Regrouped into {offset} multi-sentence segments for search.")
+
+    def _keyword_stage() -> None:
+        for offset, batch in _drain(chunk_batches, tagged_batches, stop):
+            extract_keywords(batch)
+            _log(f"→ Extracted keywords for segments {offset}–{offset + len(batch) - 1}.")
+            _put(tagged_batches, (offset, batch), stop)
+
+    def _search_stage() -> None:
+        providers = resolve_providers(search_providers)
+        speculate = SEARCH_SPECULATIVE if speculative is None else speculative
+        scheduler = new_search_scheduler()
+        with scheduler:
+            for offset, batch in _drain(tagged_batches, enriched, stop):
+                search_segments(
+                    batch,
+                    scheduler,
+                    providers,
+                    speculate,
+                    offset,
+                    _log,
+                    on_segment=lambda _idx, seg: _put(enriched, seg, stop),
+                )
+        log_search_summary(scheduler, speculate, _log)
+
+    threads = [
+        threading.Thread(
+            target=_run_stage,
+            args=(stage, sink, stop),
+            name=f"stream-{stage.__name__.strip('_')}",
+            daemon=True,
+        )
+        for stage, sink in (
+            (_chunk_stage, chunk_batches),
+            (_keyword_stage, tagged_batches),
+            (_search_stage, enriched),
+        )
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        while True:
+            item = enriched.get()
+            if item is _DONE:
+                break
+            if isinstance(item, _Failure):
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def _run_stage(stage: Callable[[], None], sink: queue.Queue, stop: threading.Event) -> None:
+    """Run ``stage`` and always hand ``sink`` a terminator (done or the failure)."""
+
+    try:
+        stage()
+        terminator: Any = _DONE
+    except _Stopped:
+        return
+    except BaseException as exc:
+        terminator = _Failure(exc)
+    try:
+        _put(sink, terminator, stop)
+    except _Stopped:
+        pass
+
+
+def _drain(
+    source: queue.Queue, sink: queue.Queue, stop: threading.Event
+) -> Iterator[Any]:
+    """Yield items from ``source`` until it is done; forward upstream failures."""
+
+    while True:
+        item = _get(source, stop)
+        if item is _DONE:
+            return
+        if isinstance(item, _Failure):
+            raise item.exc
+        yield item
+
+
+def _put(target: queue.Queue, item: Any, stop: threading.Event) -> None:
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+    raise _Stopped()
+
+
+def _get(source: queue.Queue, stop: threading.Event) -> Any:
+    while not stop.is_set():
+        try:
+            return source.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    raise _Stopped()
@@ -2,21 +2,26 @@
 
 from __future__ import annotations
 
-import copy
 import json
+import os
 import subprocess
 from datetime import datetime
 from pathlib import Path
 from typing import Iterable
 
-from .config import CHUNK_CACHE, OUTPUT_DIR, RESULT_JSON, SEARCH_RESULTS
+from .chunk_cache import ChunkSource, JsonChunks, open_chunk_cache, write_chunk_cache
+from .config import OUTPUT_DIR, RESULT_JSON, SEARCH_RESULTS
 from .pipeline import (
     LogFn,
+    SegmentFn,
     build_segments_metadata,
     enrich_segments,
     prepare_segments,
 )
+from .prefetch import Prefetcher
 from .searchers import search_youtube
+from .segment_store import SegmentStore
+from .streaming import stream_segments
 from .utils import sanitize_id, ytdlp_cmd
 
 
@@ -51,6 +56,54 @@ def run_metadata_workflow(
     return segments, output_dir, metadata_path, trimmed_dir if create_trimmed_dir else None
 
 
+def run_streaming_workflow(
+    source_path: str,
+    *,
+    log_func: LogFn | None = print,
+    search_providers: Iterable | None = None,
+    output_prefix: str | None = None,
+    on_segment: SegmentFn | None = None,
+) -> tuple[int, Path, Path]:
+    """Like ``run_metadata_workflow`` but streams segments into clips_metadata.json.
+
+    Each enriched segment is appended to the JSON array (same layout as the
+    batch workflow) and passed to ``on_segment`` as soon as it is searched, so
+    memory stays flat regardless of input size. The array is built in a temp
+    file and only replaces clips_metadata.json once it is complete. Returns
+    the segment count.
+    """
+
+    source_file = Path(source_path)
+    base_name = (output_prefix or source_file.stem or "session").strip() or "session"
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_dir = Path(OUTPUT_DIR) / f"{base_name}_{timestamp}"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    metadata_path = output_dir / RESULT_JSON
+    # Written to a temp file and moved into place only once the array is
+    # closed, so a failed run never leaves truncated JSON behind.
+    tmp_path = metadata_path.with_suffix(".json.tmp")
+    count = 0
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            f.write("[")
+            for seg in stream_segments(
+                source_file, log_func=log_func, search_providers=search_providers
+            ):
+                entry = json.dumps(seg, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+                f.write(f"{',' if count else ''}\n  {entry}")
+                f.flush()
+                if on_segment:
+                    on_segment(count, seg)
+                count += 1
+            f.write("\n]" if count else "]")
+        os.replace(tmp_path, metadata_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    return count, output_dir, metadata_path
+
+
 def run_keyword_search_workflow(
     query: str,
     *,
@@ -173,8 +226,19 @@ def run_paginated_workflow(
     page_size: int = 10,
     output_prefix: str | None = None,
     existing_output_dir: str | None = None,
+    on_segment: SegmentFn | None = None,
+    prefetcher: Prefetcher | None = None,
 ) -> tuple[list[dict], Path, Path, int, int]:
-    """Process a subset of segments and persist state for pagination."""
+    """Process a subset of segments and persist state for pagination.
+
+    ``on_segment`` is forwarded to ``enrich_segments`` to stream each result.
+    With a ``prefetcher`` the page is served from the staged prefetch when
+    available, and the following page starts prefetching before returning.
+
+    Pages are appended to the session's ``SegmentStore``; the legacy
+    ``RESULT_JSON`` file is exported once the last page has been processed
+    (call ``SegmentStore.export_json`` for an earlier snapshot).
+    """
 
     if page_size <= 0:
         raise ValueError("page_size must be positive.")
@@ -193,40 +257,69 @@ def run_paginated_workflow(
         safe_prefix = sanitize_id(output_prefix or Path(source_path).stem or "session")
         output_dir = Path(OUTPUT_DIR) / f"{safe_prefix}_{timestamp}"
         output_dir.mkdir(parents=True, exist_ok=True)
-        chunk_cache = output_dir / CHUNK_CACHE
-        with chunk_cache.open("w", encoding="utf-8") as f:
-            json.dump(chunked, f, indent=2, ensure_ascii=False)
+        write_chunk_cache(output_dir, chunked)
+        chunks = JsonChunks(chunked)
     else:
         if not existing_output_dir:
             raise ValueError("existing_output_dir is required for pagination.")
         output_dir = Path(existing_output_dir)
-        chunk_cache = output_dir / CHUNK_CACHE
-        if not chunk_cache.exists():
-            raise ValueError("Chunked segment cache missing.")
-        with chunk_cache.open(encoding="utf-8") as f:
-            chunked = json.load(f)
+        chunks = open_chunk_cache(output_dir)
 
-    total_segments = len(chunked)
+    try:
+        return _run_page(
+            chunks,
+            output_dir,
+            start_index,
+            page_size,
+            _log,
+            search_providers,
+            on_segment,
+            prefetcher,
+        )
+    finally:
+        chunks.close()
+
+
+def _run_page(
+    chunks: ChunkSource,
+    output_dir: Path,
+    start_index: int,
+    page_size: int,
+    log: LogFn,
+    search_providers: Iterable | None,
+    on_segment: SegmentFn | None,
+    prefetcher: Prefetcher | None,
+) -> tuple[list[dict], Path, Path, int, int]:
+    total_segments = len(chunks)
     metadata_path = output_dir / RESULT_JSON
     if start_index >= total_segments:
         return [], output_dir, metadata_path, start_index, total_segments
 
     end_index = min(start_index + page_size, total_segments)
-    slice_copy = copy.deepcopy(chunked[start_index:end_index])
+    processed_slice = None
+    if prefetcher is not None and start_index > 0:
+        processed_slice = prefetcher.take(output_dir, start_index, end_index)
+    if processed_slice is not None:
+        log(f"→ Served segments {start_index}–{end_index - 1} from prefetch.")
+        if on_segment:
+            for idx, seg in enumerate(processed_slice, start=start_index):
+                on_segment(idx, seg)
+    else:
+        processed_slice = enrich_segments(
+            chunks.page(start_index, end_index),
+            log_func=log,
+            search_providers=search_providers,
+            start_offset=start_index,
+            on_segment=on_segment,
+        )
 
-    processed_slice = enrich_segments(
-        slice_copy,
-        log_func=_log,
-        search_providers=search_providers,
-        start_offset=start_index,
-    )
+    store = SegmentStore(output_dir)
+    store.append(start_index, processed_slice)
+    if end_index >= total_segments:
+        store.export_json(metadata_path)
 
-    existing = []
-    if metadata_path.exists():
-        with metadata_path.open(encoding="utf-8") as f:
-            existing = json.load(f)
-    existing.extend(processed_slice)
-    with metadata_path.open("w", encoding="utf-8") as f:
-        json.dump(existing, f, indent=2, ensure_ascii=False)
+    if prefetcher is not None and end_index < total_segments:
+        next_page = chunks.page(end_index, end_index + page_size)
+        prefetcher.schedule(output_dir, next_page, end_index, search_providers)
 
     return processed_slice, output_dir, metadata_path, end_index, total_segments
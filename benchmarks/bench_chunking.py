@@ -0,0 +1,85 @@
+"""Scaling benchmark for ``chunk_segments`` over synthetic SRT cues.
+
+Usage: python benchmarks/bench_chunking.py [--sizes 10000 50000 ...] [--srt]
+                                           [--punctuation 0.5]
+
+With ``--srt`` each size is written to a temporary .srt file and parsed with
+``parse_captions`` first, so the numbers include caption parsing. Use
+``--punctuation 0`` to mimic YouTube auto-captions, which rarely end a sentence.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from auto_clip_lib.captions import parse_captions  # noqa: E402
+from auto_clip_lib.chunking import chunk_segments  # noqa: E402
+
+WORDS = "the council voted on a new budget while protesters gathered outside city hall".split()
+ENDINGS = [".", "?", "!", "…", "。", ";", '."', ".)"]
+
+
+def synthetic_cues(count: int, seed: int = 0, punctuation: float = 0.5) -> list[dict]:
+    rng = random.Random(seed)
+    cues = []
+    for idx in range(count):
+        words = rng.choices(WORDS, k=rng.randint(3, 12))
+        if rng.random() < punctuation:
+            cut = rng.randint(1, len(words))
+            words[cut - 1] += rng.choice(ENDINGS)
+        cues.append({"start": idx * 2.0, "end": idx * 2.0 + 1.8, "text": " ".join(words)})
+    return cues
+
+
+def _timestamp(seconds: float) -> str:
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02}:{minutes:02}:{secs:02},{millis:03}"
+
+
+def write_srt(cues: list[dict], path: Path) -> None:
+    with path.open("w", encoding="utf-8") as fh:
+        for idx, cue in enumerate(cues, start=1):
+            fh.write(f"{idx}\n{_timestamp(cue['start'])} --> {_timestamp(cue['end'])}\n")
+            fh.write(f"{cue['text']}\n\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 50_000, 100_000, 250_000, 500_000]
+    )
+    parser.add_argument("--srt", action="store_true", help="include SRT parsing")
+    parser.add_argument(
+        "--punctuation",
+        type=float,
+        default=0.5,
+        help="fraction of cues containing a sentence ending (0 = unpunctuated)",
+    )
+    args = parser.parse_args()
+
+    print(f"{'cues':>8} {'chunks':>8} {'seconds':>9} {'µs/cue':>8}")
+    for size in args.sizes:
+        cues = synthetic_cues(size, punctuation=args.punctuation)
+        with tempfile.TemporaryDirectory() as tmp:
+            srt_path = Path(tmp) / "bench.srt"
+            if args.srt:
+                write_srt(cues, srt_path)
+            started = time.perf_counter()
+            segments = parse_captions(str(srt_path)) if args.srt else cues
+            chunked = chunk_segments(segments)
+            elapsed = time.perf_counter() - started
+        print(f"{size:>8} {len(chunked):>8} {elapsed:>9.3f} {elapsed / size * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
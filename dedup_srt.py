@@ -1,8 +1,14 @@
 import argparse
 from pathlib import Path
+from typing import Iterable, Iterator
 
 import pysrt
 
+from auto_clip_lib.batch import expand_inputs, is_batch, run_batch
+from auto_clip_lib.srt import Cue, iter_srt, write_srt
+
+DEDUP_SUFFIX = ".dedup.srt"
+
 
 def _normalize(text: str) -> str:
     """Collapse whitespace/newlines to detect duplicate captions."""
@@ -14,67 +20,166 @@ def _join(tokens):
 
 
 def _longest_overlap(prev_tokens, curr_tokens):
-    max_len = min(len(prev_tokens), len(curr_tokens))
-    for size in range(max_len, 0, -1):
-        if prev_tokens[-size:] == curr_tokens[:size]:
-            return size
-    return 0
-
-
-def deduplicate_subtitles(subs: pysrt.SubRipFile) -> pysrt.SubRipFile:
-    """Emit only the new words that appear in each rolling caption update."""
-    cleaned_items = []
-    prev_tokens = []
-    for sub in subs:
-        normalized = _normalize(sub.text)
-        if not normalized:
-            continue
-        current_tokens = normalized.split()
+    """Length of the longest suffix of ``prev_tokens`` that is a prefix of ``curr_tokens``.
+
+    Runs KMP: the prefix function of ``curr_tokens`` drives a scan over the tail
+    of ``prev_tokens``, so each cue pair costs O(len(curr_tokens)) comparisons
+    instead of one slice comparison per candidate size.
+    """
+    size = len(curr_tokens)
+    if not size or not prev_tokens:
+        return 0
+    failure = [0] * size
+    matched = 0
+    for pos in range(1, size):
+        token = curr_tokens[pos]
+        while matched and curr_tokens[matched] != token:
+            matched = failure[matched - 1]
+        if curr_tokens[matched] == token:
+            matched += 1
+        failure[pos] = matched
+    matched = 0
+    for token in prev_tokens[-size:]:
+        while matched and curr_tokens[matched] != token:
+            matched = failure[matched - 1]
+        if curr_tokens[matched] == token:
+            matched += 1
+            if matched == size:
+                # Only reachable on the last token, since the tail is at most ``size`` long.
+                break
+    return matched
+
+
+def _as_cue(sub) -> Cue:
+    if isinstance(sub, Cue):
+        return sub
+    return Cue(sub.start.ordinal, sub.end.ordinal, sub.text)
+
+
+def iter_deduplicated(cues: Iterable) -> Iterator[Cue]:
+    """Yield each rolling caption update trimmed to the words it adds.
+
+    Only the previous cue's tokens are kept, so this runs in constant memory
+    over arbitrarily long inputs.
+    """
+    prev_tokens: list[str] = []
+    for sub in map(_as_cue, cues):
+        current_tokens = _normalize(sub.text).split()
         if not current_tokens:
             continue
-        new_tokens = current_tokens
-        if prev_tokens:
-            overlap = _longest_overlap(prev_tokens, current_tokens)
-            if overlap == len(current_tokens):
-                prev_tokens = current_tokens
-                continue
-            if overlap > 0:
-                new_tokens = current_tokens[overlap:]
-        text = _join(new_tokens).strip()
-        if not text:
-            prev_tokens = current_tokens
+        overlap = _longest_overlap(prev_tokens, current_tokens)
+        prev_tokens = current_tokens
+        if overlap == len(current_tokens):
             continue
-        item = pysrt.SubRipItem(
-            index=sub.index,
-            start=pysrt.SubRipTime(milliseconds=sub.start.ordinal),
-            end=pysrt.SubRipTime(milliseconds=sub.end.ordinal),
-            text=text,
+        yield Cue(sub.start_ms, sub.end_ms, _join(current_tokens[overlap:]))
+
+
+def deduplicate_subtitles(subs: Iterable) -> pysrt.SubRipFile:
+    """Emit only the new words that appear in each rolling caption update.
+
+    ``subs`` may be a ``pysrt.SubRipFile`` or any iterable of ``Cue`` records,
+    such as ``iter_srt(path)``.
+    """
+    cleaned_items = [
+        pysrt.SubRipItem(
+            start=pysrt.SubRipTime(milliseconds=cue.start_ms),
+            end=pysrt.SubRipTime(milliseconds=cue.end_ms),
+            text=cue.text,
         )
-        cleaned_items.append(item)
-        prev_tokens = current_tokens
+        for cue in iter_deduplicated(subs)
+    ]
     cleaned = pysrt.SubRipFile(items=cleaned_items)
     cleaned.clean_indexes()
     return cleaned
 
 
+def dedup_file(input_path: Path, out_path: Path, stream: bool = False) -> Path:
+    """Deduplicate one SRT file into ``out_path`` and return it."""
+    if stream:
+        write_srt(iter_deduplicated(iter_srt(input_path)), out_path)
+    else:
+        cleaned = deduplicate_subtitles(iter_srt(input_path))
+        cleaned.save(str(out_path), encoding="utf-8")
+    return out_path
+
+
+def _output_path(input_path: Path, output_dir: Path | None) -> Path:
+    out_path = input_path.with_suffix(DEDUP_SUFFIX)
+    return output_dir / out_path.name if output_dir else out_path
+
+
+def _batch_task(path: str, output_dir: Path | None, stream: bool) -> Path:
+    input_path = Path(path)
+    return dedup_file(input_path, _output_path(input_path, output_dir), stream)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Deduplicate auto-generated SRT captions while preserving timing."
     )
-    parser.add_argument("input", type=Path, help="Path to the noisy SRT file.")
+    parser.add_argument(
+        "input",
+        nargs="+",
+        help="Path to the noisy SRT file. Several files, directories or glob "
+        "patterns run in batch mode.",
+    )
     parser.add_argument(
         "-o",
         "--output",
         type=Path,
-        help="Optional output path (defaults to <input>.dedup.srt).",
+        help="Optional output path (defaults to <input>.dedup.srt). In batch "
+        "mode, the directory to write the cleaned files to.",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Read and write cues incrementally in constant memory. Cues are "
+            "written in input order instead of being re-sorted by time."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes in batch mode (default: one per CPU).",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="Batch summary path (defaults to dedup_manifest.json in the output "
+        "directory, or the current directory).",
     )
     args = parser.parse_args()
-    if not args.input.exists():
-        parser.error(f"SRT file not found: {args.input}")
-    subs = pysrt.open(str(args.input))
-    cleaned = deduplicate_subtitles(subs)
-    out_path = args.output or args.input.with_suffix(".dedup.srt")
-    cleaned.save(str(out_path), encoding="utf-8")
+
+    if is_batch(args.input):
+        # Skip earlier outputs so re-running over a directory is idempotent.
+        inputs = [
+            path
+            for path in expand_inputs(args.input, (".srt",))
+            if not path.name.endswith(DEDUP_SUFFIX)
+        ]
+        if not inputs:
+            parser.error("No SRT files matched the given inputs.")
+        if args.output:
+            args.output.mkdir(parents=True, exist_ok=True)
+        manifest_path = args.manifest or (args.output or Path.cwd()) / "dedup_manifest.json"
+        manifest = run_batch(
+            inputs,
+            _batch_task,
+            task_args=(args.output, args.stream),
+            workers=args.workers,
+            manifest_path=manifest_path,
+        )
+        if manifest["failed"]:
+            raise SystemExit(1)
+        return
+
+    input_path = Path(args.input[0])
+    if not input_path.exists():
+        parser.error(f"SRT file not found: {input_path}")
+    out_path = dedup_file(
+        input_path, args.output or _output_path(input_path, None), args.stream
+    )
     print(f"Clean captions written to {out_path}")
 
 
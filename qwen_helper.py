@@ -1,7 +1,7 @@
 import json
 import os
 import re
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from auto_clip_lib.utils import LLMQueryStatusError
 import dashscope
 
@@ -21,6 +21,26 @@ DASHSCOPE_ENDPOINT = os.getenv(
 dashscope.base_http_api_url = DASHSCOPE_ENDPOINT
 
 
+# Bump whenever KEYWORD_PROMPT changes so cached keywords are invalidated.
+PROMPT_VERSION = 1
+KEYWORD_PROMPT = (
+    "You analyze news paragraphs to recommend b-roll searches. "
+    "Return a JSON array (max 5 items) of short English keyword strings tuned for protests, press conferences, or military footage. "
+    "Use these heuristics:\n"
+    "- Activist or political groups → '<group name> protest' / 'rally' / 'march'.\n"
+    "- Politicians or public figures → '<name> press conference', '<name> news conference', or '<name> briefing'.\n"
+    "- Military branches or armed forces → '<unit> military drill', '<unit> war footage', '<unit> training'.\n"
+    "- If none apply, still focus on combinations likely to yield news b-roll (crowds, briefings, demonstrations) rather than narrative sentences.\n"
+    "Avoid dates and punctuation; just return the keyword phrases ready for YouTube search."
+)
+BATCH_PROMPT_SUFFIX = (
+    "\nYou will receive several paragraphs, each introduced by a header line '### <id>'. "
+    "Apply the rules above to every paragraph independently and return a single JSON object "
+    "mapping each id (as a string) to its JSON array of keywords, "
+    'for example {"0": ["..."], "1": ["..."]}. Include every id and nothing else.'
+)
+
+
 def fetch_qwen_keywords(
     text: str,
     max_terms: int = 5,
@@ -30,37 +50,79 @@ def fetch_qwen_keywords(
     """Call DashScope Qwen to extract geopolitical keywords."""
 
     text = (text or "").strip()
+    response = _call_generation(KEYWORD_PROMPT, text, api_key, model_name)
+    raw_text = _extract_raw_text(response)
+    keywords = parse_keyword_list(raw_text)
+    return keywords[:max_terms]
+
+
+def fetch_qwen_keywords_batch(
+    texts: Sequence[str],
+    max_terms: int = 5,
+    api_key: Optional[str] = None,
+    model_name: Optional[str] = None,
+    requery: bool = True,
+) -> List[Optional[List[str]]]:
+    """Extract keywords for several paragraphs with a single DashScope call.
+
+    The reply is expected to be a JSON object keyed by paragraph id. Entries that
+    are missing or malformed are re-queried one by one via ``fetch_qwen_keywords``;
+    a re-query that fails leaves ``None`` in that slot so only that paragraph
+    needs a fallback. With ``requery=False`` such entries are left as ``None``
+    for the caller to re-query itself (e.g. behind a circuit breaker).
+    """
+
+    texts = [(text or "").strip() for text in texts]
+    if not texts:
+        return []
+    if len(texts) == 1:
+        return [fetch_qwen_keywords(texts[0], max_terms, api_key, model_name)]
+
+    user_content = "\n\n".join(
+        f"### {idx}\n{text}" for idx, text in enumerate(texts)
+    )
+    response = _call_generation(
+        KEYWORD_PROMPT + BATCH_PROMPT_SUFFIX, user_content, api_key, model_name
+    )
+    entries = parse_keyword_batch(_extract_raw_text(response), len(texts))
+
+    results = []
+    for idx, text in enumerate(texts):
+        keywords = entries.get(idx)
+        if not keywords and not requery:
+            results.append(None)
+            continue
+        if not keywords:
+            try:
+                keywords = fetch_qwen_keywords(text, max_terms, api_key, model_name)
+            except Exception:
+                results.append(None)
+                continue
+        results.append(keywords[:max_terms])
+    return results
+
+
+def _call_generation(
+    system_prompt: str,
+    user_content: str,
+    api_key: Optional[str],
+    model_name: Optional[str],
+) -> Any:
     key = api_key or DASHSCOPE_API_KEY
     model = model_name or DASHSCOPE_MODEL
-    prompt = (
-        "You analyze news paragraphs to recommend b-roll searches. "
-        "Return a JSON array (max 5 items) of short English keyword strings tuned for protests, press conferences, or military footage. "
-        "Use these heuristics:\n"
-        "- Activist or political groups → '<group name> protest' / 'rally' / 'march'.\n"
-        "- Politicians or public figures → '<name> press conference', '<name> news conference', or '<name> briefing'.\n"
-        "- Military branches or armed forces → '<unit> military drill', '<unit> war footage', '<unit> training'.\n"
-        "- If none apply, still focus on combinations likely to yield news b-roll (crowds, briefings, demonstrations) rather than narrative sentences.\n"
-        "Avoid dates and punctuation; just return the keyword phrases ready for YouTube search."
-    )
     messages = [
-        {'role': 'system', 'content': prompt},
-        {'role': 'user', 'content': text}
+        {'role': 'system', 'content': system_prompt},
+        {'role': 'user', 'content': user_content}
     ]
-    try:
-        response = dashscope.Generation.call(
-            api_key=key,
-            model=model,
-            messages=messages,
-            result_format='text'
-        )
-        if response.status_code != 200:
-            raise LLMQueryStatusError(f"Request failed: {response.status_code}, {response.message}")
-    except Exception as exc:
-        raise exc
-
-    raw_text = _extract_raw_text(response)
-    keywords = parse_keyword_list(raw_text)
-    return keywords[:max_terms]
+    response = dashscope.Generation.call(
+        api_key=key,
+        model=model,
+        messages=messages,
+        result_format='text'
+    )
+    if response.status_code != 200:
+        raise LLMQueryStatusError(f"Request failed: {response.status_code}, {response.message}")
+    return response
 
 
 def parse_keyword_list(value: Optional[str]) -> List[str]:
@@ -82,6 +144,48 @@ def parse_keyword_list(value: Optional[str]) -> List[str]:
     return keywords
 
 
+def parse_keyword_batch(value: Optional[str], count: int) -> Dict[int, List[str]]:
+    """Parse a ``{"<id>": [...]}`` reply into keyword lists keyed by segment id.
+
+    Ids outside ``range(count)`` and entries without usable keywords are dropped,
+    so callers can treat anything missing from the result as malformed.
+    """
+
+    if not value:
+        return {}
+    value = value.strip()
+    try:
+        parsed = json.loads(value)
+    except json.JSONDecodeError:
+        match = re.search(r"\{.*\}", value, re.DOTALL)
+        if not match:
+            return {}
+        try:
+            parsed = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return {}
+    if not isinstance(parsed, dict):
+        return {}
+
+    entries: Dict[int, List[str]] = {}
+    for raw_id, raw_keywords in parsed.items():
+        try:
+            idx = int(str(raw_id).strip().lstrip("#").strip())
+        except ValueError:
+            continue
+        if not 0 <= idx < count:
+            continue
+        if isinstance(raw_keywords, list):
+            keywords = [str(item).strip() for item in raw_keywords if str(item).strip()]
+        elif isinstance(raw_keywords, str):
+            keywords = parse_keyword_list(raw_keywords)
+        else:
+            continue
+        if keywords:
+            entries[idx] = keywords
+    return entries
+
+
 def _extract_raw_text(payload: Any) -> str:
     """Handle DashScope responses regardless of schema (text, dict, or objects)."""
     if payload is None:
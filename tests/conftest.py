@@ -6,6 +6,33 @@ from typing import Callable
 
 import pytest
 
+from auto_clip_lib.config import CACHE_DIR
+
+
+def _real_cache_files() -> dict[str, int]:
+    cache_dir = Path(CACHE_DIR)
+    if not cache_dir.is_dir():
+        return {}
+    return {path.name: path.stat().st_mtime_ns for path in cache_dir.iterdir()}
+
+
+@pytest.fixture(autouse=True, scope="session")
+def real_cache_untouched():
+    """Fail the run if anything (e.g. a leaked thread) wrote to the real cache dir."""
+
+    before = _real_cache_files()
+    yield
+    assert _real_cache_files() == before, f"tests modified {CACHE_DIR}"
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(monkeypatch, tmp_path):
+    """Keep persistent caches out of the real output directory and reset breakers."""
+
+    monkeypatch.setattr("auto_clip_lib.cache._CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr("auto_clip_lib.cache._caches", {})
+    monkeypatch.setattr("auto_clip_lib.resilience._breakers", {})
+
 
 @pytest.fixture()
 def fixtures_dir() -> Path:
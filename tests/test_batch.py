@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from auto_clip_lib.batch import expand_inputs, is_batch, run_batch, unique_stems
+
+_WORKER_STATE: dict = {}
+
+
+def _init_worker(marker: str) -> None:
+    _WORKER_STATE["marker"] = marker
+    _WORKER_STATE["loads"] = _WORKER_STATE.get("loads", 0) + 1
+
+
+def _upper_task(path: str, suffix: str) -> Path:
+    source = Path(path)
+    if "bad" in source.name:
+        raise ValueError(f"cannot read {source.name}")
+    out = source.with_suffix(suffix)
+    out.write_text(
+        f"{source.read_text().upper()} {_WORKER_STATE['marker']} "
+        f"{_WORKER_STATE['loads']} {os.getpid()}"
+    )
+    return out
+
+
+def test_expand_inputs_handles_dirs_globs_and_files(tmp_path):
+    (tmp_path / "a.srt").write_text("a")
+    (tmp_path / "b.SRT").write_text("b")
+    (tmp_path / "notes.txt").write_text("x")
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    (nested / "c.srt").write_text("c")
+
+    assert expand_inputs([str(tmp_path)], [".srt"]) == [tmp_path / "a.srt", tmp_path / "b.SRT"]
+    assert expand_inputs([str(tmp_path / "**" / "*.srt")], [".srt"]) == [
+        tmp_path / "a.srt",
+        nested / "c.srt",
+    ]
+    # Duplicates across arguments are dropped; plain files are kept as given.
+    assert expand_inputs(
+        [str(tmp_path / "a.srt"), str(tmp_path), str(tmp_path / "missing.srt")], [".srt"]
+    ) == [tmp_path / "a.srt", tmp_path / "b.SRT", tmp_path / "missing.srt"]
+
+    assert not is_batch([str(tmp_path / "a.srt")])
+    assert is_batch([str(tmp_path)])
+    assert is_batch([str(tmp_path / "*.srt")])
+    assert is_batch([str(tmp_path / "a.srt"), str(tmp_path / "b.SRT")])
+    assert unique_stems([Path("x/a.srt"), Path("y/a.srt"), Path("b.srt")]) == {
+        "x/a.srt": "a",
+        "y/a.srt": "a_2",
+        "b.srt": "b",
+    }
+
+
+def test_run_batch_writes_outputs_and_manifest(tmp_path):
+    inputs = []
+    for name in ("one", "two", "bad", "three"):
+        path = tmp_path / f"{name}.srt"
+        path.write_text(name)
+        inputs.append(path)
+    manifest_path = tmp_path / "out" / "manifest.json"
+    logs: list[str] = []
+
+    manifest = run_batch(
+        inputs,
+        _upper_task,
+        task_args=(".out",),
+        workers=2,
+        initializer=_init_worker,
+        initargs=("warm",),
+        manifest_path=manifest_path,
+        log_func=logs.append,
+    )
+
+    assert json.loads(manifest_path.read_text()) == manifest
+    assert (manifest["total"], manifest["succeeded"], manifest["failed"]) == (4, 3, 1)
+    assert [record["input"] for record in manifest["files"]] == [str(p) for p in inputs]
+    bad = manifest["files"][2]
+    assert bad["status"] == "failed"
+    assert bad["error"] == "ValueError: cannot read bad.srt"
+    for record in manifest["files"]:
+        assert record["seconds"] >= 0
+        if record["status"] == "succeeded":
+            text, marker, loads, pid = Path(record["output"]).read_text().split()
+            assert text == Path(record["input"]).stem.upper()
+            # The initializer ran once per worker process, not once per file.
+            assert (marker, loads) == ("warm", "1")
+            assert int(pid) != os.getpid()
+    assert logs[-1].startswith("→ 3/4 file(s) succeeded.")
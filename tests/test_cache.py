@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from auto_clip_lib.cache import DiskCache, make_key
+
+
+def test_make_key_is_stable_and_order_sensitive():
+    assert make_key("text", "qwen-plus", 1, 5) == make_key("text", "qwen-plus", 1, 5)
+    assert make_key("text", "qwen-plus", 1, 5) != make_key("text", "qwen-plus", 2, 5)
+
+
+def test_disk_cache_counts_hits_and_persists(tmp_path):
+    path = tmp_path / "kw.sqlite3"
+    cache = DiskCache(path, max_bytes=1_000_000)
+    cache.set("a", {"keywords": ["x"], "source": "llm"})
+
+    assert cache.get("a") == {"keywords": ["x"], "source": "llm"}
+    assert cache.get("missing") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    cache.close()
+
+    reopened = DiskCache(path, max_bytes=1_000_000)
+    assert reopened.get("a")["source"] == "llm"
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path / "kw.sqlite3", max_bytes=250, touch_interval=0)
+    payload = "v" * 80
+    cache.set("first", payload)
+    cache.set("second", payload)
+    cache.get("first")
+    cache.set("third", payload)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == payload
+    assert cache.get("third") == payload
+    assert cache.stats()["bytes"] <= 250
+
+
+def test_disk_cache_touches_coarsely_and_tracks_size(tmp_path, monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr("auto_clip_lib.cache.time.time", lambda: now[0])
+    path = tmp_path / "kw.sqlite3"
+    cache = DiskCache(path, max_bytes=1_000, touch_interval=60)
+    cache.set("a", "v" * 100)
+    cache.set("b", "v" * 100)
+    cache.set("a", "v" * 10)  # replacing an entry adjusts the total, not adds to it
+
+    def accessed(key):
+        return cache._conn.execute(
+            "SELECT accessed_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()[0]
+
+    now[0] += 30
+    cache.get("b")
+    assert accessed("b") == 1_000.0  # within touch_interval: no write
+    now[0] += 31
+    cache.get("b")
+    assert accessed("b") == 1_061.0
+
+    assert cache._total == cache.stats()["bytes"]
+    cache.close()
+    reopened = DiskCache(path, max_bytes=1_000)
+    assert reopened._total == reopened.stats()["bytes"]
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import pytest
+import torch
+
+from auto_clip_lib import captions
+
+VOCAB = ["senate", "budget", "vote", "rocket", "launch", "moon", "protest", "city"]
+
+
+class FakeEncoder:
+    """Bag-of-words embeddings over a tiny vocabulary; records what it encodes."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts, convert_to_tensor=False, normalize_embeddings=False):
+        texts = [texts] if isinstance(texts, str) else list(texts)
+        self.calls.append(texts)
+        rows = torch.tensor(
+            [[float(text.lower().split().count(word)) + 0.01 for word in VOCAB] for text in texts]
+        )
+        if normalize_embeddings:
+            rows = torch.nn.functional.normalize(rows, dim=1)
+        return rows
+
+
+@pytest.fixture()
+def encoder(monkeypatch):
+    fake = FakeEncoder()
+    monkeypatch.setattr(captions, "_get_model", lambda: fake)
+    monkeypatch.setattr(captions, "_embedding_cache", type(captions._embedding_cache)())
+    return fake
+
+
+TRANSCRIPT = [
+    {"start": 0.0, "end": 2.0, "text": "The senate will vote on the budget"},
+    {"start": 2.0, "end": 4.0, "text": "A rocket launch toward the moon"},
+    {"start": 4.0, "end": 6.0, "text": "Protest in the city"},
+    {"start": 6.0, "end": 8.0, "text": "Budget vote delayed"},
+]
+
+
+def test_align_passages_ranks_candidates_with_scores(encoder):
+    ranked = captions.align_passages(
+        ["moon rocket launch", "budget vote", "city protest"], TRANSCRIPT, top_k=2
+    )
+
+    assert [row[0]["index"] for row in ranked] == [1, 3, 2]
+    for row in ranked:
+        assert len(row) == 2
+        assert row[0]["score"] >= row[1]["score"]
+        assert row[0]["segment"] is TRANSCRIPT[row[0]["index"]]
+    # One call for the transcript, one batched call for all passages.
+    assert len(encoder.calls) == 2
+
+
+def test_transcript_embeddings_are_cached_by_content(encoder):
+    captions.align_passages(["senate"], TRANSCRIPT)
+    captions.align_passages(["rocket", "moon"], [dict(seg) for seg in TRANSCRIPT], top_k=10)
+    assert encoder.calls == [
+        [seg["text"] for seg in TRANSCRIPT],
+        ["senate"],
+        ["rocket", "moon"],
+    ]
+
+    edited = TRANSCRIPT[:-1] + [{"start": 6.0, "end": 8.0, "text": "Budget passed"}]
+    ranked = captions.align_passages(["budget"], edited, top_k=10)
+    assert encoder.calls[-2] == [seg["text"] for seg in edited]
+    assert len(ranked[0]) == len(edited)
+
+
+def test_find_best_segment_uses_the_top_candidate(encoder):
+    assert captions.find_best_segment("protest city", TRANSCRIPT) is TRANSCRIPT[2]
+    assert captions.find_best_segment("anything", []) is None
+    assert captions.align_passages([], TRANSCRIPT) == []
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from auto_clip_lib.chunk_cache import MappedChunks, open_chunk_cache, write_chunk_cache
+from auto_clip_lib.chunking import chunk_segments
+from auto_clip_lib.config import CHUNK_CACHE, CHUNK_CACHE_BIN
+
+
+def _chunked() -> list[dict]:
+    segments = [
+        {"start": float(idx), "end": idx + 0.5, "text": f"Sentence {idx} über Café. Next"}
+        for idx in range(20)
+    ]
+    return chunk_segments(segments)
+
+
+def test_binary_cache_round_trips_pages(tmp_path):
+    chunked = _chunked()
+
+    path = write_chunk_cache(tmp_path, chunked)
+    assert path.name == CHUNK_CACHE_BIN
+
+    with MappedChunks(path) as cache:
+        assert len(cache) == len(chunked)
+        assert cache.page(0, len(chunked)) == chunked
+        page = cache.page(3, 5)
+        assert page == chunked[3:5]
+        page[0]["video_results"] = []
+        assert "video_results" not in cache.page(3, 4)[0]
+        assert cache.page(len(chunked) - 1, len(chunked) + 10) == chunked[-1:]
+
+
+def test_non_standard_chunks_fall_back_to_json(tmp_path):
+    chunked = [{"text": "raw", "start": 0, "end": 1, "speaker": "A"}]
+
+    path = write_chunk_cache(tmp_path, chunked)
+
+    assert path.name == CHUNK_CACHE
+    assert not (tmp_path / CHUNK_CACHE_BIN).exists()
+    assert open_chunk_cache(tmp_path).page(0, 1) == chunked
+
+
+def test_legacy_json_cache_is_still_readable(tmp_path):
+    chunked = _chunked()
+    (tmp_path / CHUNK_CACHE).write_text(json.dumps(chunked), encoding="utf-8")
+
+    cache = open_chunk_cache(tmp_path)
+
+    assert len(cache) == len(chunked)
+    assert cache.page(1, 2) == chunked[1:2]
+
+
+def test_missing_cache_raises(tmp_path):
+    with pytest.raises(ValueError, match="cache missing"):
+        open_chunk_cache(tmp_path)
@@ -40,3 +40,142 @@ def test_chunk_segments_returns_original_when_no_sentences():
     ]
     result = chunk_segments(segments)
     assert result == segments
+
+
+def _legacy_sentence_ranges(text: str) -> list[tuple[int, int]]:
+    from auto_clip_lib.chunking import SENTENCE_ENDINGS, TRAILING_CHARS
+
+    ranges = []
+    start = 0
+    i = 0
+    while i < len(text):
+        if text[i] in SENTENCE_ENDINGS:
+            end = i + 1
+            while end < len(text) and text[end] in TRAILING_CHARS:
+                end += 1
+            ranges.append((start, end))
+            while end < len(text) and text[end].isspace():
+                end += 1
+            start = i = end
+        else:
+            i += 1
+    if start < len(text):
+        ranges.append((start, len(text)))
+    return ranges
+
+
+def _legacy_chunk_segments(segments: list[dict], min_sentences=2, max_sentences=3):
+    """The original quadratic chunker, kept as an oracle."""
+
+    parts, spans, cursor = [], [], 0
+    for idx, seg in enumerate(segments):
+        text = " ".join((seg.get("text") or "").split())
+        if not text:
+            continue
+        if parts:
+            parts.append(" ")
+            cursor += 1
+        spans.append((cursor, cursor + len(text), idx))
+        parts.append(text)
+        cursor += len(text)
+    full_text = "".join(parts)
+
+    sentences = []
+    for start_char, end_char in _legacy_sentence_ranges(full_text):
+        snippet = full_text[start_char:end_char].strip()
+        indices = [
+            idx
+            for seg_start, seg_end, idx in spans
+            if seg_end > start_char and seg_start < end_char
+        ]
+        if snippet and indices:
+            sentences.append(
+                {
+                    "text": snippet,
+                    "start": segments[indices[0]]["start"],
+                    "end": segments[indices[-1]]["end"],
+                    "segment_indices": indices,
+                }
+            )
+    if not sentences:
+        return segments
+
+    groups, current = [], []
+    for sentence in sentences:
+        current.append(sentence)
+        if len(current) >= max_sentences:
+            groups.append(current)
+            current = []
+    if current:
+        if len(current) < min_sentences and groups:
+            groups[-1].extend(current)
+        else:
+            groups.append(current)
+    return [
+        {
+            "text": " ".join(sentence["text"] for sentence in group).strip(),
+            "start": group[0]["start"],
+            "end": group[-1]["end"],
+            "segment_indices": [i for sentence in group for i in sentence["segment_indices"]],
+            "sentence_count": len(group),
+        }
+        for group in groups
+    ]
+
+
+def _random_segments(rng, count: int) -> list[dict]:
+    pieces = ["word", "Hello", "。", ".", "?!", "…", ";", '"', "’", ")", " ", "  ", "", "中文"]
+    return [
+        _make_segment("".join(rng.choices(pieces, k=rng.randint(0, 8))), idx, idx + 1)
+        for idx in range(count)
+    ]
+
+
+def test_chunk_segments_matches_original_algorithm():
+    import random
+
+    rng = random.Random(11)
+    for _ in range(300):
+        segments = _random_segments(rng, rng.randint(1, 25))
+        min_sentences = rng.randint(1, 3)
+        max_sentences = rng.randint(min_sentences, 4)
+
+        expected = _legacy_chunk_segments(segments, min_sentences, max_sentences)
+
+        assert chunk_segments(segments, min_sentences, max_sentences) == expected
+
+
+def test_iter_chunks_streams_before_input_ends():
+    from auto_clip_lib.chunking import iter_chunks
+
+    consumed = []
+
+    def _segments():
+        for idx in range(100):
+            consumed.append(idx)
+            yield _make_segment(f"Sentence {idx}.", idx, idx + 1)
+
+    chunks = iter_chunks(_segments())
+    first = next(chunks)
+
+    assert first["segment_indices"] == [0, 1, 2]
+    assert len(consumed) < 10
+    assert len([first, *chunks]) == 33
+
+
+def test_unpunctuated_captions_stay_linear():
+    import time
+
+    words = "we are live from the capitol where the senate is voting now".split()
+    texts = [" ".join(words[idx % 7 : idx % 7 + 5]) for idx in range(50_000)]
+    segments = [_make_segment(text, idx, idx + 1) for idx, text in enumerate(texts[:2_000])]
+    segments[700]["text"] += "."
+    assert chunk_segments(segments) == _legacy_chunk_segments(segments)
+
+    many = [_make_segment(text, idx, idx + 1) for idx, text in enumerate(texts)]
+    started = time.perf_counter()
+    chunked = chunk_segments(many)
+    # Rescanning the unfinished sentence per cue took over a minute here.
+    assert time.perf_counter() - started < 5
+    assert len(chunked) == 1
+    assert chunked[0]["segment_indices"] == list(range(len(many)))
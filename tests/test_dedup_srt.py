@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+import random
+import sys
+
+import pysrt
+
+import dedup_srt
+from auto_clip_lib.srt import Cue, iter_srt, write_srt
+
+WORDS = "we are live from the capitol where the senate is voting now".split()
+
+
+def _legacy_longest_overlap(prev_tokens, curr_tokens):
+    max_len = min(len(prev_tokens), len(curr_tokens))
+    for size in range(max_len, 0, -1):
+        if prev_tokens[-size:] == curr_tokens[:size]:
+            return size
+    return 0
+
+
+def _rolling_captions(count: int, seed: int) -> list[Cue]:
+    """Auto-caption style cues: each repeats a tail of the previous one."""
+
+    rng = random.Random(seed)
+    cues = []
+    previous: list[str] = []
+    for idx in range(count):
+        keep = previous[-rng.randint(0, len(previous)) :] if previous else []
+        tokens = keep + rng.choices(WORDS, k=rng.randint(0, 6))
+        if rng.random() < 0.1:
+            tokens = list(previous)  # pure repeat
+        text = "\n".join(" ".join(tokens[i : i + 4]) for i in range(0, len(tokens), 4))
+        cues.append(Cue(idx * 1000, idx * 1000 + 1500, text))
+        previous = tokens
+    return cues
+
+
+def test_longest_overlap_matches_brute_force():
+    rng = random.Random(7)
+    for _ in range(2000):
+        prev = rng.choices(range(3), k=rng.randint(0, 12))
+        curr = rng.choices(range(3), k=rng.randint(0, 12))
+        assert dedup_srt._longest_overlap(prev, curr) == _legacy_longest_overlap(prev, curr)
+
+
+def test_deduplicate_matches_legacy_quadratic_overlap(monkeypatch):
+    cues = _rolling_captions(400, seed=1)
+    subs = pysrt.SubRipFile(
+        items=[
+            pysrt.SubRipItem(index=idx, start=cue.start_ms, end=cue.end_ms, text=cue.text)
+            for idx, cue in enumerate(cues, start=1)
+        ]
+    )
+
+    cleaned = [(item.start.ordinal, item.text) for item in dedup_srt.deduplicate_subtitles(subs)]
+    monkeypatch.setattr(dedup_srt, "_longest_overlap", _legacy_longest_overlap)
+    legacy = [(item.start.ordinal, item.text) for item in dedup_srt.deduplicate_subtitles(cues)]
+
+    assert cleaned == legacy
+    assert len(cleaned) < len(cues)
+
+
+def test_stream_mode_writes_same_file(tmp_path, monkeypatch):
+    source = tmp_path / "captions.srt"
+    write_srt(_rolling_captions(300, seed=2), source)
+    batch_out = tmp_path / "batch.srt"
+    stream_out = tmp_path / "stream.srt"
+
+    monkeypatch.setattr(sys, "argv", ["dedup_srt.py", str(source), "-o", str(batch_out)])
+    dedup_srt.main()
+    monkeypatch.setattr(
+        sys, "argv", ["dedup_srt.py", str(source), "-o", str(stream_out), "--stream"]
+    )
+    dedup_srt.main()
+
+    assert stream_out.read_bytes() == batch_out.read_bytes()
+    assert list(iter_srt(stream_out))
+
+
+def test_batch_mode_dedups_a_directory(tmp_path, monkeypatch):
+    source_dir = tmp_path / "captions"
+    source_dir.mkdir()
+    for seed in range(3):
+        write_srt(_rolling_captions(50, seed=seed), source_dir / f"talk{seed}.srt")
+    (source_dir / "talk0.dedup.srt").write_text("stale output from an earlier run")
+    out_dir = tmp_path / "clean"
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["dedup_srt.py", str(source_dir), "-o", str(out_dir), "--workers", "2", "--stream"],
+    )
+    dedup_srt.main()
+
+    manifest = json.loads((out_dir / "dedup_manifest.json").read_text())
+    assert (manifest["total"], manifest["failed"]) == (3, 0)
+    for seed in range(3):
+        expected = [
+            (cue.start_ms, cue.text)
+            for cue in dedup_srt.iter_deduplicated(_rolling_captions(50, seed=seed))
+        ]
+        written = list(iter_srt(out_dir / f"talk{seed}.dedup.srt"))
+        assert [(cue.start_ms, cue.text) for cue in written] == expected
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from auto_clip_lib import downloads
+
+
+def _fake_download(calls: list[str], delay: float = 0.0, active=None, peak=None):
+    lock = threading.Lock()
+
+    def _download(result, output_dir):
+        url = result["url"]
+        with lock:
+            calls.append(url)
+            if active is not None:
+                active[url.split("/")[2]] = active.get(url.split("/")[2], 0) + 1
+                peak[0] = max(peak[0], max(active.values()))
+        time.sleep(delay)
+        with lock:
+            if active is not None:
+                active[url.split("/")[2]] -= 1
+        if "broken" in url:
+            return None
+        path = Path(output_dir) / f"{result['id']}.mp4"
+        path.write_bytes(b"video")
+        return str(path)
+
+    return _download
+
+
+def test_download_many_dedupes_urls_and_reports_per_item(monkeypatch, tmp_path):
+    calls: list[str] = []
+    trims: list[tuple] = []
+    monkeypatch.setattr(downloads, "SECTION_DOWNLOADS", False)
+    monkeypatch.setattr(downloads, "download_video", _fake_download(calls, 0.02))
+    monkeypatch.setattr(
+        downloads, "trim_clip", lambda src, start, end, out: trims.append((src, out))
+    )
+    items = [
+        ({"id": "a", "url": "https://host/a"}, None, None),
+        ({"id": "a", "url": "https://host/a"}, 1.0, 2.0),
+        ({"id": "a", "url": "https://host/a"}, 1.0, 2.0),
+        ({"id": "b", "url": "https://host/broken"}, None, None),
+        ({"id": "c", "url": "https://host/c"}, 5.0, 3.0),
+    ]
+
+    outcomes = downloads.download_many(items, tmp_path)
+
+    assert calls.count("https://host/a") == 1
+    assert outcomes[0] == (tmp_path / "a.mp4", False)
+    assert outcomes[1] == outcomes[2]
+    assert outcomes[1][1] is True
+    assert len(trims) == 1
+    assert isinstance(outcomes[3], RuntimeError)
+    assert isinstance(outcomes[4], ValueError)
+
+
+def test_download_many_caps_transfers_per_host(monkeypatch, tmp_path):
+    calls: list[str] = []
+    active: dict[str, int] = {}
+    peak = [0]
+    monkeypatch.setattr(
+        downloads, "download_video", _fake_download(calls, 0.05, active, peak)
+    )
+    items = [
+        ({"id": f"v{idx}", "url": f"https://same.host/v{idx}"}, None, None)
+        for idx in range(6)
+    ]
+
+    started = time.perf_counter()
+    outcomes = downloads.download_many(items, tmp_path, max_workers=6, per_host=2)
+    elapsed = time.perf_counter() - started
+
+    assert all(not isinstance(outcome, Exception) for outcome in outcomes)
+    assert peak[0] == 2
+    assert elapsed >= 0.15
+
+
+def test_download_many_prefers_sections(monkeypatch, tmp_path):
+    calls: list[str] = []
+    monkeypatch.setattr(downloads, "SECTION_DOWNLOADS", True)
+    monkeypatch.setattr(downloads, "download_video", _fake_download(calls))
+    monkeypatch.setattr(
+        downloads,
+        "download_section",
+        lambda result, start, end, out: Path(out).write_bytes(b"clip") > 0,
+    )
+
+    outcomes = downloads.download_many(
+        [({"id": "a", "url": "https://host/a"}, 1.0, 4.0)], tmp_path
+    )
+
+    assert calls == []
+    assert outcomes[0] == (tmp_path / "trimmed" / "a_1.00_4.00.mp4", True)
+
+
+def test_section_fallback_is_logged_only_after_an_attempt(monkeypatch, tmp_path, caplog):
+    attempts: list[str] = []
+
+    def _no_section(result, start, end, out):
+        attempts.append(result["url"])
+        return False
+
+    monkeypatch.setattr(downloads, "download_section", _no_section)
+    clip_path = tmp_path / "clip.mp4"
+    result = {"id": "a", "url": "https://host/a"}
+
+    with caplog.at_level("INFO", logger=downloads.LOGGER.name):
+        monkeypatch.setattr(downloads, "SECTION_DOWNLOADS", False)
+        assert not downloads._try_section(result, 1.0, 2.0, clip_path)
+        assert attempts == [] and not caplog.records
+
+        monkeypatch.setattr(downloads, "SECTION_DOWNLOADS", True)
+        assert not downloads._try_section(result, 1.0, 2.0, clip_path)
+    assert attempts == ["https://host/a"]
+    assert "falling back to full download" in caplog.text
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from auto_clip_lib import http_client
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        return None
+
+
+@pytest.fixture()
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_get_reuses_keep_alive_connection(local_server, monkeypatch):
+    monkeypatch.setattr(http_client, "_sessions", {})
+
+    for _ in range(3):
+        assert http_client.http_get(f"{local_server}/search").json() == {"ok": True}
+
+    stats = http_client.pool_stats()[local_server]
+    assert stats["requests"] == 3
+    assert stats["connections_opened"] == 1
+    assert http_client.get_session(local_server + "/other") is http_client.get_session(
+        local_server
+    )
+    http_client.close_sessions()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from auto_clip_lib.jobs import JobManager
+
+
+@pytest.fixture()
+def manager(tmp_path):
+    jobs = JobManager(tmp_path / "jobs", max_workers=2)
+    yield jobs
+    jobs.shutdown()
+
+
+def _wait(manager: JobManager, job_id: str) -> list[dict]:
+    return [event for event in manager.events(job_id, heartbeat=0.05) if event]
+
+
+def test_job_streams_progress_and_persists_result(manager, tmp_path):
+    def _work(ctx, count):
+        ctx.log("starting")
+        for idx in range(count):
+            ctx.segment(idx, {"text": f"seg {idx}"})
+        return {"segments": count}
+
+    job_id = manager.submit("transcript", _work, 3)
+    events = _wait(manager, job_id)
+
+    assert [event["type"] for event in events] == [
+        "running",
+        "log",
+        "segment",
+        "segment",
+        "segment",
+        "succeeded",
+    ]
+    assert [event["seq"] for event in events] == list(range(1, 7))
+    state = manager.get(job_id)
+    assert state["status"] == "succeeded"
+    assert state["progress"]["done"] == 3
+    assert state["result"] == {"segments": 3}
+    on_disk = json.loads((tmp_path / "jobs" / f"{job_id}.json").read_text())
+    assert on_disk["segments"][2]["segment"] == {"text": "seg 2"}
+
+
+def test_job_failure_is_reported(manager):
+    def _boom(ctx):
+        raise ValueError("bad input")
+
+    job_id = manager.submit("links", _boom)
+    events = _wait(manager, job_id)
+
+    assert events[-1] == {"seq": 2, "type": "failed", "data": {"error": "bad input"}}
+    assert manager.get(job_id)["error"] == "bad input"
+
+
+def test_events_resume_after_last_seen(manager):
+    release = threading.Event()
+
+    def _work(ctx):
+        ctx.progress(1, 2)
+        release.wait(5)
+        ctx.progress(2, 2)
+        return "done"
+
+    job_id = manager.submit("download_all", _work)
+    stream = manager.events(job_id, heartbeat=0.05)
+    first = [next(stream), next(stream)]
+    release.set()
+    rest = [event for event in manager.events(job_id, after=first[-1]["seq"]) if event]
+
+    assert [event["type"] for event in first] == ["running", "progress"]
+    assert [event["type"] for event in rest] == ["progress", "succeeded"]
+
+
+def test_unfinished_jobs_from_previous_run_are_failed(tmp_path):
+    state_dir = tmp_path / "jobs"
+    state_dir.mkdir()
+    (state_dir / "abc123.json").write_text(
+        json.dumps({"id": "abc123", "status": "running", "result": None, "error": None})
+    )
+    manager = JobManager(state_dir)
+    try:
+        state = manager.get("abc123")
+        events = list(manager.events("abc123"))
+    finally:
+        manager.shutdown()
+
+    assert state["status"] == "failed"
+    assert events[0]["type"] == "failed"
+    assert manager.get("../secret") is None
+
+
+def test_events_are_logged_between_status_snapshots(manager, tmp_path):
+    release = threading.Event()
+    logged = threading.Event()
+
+    def _work(ctx):
+        ctx.log("halfway")
+        ctx.segment(0, {"text": "seg 0"})
+        logged.set()
+        release.wait(5)
+        return "done"
+
+    job_id = manager.submit("stream", _work)
+    assert logged.wait(5)
+    state_path = tmp_path / "jobs" / f"{job_id}.json"
+    events_path = tmp_path / "jobs" / f"{job_id}.events.jsonl"
+
+    snapshot = json.loads(state_path.read_text())
+    assert (snapshot["status"], snapshot["messages"]) == ("running", [])
+    assert [json.loads(line)["type"] for line in events_path.read_text().splitlines()] == [
+        "log",
+        "segment",
+    ]
+    # A fresh process rebuilds the interrupted job from snapshot + event log.
+    recovered = JobManager(tmp_path / "jobs")._load(job_id)
+    assert recovered["status"] == "failed"
+    assert recovered["messages"] == ["halfway"]
+    assert recovered["segments"] == [{"index": 0, "segment": {"text": "seg 0"}}]
+
+    release.set()
+    _wait(manager, job_id)
+    assert json.loads(state_path.read_text())["messages"] == ["halfway"]
+    assert not events_path.exists()
+
+
+def test_finished_jobs_are_evicted_after_ttl(tmp_path):
+    now = [1000.0]
+    manager = JobManager(tmp_path / "jobs", ttl=60, clock=lambda: now[0])
+    try:
+        old = manager.submit("links", lambda ctx: "old")
+        _wait(manager, old)
+        now[0] += 61
+        fresh = manager.submit("links", lambda ctx: "fresh")
+        _wait(manager, fresh)
+    finally:
+        manager.shutdown()
+
+    assert old not in manager._jobs and fresh in manager._jobs
+    assert manager.get(old)["result"] == "old"
+    assert list(manager.events(old))[-1]["type"] == "succeeded"
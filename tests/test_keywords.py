@@ -24,7 +24,7 @@ def test_extract_keywords_fallback_handles_chinese(monkeypatch):
         class FakeTokenizer:
             tgt_lang = None
 
-            def __call__(self, text, return_tensors="pt"):
+            def __call__(self, text, return_tensors="pt", **_kwargs):
                 self.last_input = text
                 return FakeInputs({"input_ids": torch.ones((1, 3), dtype=torch.long)})
 
@@ -43,6 +43,204 @@ def test_extract_keywords_fallback_handles_chinese(monkeypatch):
     monkeypatch.setattr(kw, "fetch_qwen_keywords", fake_fetch)
     monkeypatch.setattr(kw, "_get_model", lambda: DummyModel())
     monkeypatch.setattr(kw, "_get_translator", fake_translator)
+    monkeypatch.setattr(kw, "_translation_memo", kw.OrderedDict())
 
     result = kw.extract_keywords(segments)
     assert result[0]["keywords"][0] == "translated keyword"
+
+
+def test_extract_keywords_concurrent_preserves_order(monkeypatch):
+    import threading
+    import time
+
+    segments = [{"text": f"segment{idx} text"} for idx in range(8)]
+    threads = set()
+
+    def fake_fetch(text):
+        threads.add(threading.get_ident())
+        idx = int(text.split()[0].removeprefix("segment"))
+        time.sleep(0.01 * (8 - idx))
+        if idx % 3 == 0:
+            raise RuntimeError("LLM unavailable")
+        return [f"{text.split()[0]} protest"]
+
+    class EchoModel:
+        def extract_keywords(self, docs, **_kwargs):
+            batch = [[(f"{doc.split()[0]} local", 0.5)] for doc in docs]
+            return batch[0] if len(batch) == 1 else batch
+
+    monkeypatch.setattr(kw, "fetch_qwen_keywords", fake_fetch)
+    monkeypatch.setattr(kw, "_get_model", lambda: EchoModel())
+
+    result = kw.extract_keywords(segments, max_workers=4)
+
+    assert len(threads) > 1
+    for idx, seg in enumerate(result):
+        if idx % 3 == 0:
+            assert seg["_keyword_source"] == "keybert"
+            assert seg["keywords"] == [f"segment{idx} local"]
+        else:
+            assert seg["_keyword_source"] == "llm"
+            assert seg["keywords"] == [f"segment{idx} protest"]
+
+
+def test_extract_keywords_batches_llm_prompts(monkeypatch):
+    segments = [{"text": f"segment{idx} text"} for idx in range(5)]
+    batches = []
+
+    def fake_batch(texts, requery=True):
+        batches.append(list(texts))
+        return [[f"{text.split()[0]} rally"] for text in texts]
+
+    def fake_fetch(text):
+        batches.append([text])
+        return [f"{text.split()[0]} rally"]
+
+    monkeypatch.setattr(kw, "fetch_qwen_keywords_batch", fake_batch)
+    monkeypatch.setattr(kw, "fetch_qwen_keywords", fake_fetch)
+
+    result = kw.extract_keywords(segments, max_workers=1, batch_size=2)
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [seg["keywords"] for seg in result] == [
+        [f"segment{idx} rally"] for idx in range(5)
+    ]
+    assert all(seg["_keyword_source"] == "llm" for seg in result)
+
+
+def test_extract_keywords_reuses_cached_results(monkeypatch):
+    calls = []
+
+    def fake_fetch(text):
+        calls.append(text)
+        if text.startswith("local"):
+            raise RuntimeError("LLM unavailable")
+        return ["cached rally"]
+
+    class EchoModel:
+        def extract_keywords(self, docs, **_kwargs):
+            calls.append(f"keybert:{docs[0]}")
+            return [("local keyword", 0.5)]
+
+    monkeypatch.setattr(kw, "fetch_qwen_keywords", fake_fetch)
+    monkeypatch.setattr(kw, "_get_model", lambda: EchoModel())
+
+    first = kw.extract_keywords([{"text": "llm text"}, {"text": "local text"}])
+    second = kw.extract_keywords([{"text": "llm text"}, {"text": "local text"}])
+
+    assert calls == ["llm text", "local text", "keybert:local text", "local text"]
+    assert [seg["_keyword_source"] for seg in second] == ["llm", "keybert"]
+    assert [seg["keywords"] for seg in second] == [seg["keywords"] for seg in first]
+
+
+def test_extract_keywords_batches_keybert_fallback_by_language(monkeypatch):
+    segments = [
+        {"text": "English one"},
+        {"text": "中文段落一"},
+        {"text": "English two"},
+        {"text": "English one"},
+    ]
+    batches = []
+
+    class BatchModel:
+        def extract_keywords(self, docs, vectorizer=None, **_kwargs):
+            batches.append((list(docs), vectorizer is not None))
+            batch = [[(f"{doc} kw", 0.5)] for doc in docs]
+            return batch[0] if len(batch) == 1 else batch
+
+    def fake_fetch(text):
+        raise RuntimeError("LLM unavailable")
+
+    monkeypatch.setattr(kw, "fetch_qwen_keywords", fake_fetch)
+    monkeypatch.setattr(kw, "_get_model", lambda: BatchModel())
+    monkeypatch.setattr(kw, "_translate_keywords", lambda keywords: {})
+
+    result = kw.extract_keywords(segments, max_workers=1)
+
+    assert batches == [
+        (["English one", "English two"], False),
+        (["中文段落一"], True),
+    ]
+    assert [seg["keywords"] for seg in result] == [
+        ["English one kw"],
+        ["中文段落一 kw"],
+        ["English two kw"],
+        ["English one kw"],
+    ]
+    assert all(seg["_keyword_source"] == "keybert" for seg in result)
+
+
+def test_translate_keywords_dedupes_batches_and_memoizes(monkeypatch):
+    batches = []
+
+    def fake_batch(keywords):
+        batches.append(list(keywords))
+        return [f"english {idx}" for idx, _ in enumerate(keywords)]
+
+    monkeypatch.setattr(kw, "_translate_batch", fake_batch)
+    monkeypatch.setattr(kw, "_translation_memo", kw.OrderedDict())
+
+    first = kw._translate_keywords(["北约", "protest", "哈马斯", "北约"])
+    kw._translation_memo.clear()
+    second = kw._translate_keywords(["哈马斯", "北约", "新词"])
+
+    assert first == {"北约": "english 0", "哈马斯": "english 1"}
+    assert second == {"哈马斯": "english 1", "北约": "english 0", "新词": "english 0"}
+    assert batches == [["北约", "哈马斯"], ["新词"]]
+
+
+def test_extract_keywords_skips_llm_when_circuit_open(monkeypatch):
+    calls = []
+
+    def fake_fetch(text):
+        calls.append(text)
+        raise RuntimeError("Invalid API-key provided")
+
+    class BatchModel:
+        def extract_keywords(self, docs, **_kwargs):
+            batch = [[("local", 0.5)] for _ in docs]
+            return batch[0] if len(batch) == 1 else batch
+
+    monkeypatch.setattr(kw, "fetch_qwen_keywords", fake_fetch)
+    monkeypatch.setattr(kw, "_get_model", lambda: BatchModel())
+    monkeypatch.setattr(kw, "LLM_BREAKER_FAILURE_THRESHOLD", 2)
+
+    segments = [{"text": f"segment {idx}"} for idx in range(6)]
+    result = kw.extract_keywords(segments, max_workers=1)
+
+    assert len(calls) == 2
+    assert all(seg["_keyword_source"] == "keybert" for seg in result)
+    metrics = kw.keyword_metrics()["llm_breaker"]
+    assert metrics["state"] == "open"
+    assert metrics["short_circuited"] == 4
+
+
+def test_batch_requeries_go_through_the_breaker(monkeypatch):
+    calls = []
+
+    def fake_batch(texts, requery=True):
+        assert requery is False
+        return [None] * len(texts)  # reply parsed, but every entry is missing
+
+    def fake_fetch(text):
+        calls.append(text)
+        raise RuntimeError("DashScope overloaded")
+
+    class BatchModel:
+        def extract_keywords(self, docs, **_kwargs):
+            batch = [[("local", 0.5)] for _ in docs]
+            return batch[0] if len(batch) == 1 else batch
+
+    monkeypatch.setattr(kw, "fetch_qwen_keywords_batch", fake_batch)
+    monkeypatch.setattr(kw, "fetch_qwen_keywords", fake_fetch)
+    monkeypatch.setattr(kw, "_get_model", lambda: BatchModel())
+    monkeypatch.setattr(kw, "LLM_BREAKER_FAILURE_THRESHOLD", 2)
+
+    segments = [{"text": f"segment {idx}"} for idx in range(6)]
+    result = kw.extract_keywords(segments, max_workers=1, batch_size=6)
+
+    assert len(calls) == 2
+    assert all(seg["_keyword_source"] == "keybert" for seg in result)
+    metrics = kw.keyword_metrics()["llm_breaker"]
+    assert metrics["state"] == "open"
+    assert metrics["short_circuited"] == 4
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from auto_clip_lib import media
+
+
+def _fake_run(commands: list[list[str]], write: bytes | None):
+    def _run(cmd, **_kwargs):
+        commands.append(cmd)
+        if write is not None:
+            with open(cmd[-1] if cmd[0] == "ffmpeg" else cmd[-2], "wb") as fh:
+                fh.write(write)
+        return SimpleNamespace(returncode=0 if write else 1)
+
+    return _run
+
+
+def test_download_section_uses_ytdlp_sections(monkeypatch, tmp_path):
+    commands: list[list[str]] = []
+    monkeypatch.setattr(media.subprocess, "run", _fake_run(commands, b"clip"))
+    monkeypatch.setattr(media, "ytdlp_cmd", lambda: "yt-dlp")
+    out = tmp_path / "clip.mp4"
+
+    ok = media.download_section(
+        {"url": "https://www.youtube.com/watch?v=abc"}, 10.0, 20.0, str(out)
+    )
+
+    assert ok
+    assert commands[0][0] == "yt-dlp"
+    section = commands[0][commands[0].index("--download-sections") + 1]
+    assert section == f"*10.0-{10.0 + 10.0 + media.CLIP_BUFFER}"
+
+
+def test_download_section_streams_direct_files_with_ffmpeg(monkeypatch, tmp_path):
+    commands: list[list[str]] = []
+    monkeypatch.setattr(media.subprocess, "run", _fake_run(commands, b"clip"))
+    out = tmp_path / "clip.mp4"
+
+    ok = media.download_section(
+        {"download_url": "https://nasa.example/launch.mp4"}, 5.0, 6.0, str(out)
+    )
+
+    assert ok
+    assert commands[0][:4] == ["ffmpeg", "-y", "-ss", "5.0"]
+    assert "https://nasa.example/launch.mp4" in commands[0]
+
+
+def test_download_section_reports_failure(monkeypatch, tmp_path):
+    monkeypatch.setattr(media.subprocess, "run", _fake_run([], None))
+
+    assert not media.download_section(
+        {"url": "https://example.com/watch"}, 0.0, 1.0, str(tmp_path / "x.mp4")
+    )
@@ -32,3 +32,212 @@ def test_pipeline_with_docx(fixtures_dir, fake_search, stub_llm):
     assert segments[0]["text"].startswith("First English paragraph")
     assert segments[1]["text"].startswith("It also references")
     assert segments[2]["text"].startswith("Fourth English paragraph")
+
+
+def _make_tracking_search(label_hits: dict, tracker: dict):
+    import threading
+    import time
+
+    lock = threading.Lock()
+
+    def _search(query: str, limit: int) -> list[dict]:
+        with lock:
+            tracker["active"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["active"])
+        time.sleep(0.01)
+        with lock:
+            tracker["active"] -= 1
+        return list(label_hits.get(query.split()[0], []))
+
+    return _search
+
+
+def test_enrich_segments_parallel_matches_serial(stub_llm, monkeypatch):
+    from auto_clip_lib.pipeline import enrich_segments
+
+    monkeypatch.setattr("auto_clip_lib.search_cache.SEARCH_CACHE_MODE", "off")
+
+    hits = {
+        "alpha": [{"id": "a", "source": "stub"}],
+        "gamma": [{"id": "g", "source": "stub"}],
+    }
+    texts = ["alpha one.", "beta two.", "gamma three.", "delta four."]
+
+    def run(max_workers):
+        tracker = {"active": 0, "peak": 0}
+        logs: list[str] = []
+        segments = [{"text": text, "start": 0, "end": 1} for text in texts]
+        result = enrich_segments(
+            segments,
+            log_func=logs.append,
+            search_providers=(
+                (_make_tracking_search(hits, tracker), "StubTube"),
+                (_make_tracking_search(hits, tracker), "StubArchive"),
+            ),
+            max_workers=max_workers,
+        )
+        return result, logs, tracker["peak"]
+
+    serial, serial_logs, serial_peak = run(1)
+    parallel, parallel_logs, parallel_peak = run(4)
+
+    assert serial_peak == 1
+    assert parallel_peak > 1
+    assert parallel_logs == serial_logs
+    assert [seg["video_results"] for seg in parallel] == [
+        seg["video_results"] for seg in serial
+    ]
+    assert parallel[0]["video_results"] == hits["alpha"] * 2
+    assert "StubTube returns no result for beta two." in parallel_logs
+
+
+def test_search_scheduler_enforces_provider_cap():
+    from auto_clip_lib.scheduler import SearchScheduler
+
+    tracker = {"active": 0, "peak": 0}
+    search = _make_tracking_search({}, tracker)
+    with SearchScheduler(8, provider_limits={"Slow": 2}) as scheduler:
+        futures = [
+            scheduler.submit(scheduler.call, "Slow", search, f"q{idx}", 1)
+            for idx in range(8)
+        ]
+        for future in futures:
+            future.result()
+    assert tracker["peak"] == 2
+
+
+def test_single_flight_memo_is_bounded():
+    from auto_clip_lib.scheduler import SingleFlight
+
+    calls: list[str] = []
+
+    def fetch(query: str) -> str:
+        calls.append(query)
+        return query.upper()
+
+    flights = SingleFlight(max_memo=2)
+    for query in ("a", "b", "a", "c", "b", "a"):
+        assert flights.do(query, fetch, query) == query.upper()
+
+    # "a" was refreshed before "c" arrived, so "b" was the one evicted.
+    assert calls == ["a", "b", "c", "b", "a"]
+    assert flights.saved == 1
+    assert len(flights._calls) == 2
+
+
+def test_search_scheduler_counts_only_dispatched_requests_as_wasted():
+    import threading
+
+    from auto_clip_lib.scheduler import SearchScheduler
+
+    gate = threading.Event()
+    started = {query: threading.Event() for query in ("shared", "own")}
+
+    def search(query: str, limit: int) -> list[dict]:
+        started[query].set()
+        gate.wait(5)
+        return [{"id": query}]
+
+    with SearchScheduler(4) as scheduler:
+        owner = scheduler.submit(scheduler.call, "P", search, "shared", 1)
+        assert started["shared"].wait(5)
+        futures, stop = scheduler.speculate("P", search, ["own", "shared"], 1)
+        assert started["own"].wait(5)
+        # "shared" joined the in-flight call above; only "own" sent a request.
+        scheduler.abandon(futures, stop)
+        gate.set()
+        assert owner.result() == [{"id": "shared"}]
+
+    assert scheduler.wasted_requests == 1
+    assert scheduler.single_flight.saved == 1
+
+
+def test_enrich_segments_speculative_takes_first_non_empty(stub_llm, monkeypatch):
+    import threading
+
+    from auto_clip_lib.pipeline import enrich_segments
+
+    monkeypatch.setattr("auto_clip_lib.search_cache.SEARCH_CACHE_MODE", "off")
+
+    text = "beta two three four five six"
+    snippet = "beta two three four five"
+    full_started = threading.Event()
+
+    def search(query: str, limit: int) -> list[dict]:
+        if query == snippet:
+            full_started.wait(1)
+            return [{"id": "snippet"}]
+        if query == text:
+            full_started.set()
+            return [{"id": "full"}]
+        return []
+
+    def run(speculative):
+        logs: list[str] = []
+        segments = [{"text": text, "start": 0, "end": 1}]
+        result = enrich_segments(
+            segments,
+            log_func=logs.append,
+            search_providers=((search, "YouTube"),),
+            max_workers=4,
+            speculative=speculative,
+        )
+        return result[0], logs
+
+    speculative_seg, speculative_logs = run(True)
+    full_started.clear()
+    serial_seg, serial_logs = run(False)
+
+    assert speculative_seg["queries_tried"] == ["beta protest", snippet, text]
+    assert speculative_seg["video_results"] == serial_seg["video_results"]
+    assert speculative_seg["video_results"] == [{"id": "snippet"}]
+    assert speculative_logs[:-1] == serial_logs
+    assert speculative_logs[-1] == "→ Speculative search wasted 1 request(s)."
+
+
+def test_enrich_segments_single_flight_shares_duplicate_queries(stub_llm, monkeypatch):
+    import threading
+    import time
+
+    from auto_clip_lib.pipeline import enrich_segments
+
+    monkeypatch.setattr("auto_clip_lib.search_cache.SEARCH_CACHE_MODE", "off")
+    calls: list[str] = []
+    lock = threading.Lock()
+
+    def search(query: str, limit: int) -> list[dict]:
+        with lock:
+            calls.append(query)
+        time.sleep(0.02)
+        return [{"id": query}]
+
+    logs: list[str] = []
+    segments = [{"text": "Hamas rally today.", "start": idx, "end": idx + 1} for idx in range(4)]
+    result = enrich_segments(
+        segments,
+        log_func=logs.append,
+        search_providers=((search, "StubTube"),),
+        max_workers=4,
+    )
+
+    assert calls == ["Hamas protest"]
+    assert all(seg["video_results"] == [{"id": "Hamas protest"}] for seg in result)
+    assert "→ Single-flight saved 3 duplicate search(es)." in logs
+
+
+def test_enrich_segments_streams_each_segment(stub_llm, fake_search, monkeypatch):
+    from auto_clip_lib.pipeline import enrich_segments
+
+    monkeypatch.setattr("auto_clip_lib.search_cache.SEARCH_CACHE_MODE", "off")
+    segments = [{"text": f"word{idx} text", "start": idx, "end": idx + 1} for idx in range(3)]
+    streamed = []
+
+    enrich_segments(
+        segments,
+        log_func=None,
+        search_providers=((fake_search, "StubTube"),),
+        start_offset=5,
+        on_segment=lambda idx, seg: streamed.append((idx, bool(seg["video_results"]))),
+    )
+
+    assert streamed == [(5, True), (6, True), (7, True)]
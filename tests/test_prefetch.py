@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from auto_clip_lib.config import PREFETCH_CACHE
+from auto_clip_lib.prefetch import Prefetcher
+from auto_clip_lib.segment_store import SegmentStore
+from auto_clip_lib.workflow import run_paginated_workflow
+
+
+def _counting_search(calls: list[str], gate: threading.Event | None = None):
+    def _search(query: str, limit: int) -> list[dict]:
+        if gate is not None:
+            gate.wait(5)
+        calls.append(query)
+        return [{"id": query, "title": query, "url": "https://example.com", "source": "Stub"}]
+
+    return _search
+
+
+def _chunked(count: int) -> list[dict]:
+    return [{"text": f"word{idx} text", "start": idx, "end": idx + 1} for idx in range(count)]
+
+
+@pytest.fixture()
+def make_prefetcher(monkeypatch):
+    """Build Prefetchers that are closed (threads joined) before monkeypatches unwind."""
+
+    prefetchers: list[Prefetcher] = []
+
+    def _make(**kwargs) -> Prefetcher:
+        prefetcher = Prefetcher(**kwargs)
+        prefetchers.append(prefetcher)
+        return prefetcher
+
+    yield _make
+    for prefetcher in prefetchers:
+        prefetcher.close(5)
+    for thread in threading.enumerate():
+        if thread.name.startswith("prefetch-"):
+            thread.join(5)
+            assert not thread.is_alive(), f"{thread.name} outlived its test"
+
+
+def test_continue_is_served_from_prefetched_page(
+    make_prefetcher, fixtures_dir, stub_llm, monkeypatch, tmp_path
+):
+    monkeypatch.setattr("auto_clip_lib.workflow.OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr("auto_clip_lib.search_cache.SEARCH_CACHE_MODE", "off")
+    calls: list[str] = []
+    providers = ((_counting_search(calls), "StubTube"),)
+    prefetcher = make_prefetcher(max_sessions=1)
+
+    _, output_dir, _, next_index, _ = run_paginated_workflow(
+        str(fixtures_dir / "sample.docx"),
+        log_func=None,
+        search_providers=providers,
+        page_size=1,
+        output_prefix="test",
+        prefetcher=prefetcher,
+    )
+    prefetcher._inflight[output_dir].done.wait(5)
+    searches_after_prefetch = len(calls)
+    assert (output_dir / PREFETCH_CACHE).exists()
+
+    messages: list[str] = []
+    page2, _, _, next_index2, _ = run_paginated_workflow(
+        None,
+        log_func=messages.append,
+        search_providers=providers,
+        start_index=next_index,
+        page_size=1,
+        existing_output_dir=str(output_dir),
+        prefetcher=prefetcher,
+    )
+
+    assert len(calls) == searches_after_prefetch
+    assert "→ Served segments 1–1 from prefetch." in messages
+    assert len(page2) == 1 and next_index2 == 2
+    assert SegmentStore(output_dir).count() == 2
+
+
+def test_prefetch_slots_are_capped(make_prefetcher, stub_llm, monkeypatch, tmp_path):
+    monkeypatch.setattr("auto_clip_lib.search_cache.SEARCH_CACHE_MODE", "off")
+    gate = threading.Event()
+    providers = ((_counting_search([], gate), "StubTube"),)
+    prefetcher = make_prefetcher(max_sessions=1)
+
+    first = prefetcher.schedule(tmp_path / "a", _chunked(1), 1, providers)
+    second = prefetcher.schedule(tmp_path / "b", _chunked(1), 1, providers)
+    gate.set()
+    prefetcher._inflight[tmp_path / "a"].done.wait(5)
+
+    assert (first, second) == (True, False)
+
+
+def test_idle_sessions_are_abandoned(make_prefetcher, stub_llm, monkeypatch, tmp_path):
+    monkeypatch.setattr("auto_clip_lib.search_cache.SEARCH_CACHE_MODE", "off")
+    gate = threading.Event()
+    now = [0.0]
+    providers = ((_counting_search([], gate), "StubTube"),)
+    prefetcher = make_prefetcher(max_sessions=1, idle_timeout=60, clock=lambda: now[0])
+    session = tmp_path / "idle"
+    session.mkdir()
+
+    assert prefetcher.schedule(session, _chunked(2), 1, providers)
+    prefetch = prefetcher._inflight[session]
+    now[0] = 120.0
+    assert prefetcher.take(tmp_path / "other", 1, 2) is None
+    gate.set()
+    prefetch.done.wait(5)
+
+    assert prefetch.cancelled.is_set()
+    assert not (session / PREFETCH_CACHE).exists()
+    (tmp_path / "next").mkdir()
+    assert prefetcher.schedule(tmp_path / "next", _chunked(1), 1, providers)
+    prefetcher._inflight[tmp_path / "next"].done.wait(5)
+
+
+def test_sweeper_abandons_idle_sessions_without_requests(
+    make_prefetcher, stub_llm, monkeypatch, tmp_path
+):
+    monkeypatch.setattr("auto_clip_lib.search_cache.SEARCH_CACHE_MODE", "off")
+    gate = threading.Event()
+    now = [0.0]
+    providers = ((_counting_search([], gate), "StubTube"),)
+    prefetcher = make_prefetcher(
+        max_sessions=1, idle_timeout=60, clock=lambda: now[0], sweep_interval=0.01
+    )
+    session = tmp_path / "idle"
+    session.mkdir()
+
+    assert prefetcher.schedule(session, _chunked(2), 1, providers)
+    prefetch = prefetcher._inflight[session]
+    now[0] = 120.0
+
+    assert prefetch.cancelled.wait(5)
+    gate.set()
+    assert prefetch.done.wait(5)
+    assert not (session / PREFETCH_CACHE).exists()
+
+
+def test_cancel_is_checked_between_keywords_and_search(
+    make_prefetcher, monkeypatch, tmp_path
+):
+    monkeypatch.setattr("auto_clip_lib.search_cache.SEARCH_CACHE_MODE", "off")
+    in_keywords = threading.Event()
+    release = threading.Event()
+
+    def _slow_keywords(segments):
+        in_keywords.set()
+        release.wait(5)
+        return segments
+
+    monkeypatch.setattr("auto_clip_lib.prefetch.extract_keywords", _slow_keywords)
+    calls: list[str] = []
+    prefetcher = make_prefetcher(max_sessions=1)
+    session = tmp_path / "s"
+    session.mkdir()
+
+    assert prefetcher.schedule(session, _chunked(3), 1, ((_counting_search(calls), "StubTube"),))
+    prefetch = prefetcher._inflight[session]
+    assert in_keywords.wait(5)
+    prefetcher.abandon(session)
+    release.set()
+
+    assert prefetch.done.wait(5)
+    assert calls == []
+    assert not (session / PREFETCH_CACHE).exists()
+
+
+def test_take_gives_up_on_a_slow_prefetch(
+    make_prefetcher, stub_llm, monkeypatch, tmp_path
+):
+    monkeypatch.setattr("auto_clip_lib.search_cache.SEARCH_CACHE_MODE", "off")
+    gate = threading.Event()
+    prefetcher = make_prefetcher(max_sessions=1, take_timeout=0.05)
+    session = tmp_path / "slow"
+    session.mkdir()
+
+    providers = ((_counting_search([], gate), "StubTube"),)
+    assert prefetcher.schedule(session, _chunked(2), 1, providers)
+    prefetch = prefetcher._inflight[session]
+
+    assert prefetcher.take(session, 1, 3) is None
+    assert prefetch.cancelled.is_set()
+    gate.set()
+    assert prefetch.done.wait(5)
+    assert prefetch.done.is_set()
+    assert not (session / PREFETCH_CACHE).exists()
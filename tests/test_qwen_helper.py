@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import qwen_helper
+
+
+class FakeResponse:
+    status_code = 200
+    message = ""
+
+    def __init__(self, text: str):
+        self.output = {"text": text}
+
+
+def test_parse_keyword_batch_handles_fences_and_strings():
+    reply = (
+        "```json\n"
+        '{"0": ["Hamas protest", " "], "1": "NATO briefing, NATO drill", '
+        '"7": ["out of range"], "x": ["bad id"]}\n'
+        "```"
+    )
+    entries = qwen_helper.parse_keyword_batch(reply, 3)
+
+    assert entries == {
+        0: ["Hamas protest"],
+        1: ["NATO briefing", "NATO drill"],
+    }
+
+
+def test_fetch_qwen_keywords_batch_requeries_malformed(monkeypatch):
+    calls = []
+
+    def fake_call(system_prompt, user_content, api_key, model_name):
+        calls.append(user_content)
+        if user_content.startswith("### 0"):
+            return FakeResponse('{"0": ["alpha rally"], "1": [], "2": ["gamma drill"]}')
+        return FakeResponse('["beta press conference"]')
+
+    monkeypatch.setattr(qwen_helper, "_call_generation", fake_call)
+
+    result = qwen_helper.fetch_qwen_keywords_batch(
+        ["alpha text", "beta text", "gamma text"]
+    )
+
+    assert result == [
+        ["alpha rally"],
+        ["beta press conference"],
+        ["gamma drill"],
+    ]
+    assert len(calls) == 2
+    assert calls[1] == "beta text"
+
+
+def test_fetch_qwen_keywords_batch_keeps_parsed_entries_when_requery_fails(monkeypatch):
+    def fake_call(system_prompt, user_content, api_key, model_name):
+        if user_content.startswith("### 0"):
+            return FakeResponse('{"0": ["alpha rally"], "2": ["gamma drill"]}')
+        raise qwen_helper.LLMQueryStatusError("Request failed: 500, busy")
+
+    monkeypatch.setattr(qwen_helper, "_call_generation", fake_call)
+
+    result = qwen_helper.fetch_qwen_keywords_batch(
+        ["alpha text", "beta text", "gamma text"]
+    )
+
+    assert result == [["alpha rally"], None, ["gamma drill"]]
+
+
+def test_fetch_qwen_keywords_batch_can_leave_requeries_to_the_caller(monkeypatch):
+    calls = []
+
+    def fake_call(system_prompt, user_content, api_key, model_name):
+        calls.append(user_content)
+        return FakeResponse('{"0": ["alpha rally"]}')
+
+    monkeypatch.setattr(qwen_helper, "_call_generation", fake_call)
+
+    result = qwen_helper.fetch_qwen_keywords_batch(["alpha text", "beta text"], requery=False)
+
+    assert result == [["alpha rally"], None]
+    assert len(calls) == 1
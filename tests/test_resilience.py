@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import pytest
+
+from auto_clip_lib.resilience import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, get_breaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_breaker_opens_and_probes():
+    clock = FakeClock()
+    breaker = CircuitBreaker("llm", failure_threshold=2, cooldown=30, clock=clock)
+
+    for _ in range(2):
+        assert breaker.allow_request()
+        breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+
+    clock.now = 31
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    clock.now = 62
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    snapshot = breaker.snapshot()
+    assert snapshot["opened"] == 2
+    assert snapshot["short_circuited"] == 2
+
+
+def test_success_resets_consecutive_failures():
+    breaker = CircuitBreaker("llm", failure_threshold=2, cooldown=30)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_get_breaker_rejects_mismatched_settings():
+    breaker = get_breaker("dashscope-test", failure_threshold=3, cooldown=60)
+
+    assert get_breaker("dashscope-test", failure_threshold=3, cooldown=60) is breaker
+    with pytest.raises(ValueError, match="dashscope-test"):
+        get_breaker("dashscope-test", failure_threshold=5, cooldown=60)
+    with pytest.raises(ValueError):
+        get_breaker("dashscope-test", failure_threshold=3, cooldown=10)
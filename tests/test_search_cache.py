@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from auto_clip_lib import search_cache
+from auto_clip_lib.cache import DiskCache, make_key
+from auto_clip_lib.search_cache import CachedSearch, cache_search_providers
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting_search(calls: list[str], refreshed: threading.Event | None = None):
+    def _search(query: str, limit: int) -> list[dict]:
+        calls.append(query)
+        if refreshed is not None and len(calls) > 1:
+            refreshed.set()
+        return [{"id": f"hit{len(calls)}"}] if query != "nothing" else []
+
+    return _search
+
+
+def test_cached_search_normalizes_and_expires(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path / "search.sqlite3", max_bytes=1_000_000)
+    clock = FakeClock()
+    monkeypatch.setattr("auto_clip_lib.cache.time.time", clock)
+    calls: list[str] = []
+    refreshed = threading.Event()
+    search = CachedSearch(
+        _counting_search(calls, refreshed), "StubTube", cache, ttl=60, stale_ttl=60, clock=clock
+    )
+
+    assert search("NATO  Summit", 3) == [{"id": "hit1"}]
+    assert search("nato summit", 3) == [{"id": "hit1"}]
+    assert search("nothing", 3) == []
+    assert search("nothing", 3) == []
+    assert calls == ["NATO  Summit", "nothing", "nothing"]
+
+    clock.now += 90
+    assert search("nato summit", 3) == [{"id": "hit1"}]
+    assert refreshed.wait(1)
+    while search_cache._refreshing:
+        time.sleep(0.01)
+
+    clock.now += 500
+    assert search("nato summit", 3)[0]["id"].startswith("hit")
+    assert len(calls) == 5
+
+
+def test_offline_mode_never_calls_provider(tmp_path):
+    calls: list[str] = []
+    online = cache_search_providers(((_counting_search(calls), "StubTube"),))
+    online[0][0]("press conference", 5)
+
+    offline = cache_search_providers(online, mode="offline")
+    search, label = offline[0]
+
+    assert label == "StubTube"
+    assert search("Press Conference", 5) == [{"id": "hit1"}]
+    assert search("unseen query", 5) == []
+    assert calls == ["press conference"]
+
+
+def test_offline_providers_stay_offline_through_the_pipeline(monkeypatch, stub_llm):
+    from auto_clip_lib.pipeline import enrich_segments
+
+    monkeypatch.setattr("auto_clip_lib.search_cache.SEARCH_CACHE_MODE", "on")
+    calls: list[str] = []
+    offline = cache_search_providers(((_counting_search(calls), "StubTube"),), mode="offline")
+
+    segments = enrich_segments(
+        [{"text": "Senate budget vote tonight.", "start": 0, "end": 1}],
+        log_func=None,
+        search_providers=offline,
+    )
+
+    assert calls == []
+    assert segments[0]["queries_tried"]
+    assert not segments[0]["video_results"]
+
+
+def test_stale_refreshes_are_shared_and_capped_per_provider(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path / "search.sqlite3", max_bytes=1_000_000)
+    clock = FakeClock()
+    monkeypatch.setattr("auto_clip_lib.cache.time.time", clock)
+    monkeypatch.setattr(search_cache, "PROVIDER_CONCURRENCY", {"Capped": 1})
+    monkeypatch.setattr(search_cache, "_refresh_slots", {})
+    lock = threading.Lock()
+    active = [0, 0]  # current, peak
+    refreshed: list[str] = []
+    release = threading.Event()
+
+    def _slow_search(query: str, limit: int) -> list[dict]:
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        release.wait(5)
+        with lock:
+            active[0] -= 1
+            refreshed.append(query)
+        return [{"id": query}]
+
+    queries = [f"q{idx}" for idx in range(6)]
+    for query in queries:
+        cache.set(make_key("search", "Capped", query, 3), [{"id": "old"}])
+    clock.now += 90
+    # Two runs wrap the same provider independently, as resolve_providers does.
+    runs = [
+        CachedSearch(_slow_search, "Capped", cache, ttl=60, stale_ttl=600, clock=clock)
+        for _ in range(2)
+    ]
+    for search in runs:
+        for query in queries:
+            assert search(query, 3) == [{"id": "old"}]
+    release.set()
+    deadline = time.monotonic() + 5
+    while search_cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert sorted(refreshed) == queries
+    assert active[1] == 1
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import sys
+import types
+
+from auto_clip_lib import searchers
+
+
+def test_search_youtube_api_reuses_pooled_instances(monkeypatch):
+    created = []
+
+    class FakeYoutubeDL:
+        def __init__(self, options):
+            self.options = options
+            created.append(self)
+
+        def extract_info(self, url, download=True):
+            assert not download
+            assert url == "ytsearch2:nato summit"
+            return {
+                "_type": "playlist",
+                "entries": [
+                    {"id": "abc", "title": "Summit", "channel": "News"},
+                    {"title": "missing id"},
+                    {"id": "def", "title": "Briefing", "uploader": "Press"},
+                ],
+            }
+
+    monkeypatch.setitem(sys.modules, "yt_dlp", types.SimpleNamespace(YoutubeDL=FakeYoutubeDL))
+    monkeypatch.setattr(searchers, "_ytdlp_pool", None)
+    monkeypatch.setattr(searchers, "YOUTUBE_SEARCH_BACKEND", "api")
+
+    first = searchers.search_youtube("nato summit", 2)
+    second = searchers.search_youtube("nato summit", 2)
+
+    assert first == second == [
+        {
+            "title": "Summit",
+            "id": "abc",
+            "url": "https://www.youtube.com/watch?v=abc",
+            "license": "YouTube Terms of Service",
+            "source": "youtube",
+            "channel": "News",
+        },
+        {
+            "title": "Briefing",
+            "id": "def",
+            "url": "https://www.youtube.com/watch?v=def",
+            "license": "YouTube Terms of Service",
+            "source": "youtube",
+            "channel": "Press",
+        },
+    ]
+    assert len(created) == 1
+    assert created[0].options["extract_flat"] == "in_playlist"
+
+
+def test_search_archive_org_reads_fields_from_search(monkeypatch):
+    captured = {}
+
+    def fake_search_items(query, fields=None, **_kwargs):
+        captured["fields"] = fields
+        return iter(
+            [
+                {"identifier": "clip1", "title": ["Rally footage"], "licenseurl": "cc0"},
+                {"identifier": "clip2"},
+                {"identifier": "clip3", "title": "Extra"},
+            ]
+        )
+
+    def fail_get_item(identifier):
+        raise AssertionError("get_item should not be called")
+
+    monkeypatch.setattr(searchers.internetarchive, "search_items", fake_search_items)
+    monkeypatch.setattr(searchers.internetarchive, "get_item", fail_get_item)
+
+    results = searchers.search_archive_org("rally", 2)
+
+    assert set(captured["fields"]) >= {"identifier", "title", "licenseurl"}
+    assert results == [
+        {
+            "title": "Rally footage",
+            "id": "clip1",
+            "url": "https://archive.org/details/clip1",
+            "license": "cc0",
+            "source": "archive.org",
+        },
+        {
+            "title": "No Title",
+            "id": "clip2",
+            "url": "https://archive.org/details/clip2",
+            "license": "N/A",
+            "source": "archive.org",
+        },
+    ]
+
+
+def test_search_nasa_resolves_assets_concurrently_in_order(monkeypatch):
+    import threading
+    import time
+
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class FakeResponse:
+        def __init__(self, payload):
+            self._payload = payload
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return self._payload
+
+    class FakeSession:
+        def get(self, url, params=None, timeout=None):
+            if url.endswith("/search"):
+                items = [
+                    {"data": [{"nasa_id": f"id{idx}", "title": f"Launch {idx}"}]}
+                    for idx in range(5)
+                ]
+                return FakeResponse({"collection": {"items": items}})
+            nasa_id = url.rsplit("/", 1)[-1]
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02 * (5 - int(nasa_id[-1])))
+            with lock:
+                state["active"] -= 1
+            href = "clip.mov" if nasa_id == "id1" else f"https://nasa/{nasa_id}.mp4"
+            return FakeResponse({"collection": {"items": [{"href": href}]}})
+
+    monkeypatch.setattr(searchers, "_nasa_session", lambda: FakeSession())
+
+    results = searchers.search_nasa("launch", 3)
+
+    assert [item["id"] for item in results] == ["id0", "id2", "id3"]
+    assert results[1]["download_url"] == "https://nasa/id2.mp4"
+    assert state["peak"] > 1
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+import threading
+
+from auto_clip_lib.config import SEGMENT_STORE
+from auto_clip_lib.segment_store import SegmentStore
+
+
+def _page(start: int, count: int) -> list[dict]:
+    return [{"text": f"segment {idx}"} for idx in range(start, start + count)]
+
+
+def test_append_read_page_and_export(tmp_path):
+    store = SegmentStore(tmp_path)
+    assert store.append(0, _page(0, 3)) == 3
+    assert store.append(3, _page(3, 2)) == 2
+
+    assert store.count() == 5
+    assert store.read_page(2, 4) == _page(2, 2)
+    assert store.read_page(4, 10) == _page(4, 1)
+
+    exported = store.export_json(tmp_path / "clips_metadata.json")
+    assert json.loads(exported.read_text(encoding="utf-8")) == _page(0, 5)
+
+
+def test_concurrent_duplicate_pages_are_stored_once(tmp_path):
+    barrier = threading.Barrier(4)
+
+    def _continue(start: int) -> None:
+        barrier.wait()
+        SegmentStore(tmp_path).append(start, _page(start, 2))
+
+    threads = [threading.Thread(target=_continue, args=(start,)) for start in (0, 0, 2, 2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert SegmentStore(tmp_path).read_all() == _page(0, 4)
+
+
+def test_torn_trailing_write_is_repaired(tmp_path):
+    store = SegmentStore(tmp_path)
+    store.append(0, _page(0, 2))
+    with (tmp_path / SEGMENT_STORE).open("ab") as fh:
+        fh.write(b'{"index": 2, "segm')
+
+    assert store.read_page(0, 3) == _page(0, 2)
+    assert store.append(2, _page(2, 1)) == 1
+    assert store.read_all() == _page(0, 3)
+    assert store.read_page(2, 3) == _page(2, 1)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import codecs
+import random
+from pathlib import Path
+
+import pysrt
+
+from auto_clip_lib import srt
+from auto_clip_lib.srt import Cue, iter_srt, parse_timestamp
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def _pysrt_cues(path: Path) -> list[Cue]:
+    source_file, _ = pysrt.SubRipFile._open_unicode_file(str(path))
+    with source_file:
+        return [
+            Cue(item.start.ordinal, item.end.ordinal, item.text)
+            for item in pysrt.stream(source_file)
+        ]
+
+
+def test_iter_srt_matches_pysrt_on_sample():
+    path = DATA_DIR / "sample.srt"
+
+    cues = list(iter_srt(path))
+
+    assert cues == _pysrt_cues(path)
+    assert cues[0] == Cue(1000, 4000, "First sentence for testing.")
+
+
+def test_iter_srt_handles_boms_and_encodings(tmp_path):
+    body = "1\r\n00:00:01,000 --> 00:00:02,500\r\nBonjour à tous\r\n\r\n"
+    encoded = {
+        "utf-8": body.encode("utf-8"),
+        "utf-8-sig": body.encode("utf-8-sig"),
+        "utf-16-le": codecs.BOM_UTF16_LE + body.encode("utf-16-le"),
+        "utf-16-be": codecs.BOM_UTF16_BE + body.encode("utf-16-be"),
+        "utf-32": body.encode("utf-32"),
+    }
+    for name, payload in encoded.items():
+        path = tmp_path / f"{name}.srt"
+        path.write_bytes(payload)
+
+        assert list(iter_srt(path)) == [Cue(1000, 2500, "Bonjour à tous")]
+        assert list(iter_srt(path)) == _pysrt_cues(path)
+
+
+def test_iter_srt_is_as_lenient_as_pysrt(tmp_path):
+    path = tmp_path / "messy.srt"
+    path.write_text(
+        "\n\n"
+        "00:00:01.000 --> 00:00:02:000 X1:10 X2:20\n"  # no index, odd separators, position
+        "no index\n"
+        "\n"
+        "2\n"
+        "not a timestamp\n"
+        "text\n"
+        "\n"
+        "3\n"
+        "00:00:03,000 --> 00:00:04\n"  # malformed end time: dropped
+        "bad end\n"
+        "\n"
+        "4\n"
+        "00:00:05,0x0 --> 00:00:06,999ms\n"  # junk after digits is tolerated
+        "two\n"
+        "  lines  \n"
+        "   \n"
+        "lonely line\n"
+        "\n"
+        "5\r"
+        "00:00:07,000 --> 00:00:08,000\r"
+        "old mac line endings",
+        encoding="utf-8",
+        newline="",
+    )
+
+    assert list(iter_srt(path)) == _pysrt_cues(path)
+    assert [cue.text for cue in iter_srt(path)] == [
+        "no index",
+        "two\n  lines",
+        "old mac line endings",
+    ]
+
+
+def test_iter_srt_matches_pysrt_across_read_boundaries(tmp_path, monkeypatch):
+    monkeypatch.setattr(srt, "_READ_SIZE", 7)
+    rng = random.Random(3)
+    pieces = []
+    for idx in range(200):
+        start = rng.randrange(0, 10**7)
+        eol = rng.choice(["\n", "\r\n", "\r"])
+        pieces.append(
+            f"{idx}{eol}"
+            f"{start // 3600000:02d}:{start // 60000 % 60:02d}:{start // 1000 % 60:02d},{start % 1000:03d}"
+            f" --> 99:00:00,000{eol}"
+            f"line {idx} é{eol}" + rng.choice(["", f"second {idx}{eol}"]) + eol
+        )
+    path = tmp_path / "random.srt"
+    path.write_text("".join(pieces), encoding="utf-8", newline="")
+
+    assert list(iter_srt(path)) == _pysrt_cues(path)
+
+
+def test_parse_timestamp():
+    assert parse_timestamp("01:02:03,004") == 3723004
+    assert parse_timestamp("") == 0
+    assert parse_timestamp("00:00:03") is None
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from auto_clip_lib.pipeline import build_segments_metadata
+from auto_clip_lib.streaming import stream_segments
+from auto_clip_lib.workflow import run_streaming_workflow
+
+
+@pytest.fixture(autouse=True)
+def no_search_cache(monkeypatch):
+    monkeypatch.setattr("auto_clip_lib.search_cache.SEARCH_CACHE_MODE", "off")
+
+
+def test_stream_matches_batch_pipeline(fixtures_dir, fake_search, stub_llm):
+    providers = ((fake_search, "StubTube"),)
+    for name in ("sample.srt", "sample.docx"):
+        expected = build_segments_metadata(
+            str(fixtures_dir / name), log_func=None, search_providers=providers
+        )
+
+        streamed = list(
+            stream_segments(
+                fixtures_dir / name, log_func=None, search_providers=providers, batch_size=1
+            )
+        )
+
+        assert streamed == expected
+
+
+def test_closing_the_stream_stops_every_stage(fixtures_dir, fake_search, stub_llm):
+    before = {thread.name for thread in threading.enumerate()}
+    stream = stream_segments(
+        fixtures_dir / "sample.docx",
+        log_func=None,
+        search_providers=((fake_search, "StubTube"),),
+        batch_size=1,
+        buffer_size=1,
+    )
+
+    next(stream)
+    stream.close()
+
+    leftover = {thread.name for thread in threading.enumerate()} - before
+    assert not any(name.startswith("stream-") for name in leftover)
+
+
+def test_stage_failures_reach_the_consumer(fixtures_dir, fake_search, monkeypatch):
+    def _boom(segments):
+        raise RuntimeError("keyword stage down")
+
+    monkeypatch.setattr("auto_clip_lib.streaming.extract_keywords", _boom)
+
+    with pytest.raises(RuntimeError, match="keyword stage down"):
+        list(
+            stream_segments(
+                fixtures_dir / "sample.srt",
+                log_func=None,
+                search_providers=((fake_search, "StubTube"),),
+            )
+        )
+
+
+def test_streaming_workflow_writes_legacy_json(
+    fixtures_dir, fake_search, stub_llm, monkeypatch, tmp_path
+):
+    monkeypatch.setattr("auto_clip_lib.workflow.OUTPUT_DIR", str(tmp_path))
+    seen = []
+
+    count, _, metadata_path = run_streaming_workflow(
+        str(fixtures_dir / "sample.docx"),
+        log_func=None,
+        search_providers=((fake_search, "StubTube"),),
+        on_segment=lambda idx, seg: seen.append(idx),
+    )
+
+    segments = json.loads(metadata_path.read_text(encoding="utf-8"))
+    assert count == len(segments) == len(seen) == 3
+    assert metadata_path.read_text(encoding="utf-8") == json.dumps(
+        segments, indent=2, ensure_ascii=False
+    )
+
+
+def test_failed_streaming_workflow_leaves_no_partial_json(
+    fixtures_dir, fake_search, stub_llm, monkeypatch, tmp_path
+):
+    monkeypatch.setattr("auto_clip_lib.workflow.OUTPUT_DIR", str(tmp_path))
+
+    def _fail_on_second(idx, seg):
+        if idx == 1:
+            raise RuntimeError("consumer went away")
+
+    with pytest.raises(RuntimeError, match="consumer went away"):
+        run_streaming_workflow(
+            str(fixtures_dir / "sample.docx"),
+            log_func=None,
+            search_providers=((fake_search, "StubTube"),),
+            on_segment=_fail_on_second,
+        )
+
+    assert not list(tmp_path.rglob("clips_metadata.json*"))
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+
+import pytest
+
+import web_app
+from auto_clip_lib.jobs import JobManager
+from auto_clip_lib.workflow import run_paginated_workflow
+
+
+@pytest.fixture()
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr("auto_clip_lib.workflow.OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr("auto_clip_lib.search_cache.SEARCH_CACHE_MODE", "off")
+    monkeypatch.setattr(web_app, "OUTPUT_BASE", tmp_path.resolve())
+    # Keep request logging out of the checkout's logs/web_app.log.
+    monkeypatch.setattr(web_app.LOG_FILE_HANDLER, "level", logging.CRITICAL + 1)
+    web_app.app.config["TESTING"] = True
+    return web_app.app.test_client()
+
+
+def test_metadata_route_serves_partial_sessions(client, fixtures_dir, fake_search, stub_llm):
+    _, output_dir, metadata_path, next_index, total = run_paginated_workflow(
+        str(fixtures_dir / "sample.docx"),
+        log_func=None,
+        search_providers=((fake_search, "StubTube"),),
+        page_size=2,
+        output_prefix="web",
+    )
+    assert next_index < total and not metadata_path.exists()
+
+    response = client.get("/metadata", query_string={"output_dir": str(output_dir)})
+    assert response.status_code == 200
+    assert len(response.get_json()) == 2
+
+    page = client.get(
+        "/metadata", query_string={"output_dir": str(output_dir), "start": 1, "end": 5}
+    ).get_json()
+    assert [seg["text"] for seg in page] == [response.get_json()[1]["text"]]
+
+    outside = client.get("/metadata", query_string={"output_dir": "/etc"})
+    assert outside.status_code == 404
+
+
+@pytest.fixture()
+def jobs(monkeypatch, tmp_path):
+    manager = JobManager(tmp_path / "jobs", max_workers=1)
+    monkeypatch.setattr(web_app, "JOBS", manager)
+    yield manager
+    manager.shutdown()
+
+
+def _fake_links_workflow(candidates, log_func=None, output_prefix=None):
+    if "bad" in candidates[0]:
+        raise ValueError("no such video")
+    for link in candidates:
+        log_func(f"→ Fetched {link}")
+    return {"videos": [{"url": link} for link in candidates]}, "out", "out/metadata.json"
+
+
+def _parse_sse(body: str) -> list[dict]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+        if "event" in fields:
+            data = json.loads(fields["data"])
+            events.append({"id": int(fields["id"]), "event": fields["event"], "data": data})
+    return events
+
+
+def test_job_routes_report_status_result_and_events(client, jobs, monkeypatch):
+    monkeypatch.setattr(web_app, "run_youtube_links_workflow", _fake_links_workflow)
+
+    assert client.post("/jobs", data={"kind": "nope"}).status_code == 400
+    assert client.post("/jobs", data={"kind": "links", "links": " "}).status_code == 400
+    submitted = client.post("/jobs", data={"kind": "links", "links": "https://a, https://b"})
+    assert submitted.status_code == 202
+    urls = submitted.get_json()
+    job_id = urls["job_id"]
+
+    stream = client.get(urls["events_url"])
+    assert stream.mimetype == "text/event-stream"
+    events = _parse_sse(stream.get_data(as_text=True))
+    assert [event["event"] for event in events] == ["running", "log", "log", "succeeded"]
+    assert [event["id"] for event in events] == [1, 2, 3, 4]
+    assert events[1]["data"] == {"message": "→ Fetched https://a"}
+
+    resumed = client.get(urls["events_url"], headers={"Last-Event-ID": "3"})
+    assert [event["event"] for event in _parse_sse(resumed.get_data(as_text=True))] == [
+        "succeeded"
+    ]
+
+    status = client.get(urls["status_url"], query_string={"since": 1}).get_json()
+    assert status["status"] == "succeeded" and "result" not in status
+    assert status["messages"] == ["→ Fetched https://a", "→ Fetched https://b"]
+    result = client.get(urls["result_url"]).get_json()
+    assert result["result"]["videos"] == [{"url": "https://a"}, {"url": "https://b"}]
+    assert urls["status_url"] == f"/jobs/{job_id}"
+
+    for route in ("/jobs/missing", "/jobs/missing/result", "/jobs/missing/events"):
+        assert client.get(route).status_code == 404
+
+
+def test_job_result_reports_failures_and_pending_jobs(client, jobs, monkeypatch):
+    monkeypatch.setattr(web_app, "run_youtube_links_workflow", _fake_links_workflow)
+    failed = client.post("/jobs", data={"kind": "links", "links": "https://bad"}).get_json()
+    _parse_sse(client.get(failed["events_url"]).get_data(as_text=True))
+
+    response = client.get(failed["result_url"])
+    assert response.status_code == 500
+    assert response.get_json() == {"status": "failed", "error": "no such video"}
+
+    release = threading.Event()
+    pending_id = jobs.submit("download_all", lambda ctx: release.wait(5))
+    pending = client.get(f"/jobs/{pending_id}/result")
+    release.set()
+    assert pending.status_code == 202
+    assert pending.get_json()["status"] in ("queued", "running")
@@ -3,7 +3,10 @@ from __future__ import annotations
 from auto_clip_lib.workflow import run_paginated_workflow
 
 
-def test_run_paginated_workflow_creates_batches(fixtures_dir, fake_search, stub_llm, tmp_path):
+def test_run_paginated_workflow_creates_batches(
+    fixtures_dir, fake_search, stub_llm, monkeypatch, tmp_path
+):
+    monkeypatch.setattr("auto_clip_lib.workflow.OUTPUT_DIR", str(tmp_path))
     doc_path = fixtures_dir / "sample.docx"
 
     segments_page1, output_dir, metadata_path, next_index, total = run_paginated_workflow(
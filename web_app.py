@@ -6,16 +6,27 @@ import json
 import tempfile
 import logging
 from pathlib import Path
-from typing import Any, Tuple
-
-from flask import Flask, render_template, request
+from typing import Any, Callable, Mapping
+
+from flask import (
+    Flask,
+    Response,
+    jsonify,
+    render_template,
+    request,
+    stream_with_context,
+    url_for,
+)
 
-from auto_clip_lib.config import OUTPUT_DIR
-from auto_clip_lib.media import download_video, trim_clip
-from auto_clip_lib.utils import sanitize_id
+from auto_clip_lib import downloads
+from auto_clip_lib.config import OUTPUT_DIR, RESULT_JSON
+from auto_clip_lib.jobs import JobContext, JobManager
+from auto_clip_lib.prefetch import Prefetcher
+from auto_clip_lib.segment_store import SegmentStore
 from auto_clip_lib.workflow import (
     run_metadata_workflow,
     run_paginated_workflow,
+    run_streaming_workflow,
     run_youtube_links_workflow,
 )
 
@@ -23,10 +34,19 @@ from auto_clip_lib.workflow import (
 app = Flask(__name__)
 OUTPUT_BASE = Path(OUTPUT_DIR).resolve()
 LOG_DIR = Path("logs")
-LOG_DIR.mkdir(exist_ok=True)
 LOG_FILE = LOG_DIR / "web_app.log"
 
-LOG_FILE_HANDLER = logging.FileHandler(LOG_FILE, encoding="utf-8")
+
+class _LogFileHandler(logging.FileHandler):
+    """File handler that creates ``LOG_DIR`` when the first record is written."""
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
+# delay=True: importing web_app (e.g. from tests) must not create files.
+LOG_FILE_HANDLER = _LogFileHandler(LOG_FILE, encoding="utf-8", delay=True)
 LOG_FILE_HANDLER.setLevel(logging.INFO)
 LOG_FILE_HANDLER.setFormatter(
     logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
@@ -35,6 +55,8 @@ LOG_FILE_HANDLER.setFormatter(
 logging.basicConfig(level=logging.INFO, handlers=[LOG_FILE_HANDLER])
 LOGGER = logging.getLogger(__name__)
 PAGE_SIZE = 8
+JOBS = JobManager()
+PREFETCHER = Prefetcher()
 
 
 def _log_exception(message: str, **context: Any) -> None:
@@ -51,6 +73,10 @@ def _ensure_output_path(path_str: str) -> Path:
 
 
 def _load_metadata(metadata_path: str) -> Any:
+    meta_path = Path(metadata_path).resolve()
+    if meta_path.name == RESULT_JSON and SegmentStore.exists(meta_path.parent):
+        # Paginated sessions keep their segments in the append-only store.
+        return SegmentStore(_ensure_output_path(str(meta_path.parent))).read_all()
     meta_path = _ensure_output_path(metadata_path)
     with meta_path.open() as fh:
         return json.load(fh)
@@ -76,36 +102,66 @@ def _split_metadata(metadata_obj: Any) -> tuple[list | None, list | None]:
     return None, None
 
 
-def _download_and_optionally_trim(
-    result: dict,
+def _pagination(start_index: int, next_index: int, total_segments: int) -> dict:
+    return {
+        "next_index": next_index,
+        "total_segments": total_segments,
+        "has_more": next_index < total_segments,
+        "current_start": start_index,
+        "current_end": min(next_index, total_segments),
+    }
+
+
+def _download_videos(
+    videos: list[dict],
     output_dir_path: Path,
-    start_time: float | None,
-    end_time: float | None,
-    *,
-    trimmed_dir: Path | None = None,
-) -> Tuple[Path, bool]:
-    """Download a video and optionally trim it based on start/end times."""
-
-    video_path_str = download_video(result, str(output_dir_path))
-    if not video_path_str:
-        raise RuntimeError("Video download failed.")
-
-    saved_path = Path(video_path_str)
-    trimmed = False
-    if start_time is not None and end_time is not None:
-        if end_time <= start_time:
-            raise ValueError("End time must be greater than start time.")
-        clip_dir = trimmed_dir or (output_dir_path / "trimmed")
-        clip_dir.mkdir(exist_ok=True)
-        clip_name = (
-            f"{sanitize_id(result.get('id') or result.get('title') or 'clip')}_"
-            f"{start_time:.2f}_{end_time:.2f}.mp4"
-        )
-        clip_path = clip_dir / clip_name
-        trim_clip(str(saved_path), start_time, end_time, str(clip_path))
-        saved_path = clip_path
-        trimmed = True
-    return saved_path, trimmed
+    form: Mapping[str, str],
+    on_done: Callable[[int, int], None] | None = None,
+) -> tuple[int, list[str]]:
+    """Download every video (trimmed per the ``start_time_<i>``/``end_time_<i>`` fields)."""
+
+    trimmed_dir = output_dir_path / "trimmed"
+    trimmed_dir.mkdir(exist_ok=True)
+
+    issues: list[str] = []
+    items = []
+    labels = []
+    for idx, video in enumerate(videos):
+        result = {
+            "id": video.get("id"),
+            "title": video.get("title"),
+            "url": video.get("url"),
+            "source": video.get("source"),
+            "channel": video.get("channel"),
+        }
+        label = video.get("title") or video.get("id") or "video"
+        try:
+            start_time = _parse_time_value(form.get(f"start_time_{idx}", ""))
+            end_time = _parse_time_value(form.get(f"end_time_{idx}", ""))
+        except Exception as exc:
+            issues.append(f"{label} ({exc})")
+            continue
+        items.append((result, start_time, end_time))
+        labels.append(label)
+
+    settled = 0
+
+    def _on_done(_idx: int, _outcome) -> None:
+        nonlocal settled
+        settled += 1
+        if on_done:
+            on_done(settled, len(items))
+
+    outcomes = downloads.download_many(
+        items, output_dir_path, trimmed_dir=trimmed_dir, on_done=_on_done
+    )
+    successes = 0
+    for label, outcome in zip(labels, outcomes):
+        if isinstance(outcome, Exception):
+            issues.append(f"{label} ({outcome})")
+        else:
+            successes += 1
+    return successes, issues
 
 
 @app.route("/", methods=["GET", "POST"])
@@ -135,17 +191,12 @@ def index():
                     search_providers=None,
                     start_index=start_index,
                     page_size=PAGE_SIZE,
+                    prefetcher=PREFETCHER,
                     existing_output_dir=existing_output_dir,
                 )
                 metadata_path = str(metadata_file)
                 output_dir = str(output_dir_path)
-                pagination = {
-                    "next_index": next_index,
-                    "total_segments": total_segments,
-                    "has_more": next_index < total_segments,
-                    "current_start": start_index,
-                    "current_end": min(next_index, total_segments),
-                }
+                pagination = _pagination(start_index, next_index, total_segments)
                 show_status = True
             except Exception as exc:
                 error = f"Failed to continue pagination: {exc}"
@@ -176,17 +227,12 @@ def index():
                         search_providers=None,
                         start_index=0,
                         page_size=PAGE_SIZE,
+                        prefetcher=PREFETCHER,
                         output_prefix=output_prefix,
                     )
                     metadata_path = str(metadata_file)
                     output_dir = str(output_dir_path)
-                    pagination = {
-                        "next_index": next_index,
-                        "total_segments": total_segments,
-                        "has_more": next_index < total_segments,
-                        "current_start": 0,
-                        "current_end": min(next_index, total_segments),
-                    }
+                    pagination = _pagination(0, next_index, total_segments)
                     show_status = True
                     LOGGER.info(
                         "Processed transcript upload '%s' → %s",
@@ -226,6 +272,32 @@ def index():
     )
 
 
+@app.route("/metadata", methods=["GET"])
+def session_metadata():
+    """Serve a session's segments as JSON, optionally just ``start``..``end``.
+
+    Paginated sessions only export ``RESULT_JSON`` after their last page, so
+    partial sessions are read from their ``SegmentStore`` instead.
+    """
+
+    try:
+        output_dir = _ensure_output_path(request.args.get("output_dir", ""))
+        start = request.args.get("start", type=int)
+        end = request.args.get("end", type=int)
+        if SegmentStore.exists(output_dir):
+            store = SegmentStore(output_dir)
+            if start is not None or end is not None:
+                end = store.count() if end is None else end
+                return jsonify(store.read_page(start or 0, end))
+            return jsonify(store.read_all())
+        metadata = _load_metadata(str(output_dir / RESULT_JSON))
+    except (OSError, ValueError) as exc:
+        return jsonify({"error": str(exc)}), 404
+    if isinstance(metadata, list) and (start is not None or end is not None):
+        metadata = metadata[start:end]
+    return jsonify(metadata)
+
+
 @app.route("/youtube-links", methods=["GET", "POST"])
 def youtube_links():
     videos = None
@@ -313,7 +385,7 @@ def download_clip():
         }
         start_time = _parse_time_value(start_raw)
         end_time = _parse_time_value(end_raw)
-        saved_path, trimmed = _download_and_optionally_trim(
+        saved_path, trimmed = downloads.download_clip(
             result,
             output_dir_path,
             start_time,
@@ -389,38 +461,7 @@ def download_all_links():
             raise ValueError("No videos available to download.")
 
         videos = metadata_obj.get("videos", [])
-        trimmed_dir = output_dir_path / "trimmed"
-        trimmed_dir.mkdir(exist_ok=True)
-
-        successes = 0
-        issues: list[str] = []
-        for idx, video in enumerate(videos):
-            result = {
-                "id": video.get("id"),
-                "title": video.get("title"),
-                "url": video.get("url"),
-                "source": video.get("source"),
-                "channel": video.get("channel"),
-            }
-            try:
-                start_time = _parse_time_value(
-                    request.form.get(f"start_time_{idx}", "")
-                )
-                end_time = _parse_time_value(
-                    request.form.get(f"end_time_{idx}", "")
-                )
-                _download_and_optionally_trim(
-                    result,
-                    output_dir_path,
-                    start_time,
-                    end_time,
-                    trimmed_dir=trimmed_dir,
-                )
-                successes += 1
-            except Exception as exc:
-                issues.append(
-                    f"{video.get('title') or video.get('id') or 'video'} ({exc})"
-                )
+        successes, issues = _download_videos(videos, output_dir_path, request.form)
 
         if issues:
             error = f"Issues detected: {', '.join(issues)}"
@@ -461,5 +502,219 @@ def download_all_links():
     )
 
 
+JOB_KINDS = ("transcript", "continue", "stream", "links", "download_clip", "download_all")
+
+
+def _transcript_job(
+    ctx: JobContext,
+    source_path: str | None,
+    start_index: int,
+    output_prefix: str | None = None,
+    existing_output_dir: str | None = None,
+) -> dict:
+    try:
+        (
+            segments,
+            output_dir_path,
+            metadata_file,
+            next_index,
+            total_segments,
+        ) = run_paginated_workflow(
+            source_path,
+            log_func=ctx.log,
+            search_providers=None,
+            start_index=start_index,
+            page_size=PAGE_SIZE,
+            prefetcher=PREFETCHER,
+            output_prefix=output_prefix,
+            existing_output_dir=existing_output_dir,
+            on_segment=ctx.segment,
+        )
+    finally:
+        if source_path:
+            Path(source_path).unlink(missing_ok=True)
+    return {
+        "metadata_path": str(metadata_file),
+        "output_dir": str(output_dir_path),
+        "pagination": _pagination(start_index, next_index, total_segments),
+        "segment_count": len(segments),
+        "keybert_fallback": any(
+            seg.get("_keyword_source") == "keybert" for seg in segments
+        ),
+    }
+
+
+def _stream_job(ctx: JobContext, source_path: str, output_prefix: str) -> dict:
+    try:
+        count, output_dir_path, metadata_file = run_streaming_workflow(
+            source_path,
+            log_func=ctx.log,
+            output_prefix=output_prefix,
+            on_segment=ctx.segment,
+        )
+    finally:
+        Path(source_path).unlink(missing_ok=True)
+    return {
+        "metadata_path": str(metadata_file),
+        "output_dir": str(output_dir_path),
+        "segment_count": count,
+    }
+
+
+def _links_job(ctx: JobContext, candidates: list[str]) -> dict:
+    metadata, out_dir, metadata_file = run_youtube_links_workflow(
+        candidates, log_func=ctx.log, output_prefix="links"
+    )
+    return {
+        "metadata_path": str(metadata_file),
+        "output_dir": str(out_dir),
+        "videos": metadata.get("videos", []),
+    }
+
+
+def _download_clip_job(ctx: JobContext, form: dict[str, str]) -> dict:
+    output_dir_path = _ensure_output_path(form.get("output_dir", ""))
+    result = {
+        "id": form.get("video_id", ""),
+        "title": form.get("video_title", ""),
+        "url": form.get("video_url", ""),
+        "source": form.get("video_source", ""),
+        "channel": form.get("video_channel", ""),
+    }
+    if not result["url"]:
+        raise ValueError("Missing video URL.")
+    saved_path, trimmed = downloads.download_clip(
+        result,
+        output_dir_path,
+        _parse_time_value(form.get("start_time", "")),
+        _parse_time_value(form.get("end_time", "")),
+    )
+    return {"saved_path": str(saved_path), "trimmed": trimmed}
+
+
+def _download_all_job(ctx: JobContext, form: dict[str, str]) -> dict:
+    metadata_obj = _load_metadata(form.get("metadata_path", ""))
+    output_dir_path = _ensure_output_path(form.get("output_dir", ""))
+    if not isinstance(metadata_obj, dict) or not metadata_obj.get("videos"):
+        raise ValueError("No videos available to download.")
+    successes, issues = _download_videos(
+        metadata_obj["videos"], output_dir_path, form, on_done=ctx.progress
+    )
+    return {"downloaded": successes, "issues": issues}
+
+
+def _job_urls(job_id: str) -> dict:
+    return {
+        "job_id": job_id,
+        "status_url": url_for("job_status", job_id=job_id),
+        "result_url": url_for("job_result", job_id=job_id),
+        "events_url": url_for("job_events", job_id=job_id),
+    }
+
+
+@app.route("/jobs", methods=["POST"])
+def submit_job():
+    """Queue a workflow in the background; poll or subscribe with the returned URLs."""
+
+    kind = request.form.get("kind", "").strip()
+    form = request.form.to_dict()
+    if kind not in JOB_KINDS:
+        return jsonify({"error": f"Unknown job kind: {kind!r}"}), 400
+
+    try:
+        if kind in ("transcript", "stream"):
+            upload = request.files.get("srt_file")
+            if not upload or not upload.filename:
+                raise ValueError("Please choose an SRT or DOCX file to upload.")
+            suffix = Path(upload.filename).suffix or ".srt"
+            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+                upload.save(tmp.name)
+            output_prefix = Path(upload.filename).stem or "upload"
+            if kind == "stream":
+                job_id = JOBS.submit(kind, _stream_job, tmp.name, output_prefix)
+            else:
+                job_id = JOBS.submit(
+                    kind, _transcript_job, tmp.name, 0, output_prefix=output_prefix
+                )
+        elif kind == "continue":
+            output_dir = str(_ensure_output_path(form.get("output_dir", "")))
+            job_id = JOBS.submit(
+                kind,
+                _transcript_job,
+                None,
+                int(form.get("next_index") or 0),
+                existing_output_dir=output_dir,
+            )
+        elif kind == "links":
+            raw_links = form.get("links", "")
+            candidates = [
+                line.strip()
+                for line in raw_links.replace(",", "\n").splitlines()
+                if line.strip()
+            ]
+            if not candidates:
+                raise ValueError("Please provide at least one link.")
+            job_id = JOBS.submit(kind, _links_job, candidates)
+        elif kind == "download_clip":
+            job_id = JOBS.submit(kind, _download_clip_job, form)
+        else:
+            job_id = JOBS.submit(kind, _download_all_job, form)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    LOGGER.info("Queued %s job %s", kind, job_id)
+    return jsonify(_job_urls(job_id)), 202
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def job_status(job_id: str):
+    """Job status and progress; ``?since=N`` returns only segments after the first N."""
+
+    state = JOBS.get(job_id)
+    if state is None:
+        return jsonify({"error": "Unknown job."}), 404
+    since = request.args.get("since", default=0, type=int)
+    segments = state.pop("segments")
+    state.pop("result")
+    state["segment_count"] = len(segments)
+    state["segments"] = segments[max(0, since):]
+    return jsonify(state)
+
+
+@app.route("/jobs/<job_id>/result", methods=["GET"])
+def job_result(job_id: str):
+    state = JOBS.get(job_id)
+    if state is None:
+        return jsonify({"error": "Unknown job."}), 404
+    if state["status"] == "failed":
+        return jsonify({"status": state["status"], "error": state["error"]}), 500
+    if state["status"] != "succeeded":
+        return jsonify({"status": state["status"], "progress": state["progress"]}), 202
+    return jsonify({"status": state["status"], "result": state["result"]})
+
+
+@app.route("/jobs/<job_id>/events", methods=["GET"])
+def job_events(job_id: str):
+    """Server-sent events: log, progress, segment, then succeeded/failed."""
+
+    if JOBS.get(job_id) is None:
+        return jsonify({"error": "Unknown job."}), 404
+    after = request.headers.get("Last-Event-ID", type=int) or 0
+
+    def _stream():
+        for event in JOBS.events(job_id, after=after):
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            payload = json.dumps(event["data"], ensure_ascii=False, default=str)
+            yield f"id: {event['seq']}\nevent: {event['type']}\ndata: {payload}\n\n"
+
+    return Response(
+        stream_with_context(_stream()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 if __name__ == "__main__":
     app.run(debug=False)